@@ -6,16 +6,27 @@ Web-based annotation tool that can be used on remote servers
 
 import argparse
 import base64
+import gzip
+import hashlib
+import itertools
 import json
 import os
+import random
 import threading
 import tempfile
-import shutil
+import sqlite3
+import string
 import time
+import uuid
+import zlib
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
+from operator import itemgetter
 from datetime import datetime
 
-from flask import Flask, render_template, request, jsonify, make_response
+from flask import Flask, render_template, request, jsonify, make_response, Response, stream_with_context
 from PIL import Image
 from pycocotools.coco import COCO
 try:
@@ -25,6 +36,21 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# 응답 JSON 직렬화 가속 (선택 사항, 없으면 Flask 기본 json 사용)
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 운영용 WSGI 서버 (선택 사항, 없으면 Flask 개발 서버 사용)
+try:
+    import waitress
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
 # Gemini support removed - using OpenAI only
 GEMINI_AVAILABLE = False
 
@@ -46,6 +72,224 @@ except ImportError as e:
 import re
 import sys
 
+# 번역/검증 경로에서 매 요청마다 사용하는 정규식 (모듈 로드 시 한 번만 컴파일)
+_RE_CHOICE = re.compile(r'<choice>(.*?)</choice>', re.IGNORECASE | re.DOTALL)
+_RE_RESPONSE = re.compile(r'\(([a-d])\)', re.IGNORECASE)
+_RE_CHOICE_ALL = re.compile(r'\(([a-d])\)\s*([^,)]+)', re.IGNORECASE)
+_RE_QUESTION_BRACKETS = re.compile(r'^\[+\s*|(\?)\s*\]+\s*|(\]+\s*(?=<choice>))', re.IGNORECASE)
+_RE_WHITESPACE = re.compile(r'\s+')
+
+# rationale 후처리: bounding box 좌표/언급 제거 (숫자 4개 좌표, "bounding box"/"bbox"/"coordinate" 언급, (x1...y1...) 표기를 한 번에)
+_RE_BBOX_ALL = re.compile(
+    r'\[?\s*\d+\.?\d*(?:\s*,\s*\d+\.?\d*){3}\s*\]?'
+    r'|bounding box[^.]*\.?'
+    r'|bbox[^.]*\.?'
+    r'|coordinate[^.]*\.?'
+    r'|\(x\d+.*?y\d+.*?\)',
+    re.IGNORECASE
+)
+
+# rationale 후처리: "Therefore" 문장 뒤의 추가 설명 제거 (한 번의 스캔으로 처리)
+# 그룹 1: "Therefore ..." 문장 본문 / 이어서 제거할 부분:
+#   - 같은 문장 안의 ", as/because/since ..." 절
+#   - 뒤따르는 "As/Because/Since it is ..." 문장과 ", as/because/since ..." 조각 (여러 개 가능)
+_RE_THEREFORE_TAIL = re.compile(
+    r'(Therefore[^.]*?)(?:,\s*(?:as|because|since)\s+[^.]*?)?\.'
+    r'(?:\s*(?:,\s*(?:as|because|since)\s+|(?:as|because|since)\s+it\s+is\b)[^.]*?\.)*',
+    re.IGNORECASE
+)
+
+# rationale 문장 수 확인용 문장 끝 (뒤에 공백이나 문자열 끝이 오는 . ! ?)
+_RE_SENTENCE_END = re.compile(r'[.!?](?=\s|$)')
+
+def _postprocess_rationale(text, question_type=None):
+    """번역된 rationale 후처리 (기본 번역과 2문장 확장 재요청 결과에 공통 적용).
+    
+    question_type이 주어지면 "The question is {question_type}:" 시작 문구를 보정한 뒤
+    bounding box 좌표/언급 제거, "Therefore" 문장 뒤 추가 설명 제거, 공백 정리를 수행.
+    """
+    if question_type and not text.startswith(f"The question is {question_type}:"):
+        # 자동으로 시작 문구 추가
+        text = f"The question is {question_type}: {text}"
+    
+    # bounding box 좌표 제거 (x1, y1, x2, y2 또는 [x, y, w, h] 형식)
+    text = _RE_BBOX_ALL.sub('', text)
+    
+    # "Therefore" 문장 뒤의 ", as it is...", "Because it is..." 같은 추가 설명 제거
+    text = _RE_THEREFORE_TAIL.sub(r'\1.', text)
+    
+    return _RE_WHITESPACE.sub(' ', text).strip()
+
+# 저장 시 rationale 정리: (a)~(d) 선지 표기, (ATT)/(POS)/(REL) 표기 제거
+_RE_CHOICE_LETTER = re.compile(r'\([abcd]\)', re.IGNORECASE)
+_RE_TAG_LABEL = re.compile(r'\((?:ATT|POS|REL)\)', re.IGNORECASE)
+
+# 선지 단어 검증용 rationale 토큰 (소문자 3글자 이상 영단어)
+_RE_WORD_TOKEN = re.compile(r'[a-z]{3,}')
+
+if ORJSON_AVAILABLE:
+    def _encode_json_value(value):
+        """어노테이션 필드 값 하나를 indent=2 JSON으로 인코딩 (orjson 사용)"""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def _load_json_file(path):
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+else:
+    def _encode_json_value(value):
+        """어노테이션 필드 값 하나를 indent=2 JSON으로 인코딩 (indent가 필요 없는 스칼라 값은 C 인코더 사용)"""
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, indent=2, ensure_ascii=False)
+        return json.dumps(value, ensure_ascii=False)
+    
+    def _load_json_file(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+def _dumps_annotations(annotations):
+    """어노테이션 리스트를 indent=2 JSON 문자열로 직렬화 (bbox 값은 처음부터 한 줄로 출력).
+    
+    json.dumps(indent=2) 후 정규식으로 bbox 줄바꿈을 되돌리던 방식과 같은 결과를 한 번에 생성.
+    """
+    if not annotations:
+        return '[]'
+    items = []
+    for ann in annotations:
+        if not isinstance(ann, dict) or not ann:
+            items.append('  ' + _encode_json_value(ann).replace('\n', '\n  '))
+            continue
+        fields = []
+        for key, value in ann.items():
+            if key == 'bbox' and isinstance(value, list):
+                # "bbox": [x, y, w, h] / [[x, y, w, h], ...] 한 줄
+                encoded = json.dumps(value, ensure_ascii=False)
+            else:
+                encoded = _encode_json_value(value).replace('\n', '\n    ')
+            fields.append(f'    {_encode_json_value(str(key))}: {encoded}')
+        items.append('  {\n' + ',\n'.join(fields) + '\n  }')
+    return '[\n' + ',\n'.join(items) + '\n]'
+
+# 저장 시 fsync 여부 (ANNOTATOR_FSYNC=1이면 디스크 기록까지 대기, 기본은 생략)
+ANNOTATOR_FSYNC = os.environ.get('ANNOTATOR_FSYNC') == '1'
+
+def _atomic_write_text(path, text):
+    """임시 파일에 쓰고 os.replace로 교체하는 원자적 쓰기.
+    
+    임시 파일을 대상과 같은 디렉토리에 만들므로 os.replace 한 번으로 교체된다.
+    """
+    output_dir = os.path.dirname(path)
+    # 저장할 때마다 makedirs를 부르지 않고, 디렉토리가 없어 실패했을 때만 만들고 다시 시도
+    try:
+        temp_fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.json.tmp', text=True)
+    except FileNotFoundError:
+        if not output_dir:
+            raise
+        os.makedirs(output_dir, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.json.tmp', text=True)
+    try:
+        with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
+            f.write(text)
+            if ANNOTATOR_FSYNC:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        # 실패 시 임시 파일 정리
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+def _has_nonempty_tag(text_lower, tag):
+    """소문자화된 텍스트에 내용이 있는 <tag>...</tag>가 있는지 str.find로 확인.
+
+    기존 정규식 <TAG>[^<]+</TAG> (IGNORECASE)와 같은 의미: 여는 태그 바로 뒤의
+    첫 '<'가 닫는 태그의 시작이고 그 사이가 비어 있지 않아야 함.
+    """
+    open_tag = f'<{tag}>'
+    close_tag = f'</{tag}>'
+    i = text_lower.find(open_tag)
+    while i >= 0:
+        start = i + len(open_tag)
+        j = text_lower.find('<', start)
+        if j < 0:
+            return False
+        if j > start and text_lower.startswith(close_tag, j):
+            return True
+        i = text_lower.find(open_tag, start)
+    return False
+
+def _replace_question_bracket(match):
+    """_RE_QUESTION_BRACKETS 치환 콜백: "?]" -> "? ", "]<choice>" -> " <choice>", 앞의 "[" -> 삭제"""
+    if match.group(1):
+        return '? '
+    if match.group(2):
+        return ' '
+    return ''
+
+def _parse_choices(choice_content):
+    """<choice> 태그 내용에서 {'a': 선택지, ...} 추출 (정규식 한 번으로 a-d 전체 파싱, 같은 문자가 반복되면 첫 번째 사용)"""
+    choices = {}
+    for letter, text in _RE_CHOICE_ALL.findall(choice_content):
+        choices.setdefault(letter.lower(), text.strip())
+    return choices
+
+@lru_cache(maxsize=2048)
+def _extract_choices_from_question(question):
+    """question의 <choice> 태그에서 ((letter, text), ...) 추출 (태그가 없으면 None, 같은 질문의 반복 파싱을 피하기 위해 캐싱)"""
+    choice_match = _RE_CHOICE.search(question)
+    if not choice_match:
+        return None
+    return tuple(_parse_choices(choice_match.group(1)).items())
+
+def _choice_pairs_from_texts(choice_texts):
+    """클라이언트가 보낸 choice_texts({'a': ..., 'd': ...})를 ((letter, text), ...)로 변환 (형식이 맞지 않으면 None)"""
+    if not isinstance(choice_texts, dict):
+        return None
+    pairs = tuple((letter, choice_texts.get(letter)) for letter in 'abcd')
+    if not all(isinstance(text, str) and text.strip() for _, text in pairs):
+        return None
+    return tuple((letter, text.strip()) for letter, text in pairs)
+
+@lru_cache(maxsize=2048)
+def _build_choice_mapping(choice_pairs):
+    """rationale 번역 프롬프트에 붙일 CHOICE MAPPING 블록 생성 (선택지가 없으면 빈 문자열)"""
+    if not choice_pairs:
+        return ""
+    if len(choice_pairs) == 4:
+        # 일반적인 4지선다는 리스트 생성 + join 없이 f-string 하나로 조립
+        (ka, a), (kb, b), (kc, c), (kd, d) = choice_pairs
+        choice_list_str = f'({ka}) {a}, ({kb}) {b}, ({kc}) {c}, ({kd}) {d}'
+    else:
+        choice_list_str = ', '.join(f'({k}) {v}' for k, v in choice_pairs)
+    return f"""
+
+CHOICE MAPPING (for translating choice letters in Korean rationale):
+When the Korean rationale mentions choice letters (a, b, c, d) or Korean choice text, translate them to the corresponding English choice:
+{choice_list_str}
+
+For example, if the Korean rationale says "(d) 포크" or just "d" or "포크", translate it to "fork" (which is choice (d) fork).
+"""
+
+# 번역 입력 길이 제한 (비정상적으로 큰 입력으로 거대한 프롬프트/API 비용이 발생하지 않도록 호출 전에 거부)
+MAX_KO_INPUT_LENGTH = 2000
+MAX_CHOICE_LENGTH = 200
+INPUT_TOO_LARGE_ERROR = f'Input too large (max {MAX_KO_INPUT_LENGTH} characters per text, {MAX_CHOICE_LENGTH} per choice)'
+
+def _inputs_too_large(texts=(), choices=()):
+    """텍스트/선택지 중 하나라도 길이 제한을 넘으면 True"""
+    return any(len(text) > MAX_KO_INPUT_LENGTH for text in texts) or any(len(choice) > MAX_CHOICE_LENGTH for choice in choices)
+
+# 번역된 질문이 반드시 <choice> 태그 뒤에 포함해야 하는 종료 문구
+REQUIRED_PHRASE = 'And provide the bounding box coordinate of the region related to your answer.'
+
+# ATT 태그 누락 검증용 한국어 속성 단어
+_ATTRIBUTE_KEYWORDS_KO = ('객체', '물체', '색', '모양', '재질', '사람', '원형', '정사각형', '직사각형',
+                          '흰색', '빨간색', '파란색', '초록색', '검은색', '노란색')
+# 모든 속성 단어를 한 번의 스캔으로 찾는 정규식 (단어마다 `in`으로 문자열을 다시 훑지 않음)
+_RE_ATTRIBUTE_KO = re.compile('|'.join(map(re.escape, _ATTRIBUTE_KEYWORDS_KO)))
+
 # 디버깅: Python 경로 출력
 if __name__ == "__main__" or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
     print(f"[DEBUG] Python executable: {sys.executable}")
@@ -55,6 +299,62 @@ app = Flask(__name__)
 app.config['TEMPLATES_AUTO_RELOAD'] = True
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 
+if ORJSON_AVAILABLE:
+    class OrjsonProvider(DefaultJSONProvider):
+        """jsonify()/request.json을 orjson으로 처리 (지원하지 않는 타입은 Flask 기본 변환 사용)"""
+        
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+        
+        def response(self, *args, **kwargs):
+            # jsonify() 응답: str 디코딩/재인코딩 없이 orjson bytes를 그대로 본문으로 사용
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+            return self._app.response_class(body, mimetype=self.mimetype)
+    
+    app.json = OrjsonProvider(app)
+
+# 응답 gzip 압축 (index.html 약 180KB, /api/image의 JSON 등): 브라우저가 gzip을 받는 경우에만
+GZIP_MIN_SIZE = 1024  # 바이트, 이보다 작은 응답은 압축 이득이 적음
+GZIP_MIMETYPES = ('text/html', 'text/css', 'text/javascript', 'application/javascript', 'application/json')
+GZIP_LEVEL = 6
+
+def accepts_gzip():
+    """요청의 Accept-Encoding에 gzip이 있는지"""
+    return 'gzip' in request.headers.get('Accept-Encoding', '').lower()
+
+def gzip_stream(chunks):
+    """문자열 청크 스트림을 gzip 바이트 스트림으로 압축 (스트리밍 응답은 gzip_response가 건너뛰므로 직접 압축)"""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)  # wbits=31: gzip 헤더/트레일러 포함
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
+@app.after_request
+def gzip_response(response):
+    """Accept-Encoding에 gzip이 있으면 텍스트/JSON 응답 본문을 gzip으로 압축"""
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in GZIP_MIMETYPES
+            or not accepts_gzip()):
+        return response
+    
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
 # 파일 저장을 위한 잠금 객체 (중복 데이터 방지)
 file_locks = {
     'exo': threading.Lock(),
@@ -85,24 +385,58 @@ except ImportError:
     if not OPENAI_API_KEY:
         print("[WARN] OpenAI API key not found. Please create config.py or set OPENAI_API_KEY environment variable.")
 
+# OpenAI 사용 가능 여부 (프로세스 재시작 전까지 바뀌지 않으므로 한 번만 계산)
+OPENAI_READY = OPENAI_AVAILABLE and bool(OPENAI_API_KEY) and OPENAI_API_KEY != "your-api-key-here"
+if not OPENAI_AVAILABLE:
+    OPENAI_NOT_READY_ERROR = 'OpenAI library not installed. Install with: pip install openai'
+else:
+    OPENAI_NOT_READY_ERROR = 'OPENAI_API_KEY is not set. Please set it in config.py'
+
 # 작업자 ID 출력
 if WORKER_ID:
     print(f"[INFO] 작업자 ID: {WORKER_ID}")
 else:
     print("[WARN] 작업자 ID가 설정되지 않았습니다. config.py에 WORKER_ID를 설정하세요.")
 
+# OpenAI 클라이언트 (요청마다 새로 만들지 않고 커넥션 풀을 공유)
+openai_client = None
+openai_client_lock = threading.Lock()
+
+def get_openai_client():
+    """
+    OpenAI 클라이언트를 한 번만 생성하여 재사용
+    
+    keep-alive 커넥션 풀을 공유하고, h2 패키지가 설치되어 있으면 HTTP/2를 사용
+    """
+    global openai_client
+    if openai_client is None:
+        with openai_client_lock:
+            if openai_client is None:
+                import httpx  # openai 패키지의 의존성
+                try:
+                    import h2  # noqa: F401
+                    http2 = True
+                except ImportError:
+                    http2 = False
+                http_client = httpx.Client(
+                    http2=http2,
+                    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+                    timeout=httpx.Timeout(120.0, connect=10.0)
+                )
+                openai_client = OpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
+                print(f"[DEBUG] OpenAI 클라이언트 생성 완료 (HTTP/2: {http2})")
+    return openai_client
+
 # Google Sheets 클라이언트 초기화
 google_sheets_client = None
 spreadsheet_cache = None  # 스프레드시트 객체 캐싱
 spreadsheet_cache_lock = threading.Lock()  # 스레드 안전성을 위한 락
 
 # Google Sheets 데이터 캐싱 (API 호출 최소화)
-sheets_data_cache = {}  # {worker_id: {'data': [...], 'timestamp': float, 'lock': threading.Lock()}}
-CACHE_TTL = 30  # 30초 캐시 유지 시간
-
-# Google Sheets 데이터 캐싱 (API 호출 최소화)
-sheets_data_cache = {}  # {worker_id: {'data': [...], 'timestamp': float, 'lock': threading.Lock()}}
+sheets_data_cache = {}  # {worker_id: {'data': [...], 'timestamp': float, 'lock': threading.RLock(), 'inflight': threading.Event | None}}
+sheets_data_cache_lock = threading.Lock()  # 작업자 항목 생성용
 CACHE_TTL = 30  # 30초 캐시 유지 시간
+SHEETS_INFLIGHT_TIMEOUT = 10  # 진행 중인 API 호출 결과 대기 최대 시간 (초)
 
 if GOOGLE_SHEETS_AVAILABLE and GOOGLE_SHEETS_SPREADSHEET_ID and GOOGLE_SHEETS_CREDENTIALS_PATH:
     try:
@@ -121,6 +455,67 @@ if GOOGLE_SHEETS_AVAILABLE and GOOGLE_SHEETS_SPREADSHEET_ID and GOOGLE_SHEETS_CR
 elif GOOGLE_SHEETS_AVAILABLE:
     print("[INFO] Google Sheets 연동 비활성화 (설정 필요)")
 
+# 시트 헤더 별칭 (시트마다 헤더 표기가 조금씩 달라 첫 번째로 값이 있는 헤더 사용)
+SHEET_HEADER_ALIASES = {
+    'image_id': ('Image ID', 'image_id'),
+    'review': ('검수', '검수 상태'),
+    'revision': ('수정여부', '수정 여부'),
+    'note': ('비고', '검수 의견'),
+    'view': ('View', 'view'),
+    'skip': ('SKIP', 'skip', '스킵'),
+    'saved_at': ('저장시간', '저장 시간'),
+}
+
+def get_sheet_field(row, key, default='', aliases=SHEET_HEADER_ALIASES):
+    """시트 행 딕셔너리에서 aliases[key] 헤더 중 처음으로 값이 있는 것 반환"""
+    for header in aliases[key]:
+        value = row.get(header)
+        if value:
+            return value
+    return default
+
+def resolve_sheet_aliases(sheet_data):
+    """
+    sheet_data 행들에 실제로 있는 헤더만 남긴 SHEET_HEADER_ALIASES
+    
+    행마다 없는 별칭 헤더까지 조회하지 않도록, 많은 행을 순회하기 전에 한 번 만들어
+    get_sheet_field(..., aliases=...)로 넘김.
+    """
+    present = set()
+    for row in sheet_data:
+        present.update(row.keys())
+    return {
+        key: tuple(header for header in headers if header in present)
+        for key, headers in SHEET_HEADER_ALIASES.items()
+    }
+
+# gspread 호출 재시도 설정 (할당량 초과/일시적 서버 오류만 재시도)
+SHEETS_RETRY_STATUSES = (429, 500, 503)
+SHEETS_MAX_TRIES = 5
+SHEETS_BACKOFF_BASE = 0.5  # 초 (0.5, 1, 2, 4 ... + 지터)
+
+def call_sheets(fn, *args, retry_statuses=SHEETS_RETRY_STATUSES, **kwargs):
+    """
+    gspread 호출을 지수 백오프 + 지터로 재시도하며 실행
+    
+    Args:
+        fn: 호출할 gspread 메서드 (예: worksheet.get_all_values)
+        retry_statuses: 재시도할 HTTP 상태 코드
+            (append_row처럼 멱등이 아닌 호출은 (429,)만 넘겨 중복 행 방지)
+    
+    마지막 시도까지 실패하면 APIError를 그대로 올려 기존 호출부의 429 처리(캐시 반환 등)로 넘어감.
+    """
+    for attempt in range(SHEETS_MAX_TRIES):
+        try:
+            return fn(*args, **kwargs)
+        except gspread.exceptions.APIError as e:
+            error_code = getattr(e.response, 'status_code', None)
+            if error_code not in retry_statuses or attempt == SHEETS_MAX_TRIES - 1:
+                raise
+            delay = SHEETS_BACKOFF_BASE * (2 ** attempt) + random.uniform(0, 0.3)
+            print(f"[DEBUG] Google Sheets API {error_code}, {delay:.1f}초 후 재시도 ({attempt + 1}/{SHEETS_MAX_TRIES - 1})")
+            time.sleep(delay)
+
 def get_spreadsheet(force_refresh=False):
     """
     스프레드시트 객체를 캐싱하여 반환 (API 호출 최소화)
@@ -139,7 +534,7 @@ def get_spreadsheet(force_refresh=False):
                 spreadsheet_cache = None
             
             try:
-                spreadsheet_cache = google_sheets_client.open_by_key(GOOGLE_SHEETS_SPREADSHEET_ID)
+                spreadsheet_cache = call_sheets(google_sheets_client.open_by_key, GOOGLE_SHEETS_SPREADSHEET_ID)
                 print("[DEBUG] 스프레드시트 객체 캐싱 완료")
             except gspread.exceptions.APIError as e:
                 # APIError의 response는 requests.Response 객체이므로 status_code를 사용
@@ -162,6 +557,8 @@ def clear_spreadsheet_cache():
     with spreadsheet_cache_lock:
         spreadsheet_cache = None
         print("[DEBUG] 스프레드시트 캐시 클리어됨")
+    # 스프레드시트를 다시 열면 시트 헤더도 다시 읽음
+    clear_sheet_header_cache()
 
 def clear_sheets_data_cache(worker_id=None):
     """
@@ -183,6 +580,116 @@ def clear_sheets_data_cache(worker_id=None):
                 sheets_data_cache[wid]['timestamp'] = 0
         print("[DEBUG] 모든 작업자의 데이터 캐시 무효화")
 
+def patch_sheets_data_cache(worker_id, image_id, updates):
+    """
+    시트에 방금 쓴 값을 데이터 캐시의 해당 행에 반영 (전체 캐시 무효화 대신)
+    
+    Args:
+        updates: {헤더명: 값} (시트에서 읽은 값과 같도록 문자열로 저장)
+    
+    캐시가 없거나 이미 만료된 경우는 건드리지 않음 (다음 읽기에서 새로 가져옴).
+    캐시에 해당 행이 없을 때는 updates에 Image ID가 있으면(전체 행) 새 행으로 추가하고,
+    일부 열만 있으면 해당 작업자 캐시를 무효화해 다음 읽기에서 시트의 행을 가져오게 함.
+    타임스탬프는 그대로 두어 검수자가 시트에서 직접 바꾼 값도 기존 주기대로 반영되게 함.
+    """
+    cache_entry = sheets_data_cache.get(worker_id)
+    if not cache_entry:
+        return
+    with cache_entry['lock']:
+        data = cache_entry.get('data')
+        if data is None or time.time() - cache_entry.get('timestamp', 0) >= CACHE_TTL:
+            return
+        updates = {header: '' if value is None else str(value) for header, value in updates.items()}
+        # 캐시 리스트는 다른 요청이 순회 중일 수 있으므로 복사본을 수정해 교체
+        new_data = list(data)
+        for idx, row in enumerate(new_data):
+            if str(get_sheet_field(row, 'image_id')) == str(image_id):
+                new_data[idx] = {**row, **updates}
+                break
+        else:
+            if not any(header in updates for header in SHEET_HEADER_ALIASES['image_id']):
+                # Image ID 없는 일부 열만으로 행을 만들면 통계/필터에서 빈 ID 이미지로 집계됨
+                clear_sheets_data_cache(worker_id)
+                return
+            new_data.append(updates)
+        cache_entry['data'] = new_data
+
+# 작업자 시트 헤더 캐싱 (1행만 읽어 HEADER_CACHE_TTL 동안 유지, 헤더는 거의 바뀌지 않음)
+sheets_header_cache = {}  # {worker_id: {'headers': [...], 'header_index': {정규화 헤더: idx}, 'timestamp': float}}
+sheets_header_cache_lock = threading.Lock()
+HEADER_CACHE_TTL = 600  # 10분
+
+# 시트 열 번호 -> 열 문자 (COL_LETTERS[0] = 'A', ..., COL_LETTERS[701] = 'ZZ')
+COL_LETTERS = tuple(
+    ''.join(letters)
+    for width in (1, 2)
+    for letters in itertools.product(string.ascii_uppercase, repeat=width)
+)
+
+def _normalize_header(header):
+    """헤더 표기 차이 무시용 키 ('Image ID'/'image_id' -> 'IMAGEID', '저장 시간' -> '저장시간')"""
+    return header.replace(' ', '').replace('_', '').upper() if header else ''
+
+def _get_sheet_header_entry(worker_id, worksheet):
+    """작업자 시트 헤더 캐시 항목 반환 (만료되었으면 row_values(1)로 다시 읽음)"""
+    with sheets_header_cache_lock:
+        entry = sheets_header_cache.get(worker_id)
+        if entry and time.time() - entry['timestamp'] < HEADER_CACHE_TTL:
+            return entry
+    
+    headers = call_sheets(worksheet.row_values, 1)
+    header_index = {}
+    for idx, header in enumerate(headers):
+        header_norm = _normalize_header(header)
+        if header_norm and header_norm not in header_index:
+            header_index[header_norm] = idx
+    
+    entry = {'headers': headers, 'header_index': header_index, 'timestamp': time.time()}
+    with sheets_header_cache_lock:
+        sheets_header_cache[worker_id] = entry
+    return entry
+
+def get_sheet_headers(worker_id, worksheet):
+    """작업자 시트의 헤더 행(1행) 리스트 반환 (캐싱)"""
+    return _get_sheet_header_entry(worker_id, worksheet)['headers']
+
+def get_sheet_header_index(worker_id, worksheet):
+    """
+    정규화된 헤더명(_normalize_header) -> 0-based 열 인덱스 딕셔너리 반환 (캐싱)
+    
+    전체 시트(get_all_values) 대신 1행(row_values(1))만 읽음.
+    표기가 다른 헤더('Image ID'/'image_id', '수정여부'/'수정 여부')는 같은 키 하나로 조회됨.
+    """
+    return _get_sheet_header_entry(worker_id, worksheet)['header_index']
+
+def clear_sheet_header_cache(worker_id=None):
+    """시트 헤더 캐시 무효화 (worker_id가 None이면 전체)"""
+    with sheets_header_cache_lock:
+        if worker_id:
+            sheets_header_cache.pop(worker_id, None)
+        else:
+            sheets_header_cache.clear()
+
+# 폴더 파일 목록 캐싱 (폴더 mtime이 바뀌면 다시 읽음): 이미지마다 os.path.exists를 호출하지 않고 집합으로 확인
+_folder_files_cache = {}  # {path: (mtime, frozenset(파일명))}
+_folder_files_cache_lock = threading.Lock()
+
+def _list_folder_files(path):
+    """폴더 안의 파일명 frozenset (폴더가 없으면 빈 집합)"""
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return frozenset()
+    with _folder_files_cache_lock:
+        cached = _folder_files_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+    with os.scandir(path) as entries:
+        files = frozenset(entry.name for entry in entries if entry.is_file())
+    with _folder_files_cache_lock:
+        _folder_files_cache[path] = (mtime, files)
+    return files
+
 class COCOWebAnnotator:
     """Web-based COCO annotation tool for creating question-response pairs."""
     
@@ -214,6 +721,11 @@ class COCOWebAnnotator:
         self.coco = COCO(coco_json_path)
         all_image_ids = list(self.coco.imgs.keys())
         
+        # 저장 시 매번 만드는 값은 로드 시 한 번만 계산 ("/파일명" 경로, "WxH" 해상도)
+        for img in self.coco.imgs.values():
+            img['rel_path'] = f"/{img['file_name']}"
+            img['resolution'] = f"{img['width']}x{img['height']}"
+        
         # 이미지 순서 정렬: exo_images 먼저, 그 다음 ego_images
         exo_image_ids = []
         ego_image_ids = []
@@ -221,10 +733,8 @@ class COCOWebAnnotator:
         
         # test_folder가 지정되면 해당 폴더에 있는 이미지만 처리
         if test_folder:
-            # test_folder에 있는 실제 파일 목록 가져오기
-            test_folder_files = set()
-            if os.path.exists(self.exo_images_folder):
-                test_folder_files = set(os.listdir(self.exo_images_folder))
+            # test_folder에 있는 실제 파일 목록 (집합에 있으면 파일이 있으므로 이미지마다 os.path.exists를 다시 호출하지 않음)
+            test_folder_files = _list_folder_files(self.exo_images_folder)
             
             for image_id in all_image_ids:
                 image_info = self.coco.imgs[image_id]
@@ -232,22 +742,19 @@ class COCOWebAnnotator:
                 
                 # test_folder에 있는 파일만 포함
                 if file_name in test_folder_files:
-                    exo_path = os.path.join(self.exo_images_folder, file_name)
-                    if os.path.exists(exo_path):
-                        exo_image_ids.append(image_id)
+                    exo_image_ids.append(image_id)
         else:
-            # test_folder가 없으면 전체 이미지 순회
+            # test_folder가 없으면 전체 이미지 순회 (폴더 목록을 한 번씩만 읽어 집합으로 확인)
+            exo_files = _list_folder_files(self.exo_images_folder)
+            ego_files = _list_folder_files(self.ego_images_folder)
             for image_id in all_image_ids:
                 image_info = self.coco.imgs[image_id]
                 file_name = image_info.get('file_name', '')
                 
                 # exo_images 폴더에 있는지 확인
-                exo_path = os.path.join(self.exo_images_folder, file_name)
-                ego_path = os.path.join(self.ego_images_folder, file_name)
-                
-                if os.path.exists(exo_path):
+                if file_name in exo_files:
                     exo_image_ids.append(image_id)
-                elif os.path.exists(ego_path):
+                elif file_name in ego_files:
                     ego_image_ids.append(image_id)
                 else:
                     # 둘 다 없으면 기본값으로 exo에 추가 (또는 unknown에 추가)
@@ -278,14 +785,14 @@ class COCOWebAnnotator:
         self.category_id_to_name = {}
         if categories_json_path and os.path.exists(categories_json_path):
             try:
-                with open(categories_json_path, 'r', encoding='utf-8') as f:
-                    cats = json.load(f)
-                    # cats가 [{"id": 74, "name": "mouse", ...}, ...] 형태라고 가정
-                    for c in cats:
-                        cid = c.get('id')
-                        name = c.get('name')
-                        if cid is not None and name:
-                            self.category_id_to_name[int(cid)] = str(name)
+                # 어노테이션 파일과 같은 로더 사용 (orjson이 있으면 orjson)
+                cats = _load_json_file(categories_json_path)
+                # cats가 [{"id": 74, "name": "mouse", ...}, ...] 형태라고 가정
+                for c in cats:
+                    cid = c.get('id')
+                    name = c.get('name')
+                    if cid is not None and name:
+                        self.category_id_to_name[int(cid)] = str(name)
             except Exception as e:
                 print(f"[WARN] Failed to load categories_json: {e}")
         # pycocotools fallback
@@ -298,6 +805,75 @@ class COCOWebAnnotator:
         # Load existing annotations (exo와 ego 모두 로드)
         self.annotations = []
         self._reload_annotations()
+        
+        # ego_images 폴더에 파일이 있는 image_id 캐시 (폴더 mtime이 바뀌면 다시 계산)
+        self._ego_image_ids = []
+        self._ego_image_id_set = frozenset()
+        self._ego_folder_image_count = 0
+        self._ego_folder_mtime = None
+        self._ego_image_ids_lock = threading.Lock()
+        
+        # exo_images 폴더에 파일이 있는 이미지의 인덱스 캐시 (/api/exo_image_indices, 폴더 mtime 기준)
+        self._exo_indices = []
+        self._exo_folder_mtime = None
+        self._exo_indices_lock = threading.Lock()
+    
+    def _refresh_ego_image_ids(self):
+        """ego 이미지 캐시 갱신: 폴더 mtime(파일 추가/삭제 시 변경)이 바뀐 경우에만 다시 계산. 폴더가 없으면 False"""
+        try:
+            mtime = os.stat(self.ego_images_folder).st_mtime
+        except OSError:
+            return False
+        with self._ego_image_ids_lock:
+            if mtime != self._ego_folder_mtime:
+                ego_files = _list_folder_files(self.ego_images_folder)
+                ego_image_ids = [
+                    image_id for image_id in self.image_ids
+                    if self.coco.imgs[image_id].get('file_name', '') in ego_files
+                ]
+                self._ego_image_ids = ego_image_ids
+                self._ego_image_id_set = frozenset(ego_image_ids)
+                self._ego_folder_image_count = sum(
+                    1 for f in ego_files
+                    if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp'))
+                )
+                self._ego_folder_mtime = mtime
+        return True
+    
+    def get_ego_image_ids(self):
+        """ego_images 폴더에 파일이 있는 image_id 리스트 (self.image_ids 순서, 요청마다 os.path.exists 호출하지 않음)"""
+        if not self._refresh_ego_image_ids():
+            return []
+        return self._ego_image_ids
+    
+    def get_ego_image_id_set(self):
+        """get_ego_image_ids()와 같은 이미지의 집합 (O(1) 포함 여부 확인용)"""
+        if not self._refresh_ego_image_ids():
+            return frozenset()
+        return self._ego_image_id_set
+    
+    def get_exo_image_indices(self):
+        """exo_images 폴더에 파일이 있는 이미지의 self.image_ids 인덱스 리스트 (폴더 mtime이 바뀐 경우에만 다시 계산)"""
+        try:
+            mtime = os.stat(self.exo_images_folder).st_mtime
+        except OSError:
+            return []
+        with self._exo_indices_lock:
+            if mtime != self._exo_folder_mtime:
+                exo_files = _list_folder_files(self.exo_images_folder)
+                imgs = self.coco.imgs
+                self._exo_indices = [
+                    idx for idx, image_id in enumerate(self.image_ids)
+                    if imgs[image_id].get('file_name', '') in exo_files
+                ]
+                self._exo_folder_mtime = mtime
+            return self._exo_indices
+    
+    def get_ego_folder_image_count(self):
+        """ego_images 폴더의 이미지 파일 개수 (COCO 등록 여부와 무관, 폴더 mtime 기준 캐싱)"""
+        if not self._refresh_ego_image_ids():
+            return 0
+        return self._ego_folder_image_count
     
     def _reload_annotations(self):
         """Reload exo and ego annotations (called when needed)"""
@@ -305,20 +881,25 @@ class COCOWebAnnotator:
         # exo annotations 로드
         if os.path.exists(self.output_json_path_exo):
             try:
-                with open(self.output_json_path_exo, 'r', encoding='utf-8') as f:
-                    exo_anns = json.load(f)
-                    self.annotations.extend(exo_anns)
+                exo_anns = _load_json_file(self.output_json_path_exo)
+                self.annotations.extend(exo_anns)
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 print(f"[WARN] Failed to load exo annotations: {e}")
         # ego annotations 로드
         if os.path.exists(self.output_json_path_ego):
             try:
-                with open(self.output_json_path_ego, 'r', encoding='utf-8') as f:
-                    ego_anns = json.load(f)
-                    self.annotations.extend(ego_anns)
+                ego_anns = _load_json_file(self.output_json_path_ego)
+                self.annotations.extend(ego_anns)
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 print(f"[WARN] Failed to load ego annotations: {e}")
     
+    def update_cache(self, annotation):
+        """Patch the in-memory annotations with a freshly saved annotation (파일 재로드 없이)"""
+        # 저장 시 다른 view 파일에서도 같은 image_id가 제거되므로 캐시에서도 모두 제거 후 추가
+        # 조회 중인 다른 스레드를 위해 리스트를 제자리 수정하지 않고 새 리스트로 교체
+        image_id = annotation.get('image_id')
+        self.annotations = [ann for ann in self.annotations if ann.get('image_id') != image_id] + [annotation]
+    
 
 def get_vqa_json_by_filename(image_filename, coco_json_path, mscoco_folder=None, question=None, response=None, rationale=None, bbox=None, view=None):
     """
@@ -372,8 +953,53 @@ def get_vqa_json_by_filename(image_filename, coco_json_path, mscoco_folder=None,
 # Global annotator instance
 annotator = None
 
-# 이미지 분석 결과 캐시 (image_id를 키로 사용)
+# 이미지 분석 결과 캐시 {(image_id, model): 분석 텍스트}
 image_analysis_cache = {}
+# image_id별 가장 최근 분석 텍스트 (모델과 무관, 번역 엔드포인트에서 한 번에 조회)
+latest_image_analysis = {}
+
+class ImageAnalysisDiskCache:
+    """이미지 분석 결과 영구 캐시 (SQLite 파일, 서버 재시작 후에도 유지)"""
+    
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = None
+    
+    def _connect(self):
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS image_analysis (key TEXT PRIMARY KEY, analysis TEXT NOT NULL)")
+            self.conn.commit()
+        return self.conn
+    
+    def get(self, key):
+        try:
+            with self.lock:
+                row = self._connect().execute("SELECT analysis FROM image_analysis WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+        except sqlite3.Error as e:
+            print(f"[WARN] 이미지 분석 디스크 캐시 조회 실패: {e}")
+            return None
+    
+    def set(self, key, analysis):
+        try:
+            with self.lock:
+                conn = self._connect()
+                conn.execute("INSERT OR REPLACE INTO image_analysis (key, analysis) VALUES (?, ?)", (key, analysis))
+                conn.commit()
+        except sqlite3.Error as e:
+            print(f"[WARN] 이미지 분석 디스크 캐시 저장 실패: {e}")
+
+image_analysis_disk_cache = ImageAnalysisDiskCache(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'image_analysis.sqlite')
+)
+
+def cache_image_analysis(image_id, model, analysis):
+    """이미지 분석 결과를 모델별 캐시와 image_id별 최근 분석에 함께 저장"""
+    image_analysis_cache[(image_id, model)] = analysis
+    latest_image_analysis[image_id] = analysis
 
 # idx 검색 라우트 추가 #
 @app.route('/api/find/<int:image_id>')
@@ -398,9 +1024,9 @@ def find_by_image_id(image_id):
                     sheet_data = read_from_google_sheets(worker_id)
                     is_completed = False
                     for row in sheet_data:
-                        row_image_id = row.get('Image ID', '') or row.get('image_id', '')
+                        row_image_id = get_sheet_field(row, 'image_id')
                         if str(row_image_id) == str(current_image_id):
-                            review_status = row.get('검수', '') or row.get('검수 상태', '')
+                            review_status = get_sheet_field(row, 'review')
                             # '납품 완료' 또는 '납품완료' (공백 유무 무관)
                             if review_status and ('납품 완료' in review_status or '납품완료' in review_status):
                                 is_completed = True
@@ -451,13 +1077,8 @@ def get_worker_id():
 def get_exo_image_indices():
     """Get list of all exo image indices (for batch processing) - 빠른 버전"""
     try:
-        exo_indices = []
-        for idx, image_id in enumerate(annotator.image_ids):
-            image_info = annotator.coco.imgs[image_id]
-            file_name = image_info.get('file_name', '')
-            exo_path = os.path.join(annotator.exo_images_folder, file_name)
-            if os.path.exists(exo_path):
-                exo_indices.append(idx)
+        # exo 폴더가 바뀌지 않았으면 annotator에 캐싱된 인덱스 리스트를 그대로 사용
+        exo_indices = annotator.get_exo_image_indices()
         
         return jsonify({
             'success': True,
@@ -470,6 +1091,35 @@ def get_exo_image_indices():
             'error': str(e)
         }), 500
 
+@lru_cache(maxsize=64)
+def _encode_display_image(image_path, mtime):
+    """
+    화면 표시용(최대 800x600) JPEG base64 인코딩 결과 캐싱
+    
+    이미지를 앞뒤로 이동할 때마다 같은 파일을 다시 리사이즈/인코딩하지 않도록 (경로, mtime)으로 캐싱.
+    mtime은 파일이 바뀌면 캐시 키가 달라지게 하려고 받음.
+    
+    Returns:
+        (base64 문자열, 표시 너비, 표시 높이, scale)
+    """
+    with Image.open(image_path) as img:
+        original_width, original_height = img.size
+        # Resize if too large but keep track of scale
+        max_width, max_height = 800, 600
+        scale = min(max_width/original_width, 
+                   max_height/original_height, 1.0)
+        if scale < 1.0:
+            new_width = int(original_width * scale)
+            new_height = int(original_height * scale)
+            img = img.resize((new_width, new_height), 
+                            Image.Resampling.LANCZOS)
+        else:
+            new_width, new_height = original_width, original_height
+        
+        buffer = BytesIO()
+        img.save(buffer, format='JPEG')
+        return base64.b64encode(buffer.getvalue()).decode(), new_width, new_height, scale
+
 @app.route('/api/image/<int:index>')
 def get_image(index):
     """Get image information for a specific index."""
@@ -490,9 +1140,9 @@ def get_image(index):
                 sheet_data = read_from_google_sheets(worker_id)
                 is_completed = False
                 for row in sheet_data:
-                    row_image_id = row.get('Image ID', '') or row.get('image_id', '')
+                    row_image_id = get_sheet_field(row, 'image_id')
                     if str(row_image_id) == str(image_id):
-                        review_status = row.get('검수', '') or row.get('검수 상태', '')
+                        review_status = get_sheet_field(row, 'review')
                         # '납품 완료' 또는 '납품완료' (공백 유무 무관)
                         if review_status and ('납품 완료' in review_status or '납품완료' in review_status):
                             is_completed = True
@@ -596,23 +1246,7 @@ def get_image(index):
             return jsonify({'error': error_msg}), 500
     
     try:
-        with Image.open(image_path) as img:
-            original_width, original_height = img.size
-            # Resize if too large but keep track of scale
-            max_width, max_height = 800, 600
-            scale = min(max_width/original_width, 
-                       max_height/original_height, 1.0)
-            if scale < 1.0:
-                new_width = int(original_width * scale)
-                new_height = int(original_height * scale)
-                img = img.resize((new_width, new_height), 
-                                Image.Resampling.LANCZOS)
-            else:
-                new_width, new_height = original_width, original_height
-            
-            buffer = BytesIO()
-            img.save(buffer, format='JPEG')
-            img_base64 = base64.b64encode(buffer.getvalue()).decode()
+        img_base64, new_width, new_height, scale = _encode_display_image(image_path, os.path.getmtime(image_path))
     except (IOError, OSError, ValueError) as e:
         return jsonify({'error': f'Failed to load image: {e}'}), 500
     # 납품완료된 이미지 개수 계산 (남은 이미지 계산을 위해)
@@ -629,9 +1263,8 @@ def get_image(index):
     
     if os.path.exists(ego_images_folder_path):
         try:
-            ego_files = [f for f in os.listdir(ego_images_folder_path) 
-                         if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp'))]
-            total_ego_images = len(ego_files)
+            # 폴더 mtime이 바뀌지 않았으면 annotator에 캐싱된 개수를 그대로 사용
+            total_ego_images = annotator.get_ego_folder_image_count()
             print(f"[DEBUG] ego_images 폴더의 이미지 개수: {total_ego_images}")
         except Exception as e:
             print(f"[ERROR] ego_images 폴더 읽기 실패: {e}")
@@ -649,13 +1282,13 @@ def get_image(index):
                 # 구글시트에서 view가 'ego'인 이미지만 필터링
                 ego_sheet_images = 0
                 for row in sheet_data:
-                    row_image_id = row.get('Image ID', '') or row.get('image_id', '')
-                    row_view = row.get('view', '') or row.get('View', '')
+                    row_image_id = get_sheet_field(row, 'image_id')
+                    row_view = get_sheet_field(row, 'view')
                     
                     # view가 'ego'인 이미지만 처리
                     if row_image_id and row_view.lower() == 'ego':
                         ego_sheet_images += 1
-                        review_status = row.get('검수', '') or row.get('검수 상태', '')
+                        review_status = get_sheet_field(row, 'review')
                         if review_status == '납품 완료':
                             completed_count += 1
                         elif review_status == '통과':
@@ -705,7 +1338,7 @@ def get_image(index):
         else:
             remaining_count = 0
     
-    return jsonify({
+    response = jsonify({
         'image_id': image_id,
         'image_data': f'data:image/jpeg;base64,{img_base64}',
         'width': image_info['width'],
@@ -726,31 +1359,13 @@ def get_image(index):
         'index_changed': index_changed,  # 인덱스가 변경되었는지 여부
         'original_index': original_index  # 원래 요청한 인덱스
     })
+    # 같은 내용을 다시 요청하면 304로 응답 (브라우저는 매번 재검증하고 바뀐 경우에만 본문을 받음)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
 
-@app.route('/api/translate/question', methods=['POST'])
-def translate_question():
-    """Translate Korean question to English using GPT-5."""
-    data = request.json
-    question_ko = data.get('question_ko', '').strip()
-    view_type = data.get('view_type', 'exo')  # 'exo' or 'ego'
-    
-    if not question_ko:
-        return jsonify({'success': False, 'error': 'Question (Korean) is required'}), 400
-    
-    try:
-        if not OPENAI_AVAILABLE:
-            return jsonify({'success': False, 'error': 'OpenAI library not installed. Install with: pip install openai'}), 500
-        
-        # OpenAI API 호출 (코드에서 직접 API 키 사용)
-        if not OPENAI_API_KEY or OPENAI_API_KEY == "your-api-key-here":
-            return jsonify({'success': False, 'error': 'OPENAI_API_KEY is not set. Please set it in coco_web_annotator.py'}), 500
-        
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
-        # view_type에 따라 다른 프롬프트 사용
-        if view_type == 'ego':
-            # ego_data_sample.json 형식 참고
-            prompt = f"""Translate the following Korean question to English. You MUST follow this EXACT format for EGO-CENTRIC questions:
+# translate_question 프롬프트 (정적 텍스트는 모듈 상수로 두고 요청마다 가변 부분만 이어 붙임)
+TRANSLATE_QUESTION_PROMPT_EGO_HEAD = """Translate the following Korean question to English. You MUST follow this EXACT format for EGO-CENTRIC questions:
 
 CORRECT FORMAT FOR EGO-CENTRIC QUESTIONS:
 [Question with <ATT>, <POS>, <REL> tags embedded naturally in the sentence] <choice>(a) option1, (b) option2, (c) option3, (d) option4</choice> And provide the bounding box coordinate of the region related to your answer.
@@ -801,7 +1416,9 @@ Example 2: "When I'm sitting on the right side of the large sofa, which <ATT>squ
 
 Example 3: "From the perspective of the woman, which <ATT>silver object</ATT> <POS>to the right of</POS> her is <REL>closest to her</REL>? <choice>(a) fork, (b) knife, (c) spoon, (d) wine glass</choice> And provide the bounding box coordinate of the region related to your answer."
 
-Korean question: {question_ko}
+Korean question: """
+
+TRANSLATE_QUESTION_PROMPT_EGO_TAIL = """
 
 Translate to English following the EXACT format above. Make sure:
 - Use "From the perspective of ~" if Korean contains "~관점에서"
@@ -816,9 +1433,8 @@ Translate to English following the EXACT format above. Make sure:
 - <choice> tag comes before "And provide..." phrase
 - DO NOT use generic phrases like "in the image" for <POS> tag
 - DOUBLE-CHECK: Before finalizing, verify that ALL attribute descriptions are wrapped in <ATT> tags"""
-        else:
-            # exo_data_sample.json 형식 참고
-            prompt = f"""Translate the following Korean question to English. You MUST follow this EXACT format:
+
+TRANSLATE_QUESTION_PROMPT_EXO_HEAD = """Translate the following Korean question to English. You MUST follow this EXACT format:
 
 CORRECT FORMAT:
 [Question with <ATT>, <POS>, <REL> tags embedded naturally in the sentence] <choice>(a) option1, (b) option2, (c) option3, (d) option4</choice> And provide the bounding box coordinate of the region related to your answer.
@@ -852,7 +1468,9 @@ Reference examples from exo_data_sample.json:
 - "<REL>Second-closest</REL> to the refrigerator a countertop located <POS>in the center</POS> of the image, which object is it <ATT>among the items</ATT>? <choice>(a) sink, (b) vase, (c) orange bag, (d) rightmost red chair</choice> And provide the bounding box coordinate of the region related to your answer."
 - "Which <ATT>square-shaped item</ATT> is <REL>placed on the floor</REL> <POS>in front of</POS> the brown-haired man sitting on the sofa? <choice>(a) handbag, (b) coke, (c) laptop, (d) cell phone</choice> And provide the bounding box coordinate of the region related to your answer."
 
-Korean question: {question_ko}
+Korean question: """
+
+TRANSLATE_QUESTION_PROMPT_EXO_TAIL = """
 
 Translate to English following the EXACT format above. Make sure:
 - <REL> is used ONLY for relationship terms (farthest, closest, etc.)
@@ -865,42 +1483,75 @@ Translate to English following the EXACT format above. Make sure:
 - <choice> tag comes before "And provide..." phrase
 - DO NOT use generic phrases like "in the image" for <POS> tag
 - DOUBLE-CHECK: Before finalizing, verify that ALL attribute descriptions are wrapped in <ATT> tags"""
+
+# view_type별 시스템 메시지
+TRANSLATE_QUESTION_SYSTEM_MESSAGES = {
+    'ego': "You are a professional translator specializing in VQA (Visual Question Answering) EGO-CENTRIC questions. CRITICAL RULES: 1) Use 'From the perspective of ~' for '~관점에서', 2) Use 'When I'm ~' for '내가', 3) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 4) <POS> tag ONLY for position/location from person's perspective (on the left side, on the right side, etc.), 5) <ATT> tag ONLY for attributes/target groups (round object, green object, white object, person, etc.), 6) 🚨 MANDATORY: If Korean contains ANY attribute word (color, shape, material, '사람', '객체', '물체'), you MUST use <ATT> tag, 7) 🚨 MANDATORY: If Korean ends with '~사람은?' or '~객체는?', you MUST include <ATT> tag, 8) Tags MUST contain actual meaningful content, 9) Format: [Question with tags] <choice>...</choice> And provide..., 10) DO NOT use generic phrases like 'in the image' for <POS> tag, 11) DOUBLE-CHECK: Verify ALL attribute descriptions are wrapped in <ATT> tags.",
+    'exo': "You are a professional translator specializing in VQA (Visual Question Answering) questions. CRITICAL RULES: 1) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 2) <POS> tag ONLY for position/location (in the center, on the left side, etc.), 3) <ATT> tag ONLY for attributes/target groups (red object, white object, among the items, person, etc.), 4) 🚨 MANDATORY: If Korean contains ANY attribute word (color, shape, material, '사람', '객체', '물체'), you MUST use <ATT> tag, 5) 🚨 MANDATORY: If Korean ends with '~사람은?' or '~객체는?', you MUST include <ATT> tag, 6) Tags MUST contain actual meaningful content, 7) Format: [Question with tags] <choice>...</choice> And provide..., 8) DO NOT use generic phrases like 'in the image' for <POS> tag, 9) DOUBLE-CHECK: Verify ALL attribute descriptions are wrapped in <ATT> tags."
+}
+
+# 태그 형식 번역은 재현 가능한 출력이 중요하므로 temperature=0 사용 (형식 위반으로 인한 재요청 감소)
+# 질문+선택지 번역은 200 토큰 내외이므로 최악의 경우 비용을 400 토큰으로 제한
+TRANSLATE_MAX_TOKENS = 400
+
+def _build_translate_question_messages(question_ko, view_type):
+    """질문 번역 요청 메시지 생성 (동기 번역과 Batch 큐에서 공통 사용)"""
+    # view_type에 따라 다른 프롬프트/시스템 메시지 사용 (ego/exo_data_sample.json 형식 참고)
+    cfg = get_view_config(view_type)
+    prompt_head, prompt_tail = cfg['question_prompt']
+    return [
+        {"role": "system", "content": cfg['question_system']},
+        {"role": "user", "content": "".join((prompt_head, question_ko, prompt_tail))}
+    ]
+
+def _translated_question_error(question_ko, translated_question):
+    """번역된 질문의 형식 검증 (태그, <choice>, REQUIRED_PHRASE). 문제 없으면 None, 있으면 오류 메시지"""
+    if '<ATT>' not in translated_question and '<POS>' not in translated_question and '<REL>' not in translated_question:
+        return 'Translation must include at least one of <ATT>, <POS>, or <REL> tags'
+    
+    # ATT 태그 누락 검증 강화: 한국어 질문에 속성 단어가 있는데 ATT 태그가 없는 경우
+    question_has_attribute = _RE_ATTRIBUTE_KO.search(question_ko) is not None
+    if question_has_attribute and '<ATT>' not in translated_question:
+        return f'ATT tag is missing! Korean question contains attribute words but translation lacks <ATT> tag. Please ensure all attribute descriptions are wrapped in <ATT> tags. Translation: {translated_question[:200]}...'
+    
+    if '<choice>' not in translated_question:
+        return 'Translation must include <choice> tag'
+    
+    if REQUIRED_PHRASE not in translated_question:
+        return 'Translation must end with the required phrase'
+    return None
+
+@app.route('/api/translate/question', methods=['POST'])
+def translate_question():
+    """Translate Korean question to English using GPT-5."""
+    data = request.json
+    question_ko = data.get('question_ko', '').strip()
+    view_type = data.get('view_type', 'exo')  # 'exo' or 'ego'
+    
+    if not question_ko:
+        return jsonify({'success': False, 'error': 'Question (Korean) is required'}), 400
+    if _inputs_too_large((question_ko,)):
+        return jsonify({'success': False, 'error': INPUT_TOO_LARGE_ERROR}), 413
+    
+    try:
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
         
-        # view_type에 따라 다른 시스템 메시지 사용
-        if view_type == 'ego':
-            system_message = "You are a professional translator specializing in VQA (Visual Question Answering) EGO-CENTRIC questions. CRITICAL RULES: 1) Use 'From the perspective of ~' for '~관점에서', 2) Use 'When I'm ~' for '내가', 3) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 4) <POS> tag ONLY for position/location from person's perspective (on the left side, on the right side, etc.), 5) <ATT> tag ONLY for attributes/target groups (round object, green object, white object, person, etc.), 6) 🚨 MANDATORY: If Korean contains ANY attribute word (color, shape, material, '사람', '객체', '물체'), you MUST use <ATT> tag, 7) 🚨 MANDATORY: If Korean ends with '~사람은?' or '~객체는?', you MUST include <ATT> tag, 8) Tags MUST contain actual meaningful content, 9) Format: [Question with tags] <choice>...</choice> And provide..., 10) DO NOT use generic phrases like 'in the image' for <POS> tag, 11) DOUBLE-CHECK: Verify ALL attribute descriptions are wrapped in <ATT> tags."
-        else:
-            system_message = "You are a professional translator specializing in VQA (Visual Question Answering) questions. CRITICAL RULES: 1) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 2) <POS> tag ONLY for position/location (in the center, on the left side, etc.), 3) <ATT> tag ONLY for attributes/target groups (red object, white object, among the items, person, etc.), 4) 🚨 MANDATORY: If Korean contains ANY attribute word (color, shape, material, '사람', '객체', '물체'), you MUST use <ATT> tag, 5) 🚨 MANDATORY: If Korean ends with '~사람은?' or '~객체는?', you MUST include <ATT> tag, 6) Tags MUST contain actual meaningful content, 7) Format: [Question with tags] <choice>...</choice> And provide..., 8) DO NOT use generic phrases like 'in the image' for <POS> tag, 9) DOUBLE-CHECK: Verify ALL attribute descriptions are wrapped in <ATT> tags."
+        client = get_openai_client()
         
         response = client.chat.completions.create(
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.3
+            messages=_build_translate_question_messages(question_ko, view_type),
+            temperature=0,
+            max_tokens=TRANSLATE_MAX_TOKENS
         )
         
         translated_question = response.choices[0].message.content.strip()
         
-        # 태그 검증
-        if '<ATT>' not in translated_question and '<POS>' not in translated_question and '<REL>' not in translated_question:
-            return jsonify({'success': False, 'error': 'Translation must include at least one of <ATT>, <POS>, or <REL> tags'}), 400
-        
-        # ATT 태그 누락 검증 강화: 한국어 질문에 속성 단어가 있는데 ATT 태그가 없는 경우
-        attribute_keywords_ko = ['흰색', '빨간색', '파란색', '초록색', '검은색', '노란색', '원형', '정사각형', '직사각형', '사람', '객체', '물체', '색', '모양', '재질']
-        question_has_attribute = any(keyword in question_ko for keyword in attribute_keywords_ko)
-        if question_has_attribute and '<ATT>' not in translated_question:
-            return jsonify({
-                'success': False, 
-                'error': f'ATT tag is missing! Korean question contains attribute words but translation lacks <ATT> tag. Please ensure all attribute descriptions are wrapped in <ATT> tags. Translation: {translated_question[:200]}...'
-            }), 400
-        
-        if '<choice>' not in translated_question:
-            return jsonify({'success': False, 'error': 'Translation must include <choice> tag'}), 400
-        
-        if 'And provide the bounding box coordinate of the region related to your answer.' not in translated_question:
-            return jsonify({'success': False, 'error': 'Translation must end with the required phrase'}), 400
+        # 태그/<choice>/필수 문구 검증 (Batch 결과도 같은 검증 사용)
+        validation_error = _translated_question_error(question_ko, translated_question)
+        if validation_error:
+            return jsonify({'success': False, 'error': validation_error}), 400
         
         return jsonify({
             'success': True,
@@ -909,6 +1560,227 @@ Translate to English following the EXACT format above. Make sure:
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# ==================== OpenAI Batch API 번역 큐 ====================
+# 급하지 않은 번역(야간 일괄 처리 등)은 Batch API로 모아서 제출 (비용 50% 절감, 24시간 내 완료)
+BATCH_FLUSH_SIZE = 50          # 큐에 이만큼 쌓이면 즉시 제출
+BATCH_FLUSH_INTERVAL = 600     # 초 단위, 이 시간마다 남은 큐 제출
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+class TranslationBatchStore:
+    """Batch 작업 상태/결과 저장소 (SQLite 파일, 서버 재시작 후에도 batch_id/제출 전 작업 유지)"""
+    
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = None
+    
+    def _connect(self):
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute("CREATE TABLE IF NOT EXISTS batch_jobs (custom_id TEXT PRIMARY KEY, batch_id TEXT, result TEXT, error TEXT, question_ko TEXT, view_type TEXT)")
+            # 이전 스키마 파일이면 원문/뷰 타입 컬럼 추가
+            columns = {row[1] for row in self.conn.execute("PRAGMA table_info(batch_jobs)")}
+            for column in ('question_ko', 'view_type'):
+                if column not in columns:
+                    self.conn.execute(f"ALTER TABLE batch_jobs ADD COLUMN {column} TEXT")
+            self.conn.commit()
+        return self.conn
+    
+    def add_queued(self, custom_id, question_ko, view_type):
+        """큐에 넣을 때 batch_id 없이 기록 (제출 전 조회/재시작 후 복구용)"""
+        with self.lock:
+            conn = self._connect()
+            conn.execute("INSERT OR REPLACE INTO batch_jobs (custom_id, question_ko, view_type) VALUES (?, ?, ?)",
+                         (custom_id, question_ko, view_type))
+            conn.commit()
+    
+    def add_jobs(self, batch_id, custom_ids):
+        """제출된 작업에 batch_id 기록"""
+        with self.lock:
+            conn = self._connect()
+            conn.executemany("UPDATE batch_jobs SET batch_id = ? WHERE custom_id = ?",
+                             [(batch_id, custom_id) for custom_id in custom_ids])
+            conn.commit()
+    
+    def queued_jobs(self):
+        """아직 제출되지 않은 작업 [(custom_id, question_ko, view_type), ...]"""
+        with self.lock:
+            return self._connect().execute(
+                "SELECT custom_id, question_ko, view_type FROM batch_jobs WHERE batch_id IS NULL AND result IS NULL AND error IS NULL"
+            ).fetchall()
+    
+    def get_job(self, custom_id):
+        with self.lock:
+            row = self._connect().execute("SELECT batch_id, result, error, question_ko FROM batch_jobs WHERE custom_id = ?", (custom_id,)).fetchone()
+        if not row:
+            return None
+        return {'batch_id': row[0], 'result': row[1], 'error': row[2], 'question_ko': row[3] or ''}
+    
+    def set_results(self, rows):
+        """rows: (custom_id, result, error) 목록"""
+        with self.lock:
+            conn = self._connect()
+            conn.executemany("UPDATE batch_jobs SET result = ?, error = ? WHERE custom_id = ?",
+                             [(result, error, custom_id) for custom_id, result, error in rows])
+            conn.commit()
+
+translation_batch_store = TranslationBatchStore(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'translation_batches.sqlite')
+)
+_batch_queue = []
+_batch_queue_lock = threading.Lock()
+_batch_flush_event = threading.Event()
+_batch_flusher_thread = None
+
+def _build_batch_job(custom_id, question_ko, view_type):
+    """Batch 입력 JSONL 한 줄 (질문 번역 요청)"""
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": "gpt-4o-mini",
+            "messages": _build_translate_question_messages(question_ko, view_type),
+            "temperature": 0,
+            "max_tokens": TRANSLATE_MAX_TOKENS
+        }
+    }
+
+def restore_batch_queue():
+    """재시작 전에 큐에 넣고 제출하지 못한 작업을 저장소에서 다시 큐에 올림"""
+    jobs = [_build_batch_job(custom_id, question_ko or '', view_type or 'exo')
+            for custom_id, question_ko, view_type in translation_batch_store.queued_jobs()]
+    if not jobs:
+        return 0
+    with _batch_queue_lock:
+        _batch_queue.extend(jobs)
+    _ensure_batch_flusher()
+    print(f"[INFO] 제출 전 번역 Batch 작업 복구: {len(jobs)}건")
+    return len(jobs)
+
+def _flush_batch_queue():
+    """큐에 쌓인 요청을 JSONL 파일로 업로드하고 Batch 작업 생성"""
+    with _batch_queue_lock:
+        if not _batch_queue:
+            return None
+        jobs = _batch_queue[:]
+        _batch_queue.clear()
+    
+    tmp_path = None
+    try:
+        client = get_openai_client()
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', encoding='utf-8', delete=False) as f:
+            tmp_path = f.name
+            for job in jobs:
+                f.write(json.dumps(job, ensure_ascii=False) + "\n")
+        with open(tmp_path, 'rb') as f:
+            batch_file = client.files.create(file=f, purpose='batch')
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window='24h'
+        )
+        translation_batch_store.add_jobs(batch.id, [job['custom_id'] for job in jobs])
+        print(f"[INFO] 번역 Batch 제출: {batch.id} ({len(jobs)}건)")
+        return batch.id
+    except Exception as e:
+        # 제출 실패 시 다음 flush에서 다시 시도하도록 큐에 되돌림
+        print(f"[ERROR] 번역 Batch 제출 실패: {type(e).__name__}: {e}")
+        with _batch_queue_lock:
+            _batch_queue[:0] = jobs
+        return None
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _batch_flusher_loop():
+    while True:
+        _batch_flush_event.wait(BATCH_FLUSH_INTERVAL)
+        _batch_flush_event.clear()
+        _flush_batch_queue()
+
+def _ensure_batch_flusher():
+    global _batch_flusher_thread
+    with _batch_queue_lock:
+        if _batch_flusher_thread is None:
+            _batch_flusher_thread = threading.Thread(target=_batch_flusher_loop, name='translation-batch-flusher', daemon=True)
+            _batch_flusher_thread.start()
+
+@app.route('/api/translate/enqueue', methods=['POST'])
+def enqueue_translation():
+    """Queue a Korean question translation for the OpenAI Batch API (non-urgent work)."""
+    data = request.json
+    question_ko = data.get('question_ko', '').strip()
+    view_type = data.get('view_type', 'exo')  # 'exo' or 'ego'
+    
+    if not question_ko:
+        return jsonify({'success': False, 'error': 'Question (Korean) is required'}), 400
+    if _inputs_too_large((question_ko,)):
+        return jsonify({'success': False, 'error': INPUT_TOO_LARGE_ERROR}), 413
+    if not OPENAI_READY:
+        return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
+    
+    custom_id = uuid.uuid4().hex
+    job = _build_batch_job(custom_id, question_ko, view_type)
+    # 제출 전에도 조회할 수 있고 재시작해도 잃지 않도록 먼저 저장소에 기록
+    translation_batch_store.add_queued(custom_id, question_ko, view_type)
+    with _batch_queue_lock:
+        _batch_queue.append(job)
+        queue_size = len(_batch_queue)
+    
+    _ensure_batch_flusher()
+    if queue_size >= BATCH_FLUSH_SIZE:
+        _batch_flush_event.set()
+    
+    return jsonify({'success': True, 'custom_id': custom_id, 'queue_size': queue_size})
+
+@app.route('/api/translate/batch/<custom_id>', methods=['GET'])
+def get_batch_translation(custom_id):
+    """Return the Batch API translation result for a queued job."""
+    try:
+        job = translation_batch_store.get_job(custom_id)
+        if job is None:
+            return jsonify({'success': False, 'error': 'Unknown custom_id'}), 404
+        if job['batch_id'] is None and job['result'] is None and job['error'] is None:
+            # 큐에 있거나 제출 중인 작업
+            return jsonify({'success': True, 'status': 'queued'})
+        
+        if job['result'] is None and job['error'] is None:
+            if not OPENAI_READY:
+                return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
+            client = get_openai_client()
+            batch = client.batches.retrieve(job['batch_id'])
+            if batch.status != 'completed':
+                return jsonify({'success': True, 'status': batch.status, 'batch_id': job['batch_id']})
+            
+            # 완료된 Batch의 결과 파일을 한 번에 저장 (같은 Batch의 다른 작업도 함께 채워짐)
+            rows = []
+            for file_id in (batch.output_file_id, batch.error_file_id):
+                if not file_id:
+                    continue
+                for line in client.files.content(file_id).text.splitlines():
+                    if not line.strip():
+                        continue
+                    item = json.loads(line)
+                    body = (item.get('response') or {}).get('body') or {}
+                    if item.get('error') or 'choices' not in body:
+                        rows.append((item['custom_id'], None, json.dumps(item.get('error') or body.get('error'), ensure_ascii=False)))
+                    else:
+                        rows.append((item['custom_id'], body['choices'][0]['message']['content'].strip(), None))
+            translation_batch_store.set_results(rows)
+            job = translation_batch_store.get_job(custom_id)
+        
+        if job['error'] is not None or job['result'] is None:
+            return jsonify({'success': False, 'status': 'failed', 'error': job['error'] or 'No result in batch output'}), 500
+        # 동기 번역(/api/translate/question)과 같은 형식 검증
+        validation_error = _translated_question_error(job['question_ko'], job['result'])
+        if validation_error:
+            return jsonify({'success': False, 'status': 'completed', 'error': validation_error}), 400
+        return jsonify({'success': True, 'status': 'completed', 'translated_question': job['result']})
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/translate/choices', methods=['POST'])
 def translate_choices():
     """Translate Korean choices to English and format as <choice> tag."""
@@ -920,16 +1792,14 @@ def translate_choices():
     
     if not all([choice_a, choice_b, choice_c, choice_d]):
         return jsonify({'success': False, 'error': 'All choices are required'}), 400
+    if _inputs_too_large(choices=(choice_a, choice_b, choice_c, choice_d)):
+        return jsonify({'success': False, 'error': INPUT_TOO_LARGE_ERROR}), 413
     
     try:
-        if not OPENAI_AVAILABLE:
-            return jsonify({'success': False, 'error': 'OpenAI library not installed. Install with: pip install openai'}), 500
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
         
-        api_key = os.getenv('OPENAI_API_KEY')
-        if not api_key:
-            return jsonify({'success': False, 'error': 'OPENAI_API_KEY environment variable not set'}), 500
-        
-        client = OpenAI(api_key=api_key)
+        client = get_openai_client()
         
         prompt = f"""Translate the following Korean multiple choice options to English. Use concise, intuitive adjective+noun or noun+noun format (NOT full sentences).
 
@@ -961,24 +1831,20 @@ Return only the formatted <choice> tag with translations."""
                 {"role": "system", "content": "You are a translator specializing in concise, intuitive translations for multiple choice options. CRITICAL: Use adjective+noun or noun+noun format (e.g., 'black shirt person', 'glasses person'), NOT full sentences. Keep translations short and intuitive."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3
+            temperature=0,
+            max_tokens=TRANSLATE_MAX_TOKENS
         )
         
         translated_choices = response.choices[0].message.content.strip()
         
         # <choice> 태그 추출
-        choice_match = re.search(r'<choice>(.*?)</choice>', translated_choices, re.IGNORECASE)
+        choice_match = _RE_CHOICE.search(translated_choices)
         if not choice_match:
             return jsonify({'success': False, 'error': 'Translation must include <choice> tag'}), 400
         
         choice_content = choice_match.group(1)
         # 각 선택지 텍스트 추출
-        choice_texts = {}
-        for letter in ['a', 'b', 'c', 'd']:
-            pattern = rf'\({letter}\)\s*([^,)]+)'
-            match = re.search(pattern, choice_content, re.IGNORECASE)
-            if match:
-                choice_texts[letter] = match.group(1).strip()
+        choice_texts = _parse_choices(choice_content)
         
         return jsonify({
             'success': True,
@@ -1024,7 +1890,13 @@ Provide a comprehensive but concise description that captures these detailed vis
             raise Exception('OPENAI_API_KEY is not set')
         
         
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        # 디스크 캐시 확인 (이미지 내용 해시 기준 - 재시작 후에도, 같은 이미지의 다른 image_id에도 재사용)
+        disk_cache_key = f"{hashlib.sha256(image_base64.encode('ascii')).hexdigest()}_{model}"
+        cached_analysis = image_analysis_disk_cache.get(disk_cache_key)
+        if cached_analysis is not None:
+            return cached_analysis
+        
+        client = get_openai_client()
         response = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{
@@ -1040,7 +1912,9 @@ Provide a comprehensive but concise description that captures these detailed vis
             temperature=0.3,
             max_tokens=1000
         )
-        return response.choices[0].message.content.strip()
+        analysis = response.choices[0].message.content.strip()
+        image_analysis_disk_cache.set(disk_cache_key, analysis)
+        return analysis
     
     else:
         raise Exception(f'Unknown model: {model}. Supported models: "openai", "gpt"')
@@ -1055,12 +1929,13 @@ def analyze_image(index):
     model = request.args.get('model', DEFAULT_MODEL).lower()
     
     # 캐시 확인 (모델별 캐시 키)
-    cache_key = f"{image_id}_{model}"
-    if cache_key in image_analysis_cache:
+    cache_key = (image_id, model)
+    cached_analysis = image_analysis_cache.get(cache_key)
+    if cached_analysis is not None:
         return jsonify({
             'success': True,
             'image_id': image_id,
-            'analysis': image_analysis_cache[cache_key],
+            'analysis': cached_analysis,
             'cached': True,
             'model': model
         })
@@ -1114,8 +1989,8 @@ def analyze_image(index):
         # 모델별 이미지 분석 수행 (CLIP-2 통합 지원)
         analysis_result = analyze_image_with_model(img_base64, model, image_path)
         
-        # 캐시에 저장 (모델별 키 사용)
-        image_analysis_cache[cache_key] = analysis_result
+        # 캐시에 저장 (모델별 키 + 번역용 image_id 키)
+        cache_image_analysis(image_id, model, analysis_result)
         
         return jsonify({
             'success': True,
@@ -1128,18 +2003,165 @@ def analyze_image(index):
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
-@app.route('/api/generate_question_and_choices', methods=['POST'])
-def generate_question_and_choices():
-    """Generate Korean question and choices using GPT-4o, after image analysis with GPT-4o."""
-    data = request.json
-    image_id = data.get('image_id', None)
-    index = data.get('index', None)
-    # 기본값은 DEFAULT_MODEL 사용
-    model = data.get('model', DEFAULT_MODEL).lower()
-    
-    if image_id is None and index is None:
-        return jsonify({'success': False, 'error': 'image_id or index is required'}), 400
-    
+def _unique_category_names(category_info):
+    """category_info에서 'unknown'을 제외한 카테고리 이름을 등장 순서대로 중복 없이 반환"""
+    seen = set()
+    for cat in category_info:
+        name = cat['category_name']
+        if name != 'unknown' and name not in seen:
+            seen.add(name)
+            yield name
+
+# 질문 생성 시스템 메시지 (세부 규칙은 사용자 프롬프트의 STEP 1-4 참조)
+QUESTION_GENERATION_SYSTEM_MESSAGE = "You are an expert VQA question generator specializing in complex, multi-hop reasoning questions. Follow STEP 1-4 in the user prompt exactly. Additionally: use ONLY objective attributes (color, shape, material) - NEVER subjective ('small', 'pretty'), and ask about concrete objects, NOT abstract properties. Generate exactly 3 questions with DIFFERENT complex structures. Return valid JSON."
+
+# 질문 생성 응답 스키마 (Structured Outputs - 서버 측에서 JSON 형식을 강제)
+QUESTION_SET_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "question_set",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "questions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "question": {"type": "string"},
+                            "choices": {
+                                "type": "object",
+                                "properties": {letter: {"type": "string"} for letter in "abcd"},
+                                "required": list("abcd"),
+                                "additionalProperties": False
+                            },
+                            "correct_answer": {"type": "string", "enum": list("abcd")}
+                        },
+                        "required": ["question", "choices", "correct_answer"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["questions"],
+            "additionalProperties": False
+        }
+    }
+}
+
+def _iter_streamed_questions(stream):
+    """스트리밍 응답에서 "questions" 배열의 항목을 완성되는 즉시 하나씩 반환"""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = None  # questions 배열 내부의 다음 파싱 위치
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        buf += chunk.choices[0].delta.content or ""
+        if pos is None:
+            key_idx = buf.find('"questions"')
+            if key_idx == -1:
+                continue
+            bracket_idx = buf.find('[', key_idx)
+            if bracket_idx == -1:
+                continue
+            pos = bracket_idx + 1
+        while True:
+            # 항목 사이의 공백/쉼표 건너뛰기
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buf) or buf[pos] == ']':
+                break
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # 아직 항목이 완성되지 않음 - 다음 청크 대기
+            pos = end
+            yield item
+
+# 규칙 위반 질문 수정용 모델 (태그/형식만 고치면 되므로 mini 사용, 실패 시 gpt-4o로 재시도)
+FIXUP_MODEL = "gpt-4o-mini"
+FIXUP_FALLBACK_MODEL = "gpt-4o"
+
+# 질문에 쓰면 안 되는 의문형 표현 (하나의 정규식으로 한 번만 스캔)
+_FORBIDDEN_QUESTION_ENDINGS = ('는?', '무엇인가요', '누구인가요')
+_RE_FORBIDDEN_QUESTION_ENDING = re.compile('|'.join(map(re.escape, _FORBIDDEN_QUESTION_ENDINGS)))
+
+def _question_violation(question):
+    """생성된 질문의 형식 규칙 위반 사유를 반환 (문제 없으면 None)"""
+    if not isinstance(question, dict):
+        return "질문이 JSON 객체가 아님"
+    text = (question.get('question') or '').strip()
+    choices = question.get('choices') or {}
+    if not text:
+        return "질문이 비어 있음"
+    if _RE_FORBIDDEN_QUESTION_ENDING.search(text):
+        return "의문사('는?', '무엇인가요?')를 사용함"
+    if not text.endswith('객체'):
+        return "질문이 '~객체'로 끝나지 않음"
+    if any(not (choices.get(letter) or '').strip() for letter in 'abcd'):
+        return "선택지 a-d 중 비어 있는 항목이 있음"
+    if question.get('correct_answer') not in ('a', 'b', 'c', 'd'):
+        return "correct_answer가 a-d 중 하나가 아님"
+    return None
+
+def _fixup_question(client, question):
+    """규칙을 위반한 질문 하나만 FIXUP_MODEL로 수정 (mini도 실패하면 gpt-4o로 한 번 더 시도)"""
+    reason = _question_violation(question)
+    if reason is None:
+        return question
+    
+    for fixup_model in (FIXUP_MODEL, FIXUP_FALLBACK_MODEL):
+        app.logger.info("질문 수정 시도 (%s): %s", fixup_model, reason)
+        try:
+            fixup_response = client.chat.completions.create(
+                model=fixup_model,
+                messages=[{
+                    "role": "user",
+                    "content": f"""다음 VQA 질문이 규칙을 위반했습니다: {reason}
+
+질문의 의미와 선택지 구성은 최대한 유지하면서 위반 사항만 수정하세요. 질문은 반드시 "~객체"로 끝나는 명사구여야 하며, 선택지는 a-d 모두 채워져 있어야 합니다. 입력과 동일한 JSON 형식(question, choices, correct_answer)으로만 응답하세요.
+
+{json.dumps(question, ensure_ascii=False)}"""
+                }],
+                temperature=0.3,
+                max_tokens=500,
+                response_format={"type": "json_object"}
+            )
+            fixed = json.loads(fixup_response.choices[0].message.content)
+        except Exception as e:
+            app.logger.warning("질문 수정 실패 (%s): %s", fixup_model, e)
+            continue
+        
+        reason = _question_violation(fixed)
+        if reason is None:
+            return fixed
+    
+    app.logger.warning("질문 수정 실패, 원본 질문 사용: %s", reason)
+    return question
+
+def _submit_fixup_question(client, question):
+    """규칙 위반 질문은 translation_executor에서 수정하는 Future 반환 (위반이 없으면 이미 완료된 Future)"""
+    if _question_violation(question) is None:
+        future = Future()
+        future.set_result(question)
+        return future
+    return translation_executor.submit(_fixup_question, client, question)
+
+@app.route('/api/generate_question_and_choices', methods=['POST'])
+def generate_question_and_choices():
+    """Generate Korean question and choices using GPT-4o, after image analysis with GPT-4o."""
+    data = request.json
+    image_id = data.get('image_id', None)
+    index = data.get('index', None)
+    # 기본값은 DEFAULT_MODEL 사용
+    model = data.get('model', DEFAULT_MODEL).lower()
+    # stream=True이면 질문이 완성되는 즉시 NDJSON으로 한 줄씩 전송
+    stream_mode = bool(data.get('stream', False))
+    
+    if image_id is None and index is None:
+        return jsonify({'success': False, 'error': 'image_id or index is required'}), 400
+    
     try:
         # image_id가 없으면 index로 찾기
         if image_id is None:
@@ -1150,9 +2172,10 @@ def generate_question_and_choices():
         # 1단계: 이미지 분석 (선택한 모델 사용) - 캐시 확인 또는 실행
         image_analysis = ""
         image_path = None  # image_path 초기화
-        cache_key = f"{image_id}_{model}"
-        if cache_key in image_analysis_cache:
-            image_analysis = image_analysis_cache[cache_key]
+        cache_key = (image_id, model)
+        cached_analysis = image_analysis_cache.get(cache_key)
+        if cached_analysis is not None:
+            image_analysis = cached_analysis
         else:
             # 이미지 분석 API 호출 (캐시에 없으면 실행)
             # index 찾기
@@ -1207,7 +2230,7 @@ def generate_question_and_choices():
             
             # 이미지 분석 수행
             image_analysis = analyze_image_with_model(img_base64, model, image_path)
-            image_analysis_cache[cache_key] = image_analysis
+            cache_image_analysis(image_id, model, image_analysis)
         
         # 2단계: COCO 어노테이션 정보 가져오기
         ann_ids = annotator.coco.getAnnIds(imgIds=image_id)
@@ -1224,17 +2247,14 @@ def generate_question_and_choices():
                 'bbox': bbox
             })
         
-        # 주요 객체 목록 생성
-        main_objects = list(set([cat['category_name'] for cat in category_info if cat['category_name'] != 'unknown']))[:10]
+        # 주요 객체 목록 생성 (등장 순서 유지, 고유 이름 10개가 모이면 즉시 중단)
+        main_objects = list(itertools.islice(_unique_category_names(category_info), 10))
         
         # 3단계: 질문 생성 (OpenAI만 사용)
-        if not OPENAI_AVAILABLE:
-            return jsonify({'success': False, 'error': 'OpenAI library not installed. Install with: pip install openai'}), 500
-        
-        if not OPENAI_API_KEY or OPENAI_API_KEY == "your-api-key-here":
-            return jsonify({'success': False, 'error': 'OPENAI_API_KEY is not set. Please set it in config.py'}), 500
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
         
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = get_openai_client()
         
         # 3-hop 질문 생성: ATT, POS, REL이 모두 포함된 복잡한 질문
         question_generation_prompt = f"""이미지와 이미지 분석 결과를 바탕으로 VQA (Visual Question Answering) 3-hop 질문을 한글로 생성해주세요.
@@ -1328,19 +2348,6 @@ def generate_question_and_choices():
   * "빨간색 객체"
   * "나무 재질의 객체"
 
-**질문 형식 예시**:
-- ✅ 올바른 예시: "테이블 위에 있는 가장 가까운 원형 또는 원통형의 객체"
-- ✅ 올바른 예시: "소파 왼쪽에 위치한 밝은 색상의 객체"
-- ✅ 올바른 예시: "싱크대 오른쪽에 있는 무채색 객체"
-- ✅ 올바른 예시: "식용 가능한 객체 중에서 포크로부터 가장 먼 객체"
-- ❌ 잘못된 예시: "소파 왼쪽에 있는 사람은 누구인가요?" (사람을 묻는 형식, "는?" 사용)
-- ❌ 잘못된 예시: "테이블 위에 있는 것은 무엇인가요?" (ATT 속성 미명시, "는 무엇인가요?" 사용)
-- ❌ 잘못된 예시: "가장 가까운 것은?" (ATT 속성 미명시, "는?" 사용)
-- ❌ 잘못된 예시: "가장 가까운 객체는?" ("는?" 사용 금지)
-- ❌ 잘못된 예시: "가장 가까운 객체는 무엇인가요?" ("는 무엇인가요?" 사용 금지)
-
-**중요**: 질문은 반드시 ATT 속성을 포함한 "~객체"로 끝나야 하며, "는?", "는 무엇인가요?" 같은 의문사는 절대 사용하지 마세요. 질문은 "~객체"로 끝나는 명사구 형태여야 합니다.
-
 **STEP 3: 소거법을 위한 선택지 설계 및 검증 (고급 추론 능력 요구)**
 
 🚨 **CRITICAL - 고급 추론 능력 요구를 위한 선택지 구성 (절대 필수)**:
@@ -1450,91 +2457,11 @@ def generate_question_and_choices():
    - ❌ 나쁜 예: "밝은 색상의 의자", "밝은 색상의 벤치", "밝은 색상의 식탁", "밝은 색상의 쓰레기통" (모두 같은 속성)
    - ✅ 좋은 예: "glass", "potato fries", "hamburger", "cell phone" (다양한 속성과 카테고리)
 
-**중요**: 위 예시들을 참고하여:
-1. **복잡한 질문 구조**: 단순한 "X 오른쪽에 있는 가장 가까운 Y 객체" 형식은 절대 사용하지 마세요
-2. **중첩된 조건**: 여러 조건이 동시에 적용되는 질문을 생성하세요
-3. **다양한 제외 이유**: 각 선택지가 서로 다른 이유로 제외되도록 구성하세요
-4. **ATT 조건 만족 객체 최소 2개**: 고급 추론이 필요하도록 선택지를 구성하세요
-
-**출력 형식 (반드시 JSON 형식으로, 정확히 3개만 생성)**:
-
-🚨 **CRITICAL**: 모든 질문은 반드시 "~객체"로 끝나야 합니다. "는?", "는 무엇인가요?" 같은 의문사는 절대 사용하지 마세요.
-
-{{
-  "questions": [
-    {{
-      "question": "첫 번째 3-hop 한글 질문 (ATT는 속성 기반 표현, POS는 구체적 객체 기준, REL 포함, 소거법 가능한 선택지 구성, ATT 조건 만족 객체 최소 2개 이상, 반드시 '~객체'로 끝남, '는?' 또는 '는 무엇인가요?' 사용 금지)",
-      "choices": {{
-        "a": "선택지 a (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "b": "선택지 b (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "c": "선택지 c (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "d": "선택지 d (한글, 정답, ATT 조건 만족 객체 중 하나)"
-      }},
-      "correct_answer": "a"
-    }},
-    {{
-      "question": "두 번째 3-hop 한글 질문 (첫 번째와 다른 구조/조합, ATT는 속성 기반 표현, ATT 조건 만족 객체 최소 2개 이상, 반드시 '~객체'로 끝남, '는?' 또는 '는 무엇인가요?' 사용 금지)",
-      "choices": {{
-        "a": "선택지 a (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "b": "선택지 b (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "c": "선택지 c (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "d": "선택지 d (한글, 정답, ATT 조건 만족 객체 중 하나)"
-      }},
-      "correct_answer": "b"
-    }},
-    {{
-      "question": "세 번째 3-hop 한글 질문 (앞의 두 질문과 다른 구조/조합, ATT는 속성 기반 표현, ATT 조건 만족 객체 최소 2개 이상, 반드시 '~객체'로 끝남, '는?' 또는 '는 무엇인가요?' 사용 금지)",
-      "choices": {{
-        "a": "선택지 a (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "b": "선택지 b (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "c": "선택지 c (한글, 소거 가능한 이유가 명확해야 함, 동일 물체 중복 금지)",
-        "d": "선택지 d (한글, 정답, ATT 조건 만족 객체 중 하나)"
-      }},
-      "correct_answer": "c"
-    }}
-  ]
-}}
-
-**질문 형식 예시 (반드시 참고)**:
-
-**❌ 절대 금지 - 너무 단순한 질문**:
-- "테이블 위에 있는 가장 가까운 원형 또는 원통형의 객체" (단순 위치+속성)
-- "소파 왼쪽에 위치한 밝은 색상의 객체" (단순 위치+속성)
-- "싱크대 오른쪽에 있는 무채색 객체" (단순 위치+속성)
-- "소파 왼쪽에 있는 사람은 누구인가요?" (금지 - "는 누구인가요?" 사용)
-- "테이블 위에 있는 것은 무엇인가요?" (금지 - ATT 속성 미명시, "는 무엇인가요?" 사용)
-- "가장 가까운 것은?" (금지 - ATT 속성 미명시, "는?" 사용)
-
-**✅ 반드시 사용 - 복잡하고 고급 추론이 필요한 질문**:
-- "식용 가능한 객체 중에서 포크로부터 가장 먼 객체" (ATT + REL + 기준점)
-- "테이블 위에 있는 원형 또는 원통형 객체 중에서 사람으로부터 가장 먼 객체" (POS + ATT + REL)
-- "소파 왼쪽에 있는 밝은 색상의 객체 중에서 창문으로부터 가장 가까운 객체" (POS + ATT + REL)
-- "식용 가능한 객체 중에서 포크 왼쪽에 있는 가장 먼 객체" (ATT + POS + REL)
-- "테이블 중앙에 있는 원형 또는 원통형 객체 중에서 사람 앞에 있는 가장 가까운 객체" (POS + ATT + POS + REL)
-- "식용 가능한 객체 중에서 테이블 왼쪽에 있는 포크로부터 가장 먼 객체" (ATT + POS + REL)
-
-🚨 **최종 검증 체크리스트 (생성 전 반드시 확인)**:
-
-**질문 복잡도 검증**:
-- [ ] 질문이 단순한 "X 오른쪽에 있는 가장 가까운 Y 객체" 형식이 아닌가? (이런 형식은 절대 금지)
-- [ ] 질문에 중첩된 조건이나 복잡한 공간 관계가 포함되어 있는가?
-- [ ] 각 질문에 ATT, POS, REL이 모두 포함되어 있고, 서로 복잡하게 얽혀있는가?
-
-**질문 형식 검증**:
-- [ ] **CRITICAL**: 질문이 "~객체"로 끝나는가? ("는?", "는 무엇인가요?", "~사람은 누구인가요?", "것은 무엇인가요?" 형식 금지)
-- [ ] ATT 태그에 구체적 명사("컵", "접시" 등)가 아닌 속성 기반 표현("원형 또는 원통형 객체" 등)을 사용했는가?
-- [ ] ATT 속성이 실제 이미지의 객체와 정확히 일치하는가?
-- [ ] POS 표현이 구체적 객체 기준인가? ("이미지 중앙" 대신 "테이블 중앙" 등)
-- [ ] 위치 반전 규칙을 적용했는가? (실제 왼쪽 → 질문에서는 오른쪽)
-
-**선택지 구성 검증**:
-- [ ] 질문의 ATT 조건을 만족하는 객체가 선택지에 최소 2개 이상 있는가? (고급 추론 능력 요구)
-- [ ] 각 선택지는 서로 다른 이유로 제외될 수 있는가? (ATT 불만족, POS 불만족, REL 불만족 등)
-- [ ] 선택지에 동일한 물체가 중복되지 않았는가?
-- [ ] 선택지의 모든 객체가 이미지에 실제로 존재하는가?
-- [ ] 선택지가 다양한 카테고리와 속성을 포함하고 있는가? (모두 같은 속성의 객체가 아닌가?)
+**출력 형식**: 지정된 JSON 스키마에 맞춰 정확히 3개의 질문을 생성하세요. 세 질문은 서로 다른 구조/조합이어야 합니다.
+
+🚨 **최종 검증**: 생성 전 STEP 1-4의 규칙과 각 검증 체크리스트를 다시 확인하세요.
 
-**중요**: 정확히 3개의 질문만 생성하고, 각 질문은 반드시 위의 모든 규칙을 준수해야 합니다. 반드시 유효한 JSON 형식으로 응답하세요."""
+**중요**: 정확히 3개의 질문만 생성하고, 각 질문은 반드시 위의 모든 규칙을 준수해야 합니다."""
 
         # RateLimitError 처리: 재시도 로직 포함
         max_retries = 5
@@ -1543,25 +2470,31 @@ def generate_question_and_choices():
         generation_response = None
         generated_content = None
         
+        # 메시지는 재시도 간에 동일하므로 루프 밖에서 한 번만 구성
+        generation_messages = [
+            {
+                "role": "system",
+                "content": QUESTION_GENERATION_SYSTEM_MESSAGE
+            },
+            {
+                "role": "user",
+                "content": question_generation_prompt
+            }
+        ]
+        
         for attempt in range(max_retries):
             try:
                 generation_response = client.chat.completions.create(
                     model="gpt-4o",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert VQA question generator specializing in complex, multi-hop reasoning questions. CRITICAL RULES: 1) Each question MUST include ATT (attribute), POS (position), REL (relationship) in a COMPLEX, INTERWOVEN manner - NOT simple patterns like 'X right side, closest Y object'. 2) Questions MUST require advanced reasoning with nested conditions, multiple spatial relationships, or complex attribute combinations. 3) Use ONLY objects that actually exist in the image. 4) Choices must be clearly distinguishable and diverse (use color, position: 'red cup', 'leftmost chair'). 5) For POS, use specific object references ('center of table', NOT 'center of image'). 6) Reverse left/right positions in questions. 7) Use ONLY objective attributes (color, shape, material) - NEVER subjective ('small', 'pretty'). 8) Ask about concrete objects, NOT abstract properties. 9) At least 2 choices MUST satisfy the ATT condition to require advanced reasoning. 10) Each choice should be excluded for DIFFERENT reasons (ATT failure, POS failure, REL failure, etc.). 11) Generate exactly 3 questions with DIFFERENT complex structures. Return valid JSON."
-                        },
-                        {
-                            "role": "user",
-                            "content": question_generation_prompt
-                        }
-                    ],
+                    messages=generation_messages,
                     temperature=0.5,
                     max_tokens=2000,
-                    response_format={"type": "json_object"}
+                    response_format=QUESTION_SET_RESPONSE_FORMAT,
+                    stream=stream_mode
                 )
                 
+                if stream_mode:
+                    break  # 스트림 본문은 아래 제너레이터에서 소비
                 generated_content = generation_response.choices[0].message.content.strip()
                 break  # 성공하면 루프 종료
                 
@@ -1586,10 +2519,36 @@ def generate_question_and_choices():
                     }), 429
             except Exception as e:
                 # RateLimitError가 아닌 다른 에러는 즉시 반환
-                import traceback
-                traceback.print_exc()
+                app.logger.exception("OpenAI question generation failed")
                 return jsonify({'success': False, 'error': f'OpenAI question generation failed: {str(e)}'}), 500
         
+        if stream_mode and generation_response is not None:
+            def question_line(question):
+                return json.dumps({'success': True, 'image_id': image_id, 'question': question}, ensure_ascii=False) + '\n'
+            
+            def generate():
+                count = 0
+                # 규칙 위반 질문은 수정 중에도 스트림을 계속 읽고, 전송은 생성 순서대로
+                pending = deque()
+                try:
+                    for question in _iter_streamed_questions(generation_response):
+                        if count >= 3:
+                            break  # 정확히 3개만 전송
+                        count += 1
+                        pending.append(_submit_fixup_question(client, question))
+                        while pending and pending[0].done():
+                            yield question_line(pending.popleft().result())
+                    while pending:
+                        yield question_line(pending.popleft().result())
+                except Exception as e:
+                    app.logger.error("질문 스트리밍 실패: %s", e)
+                    yield json.dumps({'success': False, 'error': f'OpenAI question generation failed: {str(e)}'}, ensure_ascii=False) + '\n'
+                    return
+                if count < 3:
+                    yield json.dumps({'success': False, 'error': f'Expected 3 questions but got {count}'}, ensure_ascii=False) + '\n'
+            
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+        
         if generated_content is None:
             return jsonify({
                 'success': False,
@@ -1598,7 +2557,6 @@ def generate_question_and_choices():
         
         # JSON 파싱
         try:
-            import json
             generated_data = json.loads(generated_content)
             questions = generated_data.get('questions', [])
             
@@ -1611,6 +2569,10 @@ def generate_question_and_choices():
             elif len(questions) < 3:
                 return jsonify({'success': False, 'error': f'Expected 3 questions but got {len(questions)}'}), 500
             
+            # 규칙 위반 질문은 저비용 모델로 개별 수정 (translation_executor에서 동시에)
+            fixup_futures = [_submit_fixup_question(client, q) for q in questions]
+            questions = [future.result() for future in fixup_futures]
+            
             return jsonify({
                 'success': True,
                 'image_id': image_id,
@@ -1619,62 +2581,13 @@ def generate_question_and_choices():
         except json.JSONDecodeError as e:
             return jsonify({'success': False, 'error': f'Failed to parse JSON: {str(e)}', 'raw_response': generated_content}), 500
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("OpenAI question generation failed")
         return jsonify({'success': False, 'error': f'OpenAI question generation failed: {str(e)}'}), 500
 
-@app.route('/api/translate/question_and_choices', methods=['POST'])
-def translate_question_and_choices():
-    """Translate Korean question and choices to English together using GPT-5, with image analysis context."""
-    data = request.json
-    question_ko = data.get('question_ko', '').strip()
-    choice_a = data.get('choice_a', '').strip()
-    choice_b = data.get('choice_b', '').strip()
-    choice_c = data.get('choice_c', '').strip()
-    choice_d = data.get('choice_d', '').strip()
-    image_id = data.get('image_id', None)  # 이미지 ID 추가
-    view_type = data.get('view_type', 'exo')  # 'exo' or 'ego'
-    
-    if not question_ko:
-        return jsonify({'success': False, 'error': 'Question (Korean) is required'}), 400
-    
-    if not all([choice_a, choice_b, choice_c, choice_d]):
-        return jsonify({'success': False, 'error': 'All choices are required'}), 400
-    
-    try:
-        if not OPENAI_AVAILABLE:
-            return jsonify({'success': False, 'error': 'OpenAI library not installed. Install with: pip install openai'}), 500
-        
-        if not OPENAI_API_KEY or OPENAI_API_KEY == "your-api-key-here":
-            return jsonify({'success': False, 'error': 'OPENAI_API_KEY is not set. Please set it in coco_web_annotator.py'}), 500
-        
-        client = OpenAI(api_key=OPENAI_API_KEY)
-        
-        # 이미지 분석 결과 가져오기 (캐시에서만 확인)
-        # 프론트엔드에서 이미 분석을 수행하므로 여기서는 캐시만 확인
-        # 캐시 키는 "image_id_model" 형식이므로 모든 모델의 캐시를 확인
-        image_analysis = ""
-        if image_id:
-            # 기본 모델부터 확인
-            for model_name in [DEFAULT_MODEL, 'openai']:
-                cache_key = f"{image_id}_{model_name}"
-                if cache_key in image_analysis_cache:
-                    image_analysis = image_analysis_cache[cache_key]
-                    break
-        
-        # Question과 Choices를 함께 번역하는 프롬프트 (이미지 분석 결과 포함)
-        image_context = ""
-        if image_analysis:
-            image_context = f"""
-
-IMAGE ANALYSIS CONTEXT:
-{image_analysis}
+# translate_question_and_choices 프롬프트 (정적 텍스트는 모듈 상수로 두고 요청마다 가변 부분만 이어 붙임)
+TRANSLATE_QC_PROMPT_EGO_HEAD = """Translate the following Korean question and multiple choice options to English. You MUST follow this EXACT format for EGO-CENTRIC questions:"""
 
-Use this image analysis to better understand the context and spatial relationships mentioned in the Korean question. The analysis includes detailed features like colors, positions, orientations, and spatial relationships of objects in the image. Use this information to create more accurate <ATT>, <POS>, and <REL> tags that match the actual visual content."""
-        
-        # view_type에 따라 다른 프롬프트 사용
-        if view_type == 'ego':
-            prompt = f"""Translate the following Korean question and multiple choice options to English. You MUST follow this EXACT format for EGO-CENTRIC questions:{image_context}
+TRANSLATE_QC_PROMPT_EGO_BODY = """
 
 CORRECT FORMAT FOR EGO-CENTRIC QUESTIONS:
 [Question with <ATT>, <POS>, <REL> tags embedded naturally in the sentence] <choice>(a) option1, (b) option2, (c) option3, (d) option4</choice> And provide the bounding box coordinate of the region related to your answer.
@@ -1732,13 +2645,9 @@ Example 2: "When I'm sitting on the right side of the large sofa, which <ATT>squ
 
 Example 3: "From the perspective of the woman, which <ATT>silver object</ATT> <POS>to the right of</POS> her is <REL>closest to her</REL>? <choice>(a) fork, (b) knife, (c) spoon, (d) wine glass</choice> And provide the bounding box coordinate of the region related to your answer."
 
-Korean question: {question_ko}
+Korean question: """
 
-Korean choices:
-(a) {choice_a}
-(b) {choice_b}
-(c) {choice_c}
-(d) {choice_d}
+TRANSLATE_QC_PROMPT_EGO_TAIL = """
 
 CRITICAL - Choice Translation Format:
 - Use concise, intuitive adjective+noun or noun+noun format (NOT full sentences)
@@ -1767,8 +2676,10 @@ Translate the Korean question and choices to English following the EXACT format
 - DO NOT use generic phrases like "in the image" for <POS> tag
 - Choices are in concise adjective+noun or noun+noun format
 - DOUBLE-CHECK: Before finalizing, verify that ALL attribute descriptions are wrapped in <ATT> tags"""
-        else:
-            prompt = f"""Translate the following Korean question and multiple choice options to English. You MUST follow this EXACT format:{image_context}
+
+TRANSLATE_QC_PROMPT_EXO_HEAD = """Translate the following Korean question and multiple choice options to English. You MUST follow this EXACT format:"""
+
+TRANSLATE_QC_PROMPT_EXO_BODY = """
 
 CORRECT FORMAT:
 [Question with <ATT>, <POS>, <REL> tags embedded naturally in the sentence] <choice>(a) option1, (b) option2, (c) option3, (d) option4</choice> And provide the bounding box coordinate of the region related to your answer.
@@ -1822,13 +2733,9 @@ Example 3: "Which <ATT>round and cylindrical object</ATT> is <REL>farthest</REL>
 
 Example 4: "Which <ATT>edible food item</ATT> is the <REL>farthest</REL> from the fork <POS>on the left side of</POS> the table? <choice>(a) glass, (b) potato fries, (c) hamburger, (d) cell phone</choice> And provide the bounding box coordinate of the region related to your answer."
 
-Korean question: {question_ko}
+Korean question: """
 
-Korean choices:
-(a) {choice_a}
-(b) {choice_b}
-(c) {choice_c}
-(d) {choice_d}
+TRANSLATE_QC_PROMPT_EXO_TAIL = """
 
 CRITICAL - Choice Translation Format:
 - Use concise, intuitive adjective+noun or noun+noun format (NOT full sentences)
@@ -1855,35 +2762,120 @@ Translate the Korean question and choices to English following the EXACT format
 - DO NOT use generic phrases like "in the image" for <POS> tag
 - Choices are in concise adjective+noun or noun+noun format
 - DOUBLE-CHECK: Before finalizing, verify that ALL attribute descriptions are wrapped in <ATT> tags"""
+
+# 이미지 분석 결과를 감싸는 정적 텍스트 (요청마다 f-string을 새로 만들지 않고 분석 결과만 끼워 넣음)
+IMAGE_CONTEXT_HEAD = """
+
+IMAGE ANALYSIS CONTEXT:
+"""
+
+TRANSLATE_QC_IMAGE_CONTEXT_TAIL = """
+
+Use this image analysis to better understand the context and spatial relationships mentioned in the Korean question. The analysis includes detailed features like colors, positions, orientations, and spatial relationships of objects in the image. Use this information to create more accurate <ATT>, <POS>, and <REL> tags that match the actual visual content."""
+
+# view_type별 시스템 메시지
+TRANSLATE_QC_SYSTEM_MESSAGES = {
+    'ego': "You are a professional translator specializing in VQA (Visual Question Answering) EGO-CENTRIC questions. CRITICAL RULES: 1) Use 'From the perspective of ~' for '~관점에서', 2) Use 'When I'm ~' for '내가', 3) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 4) <POS> tag ONLY for position/location from person's perspective (on the left side, on the right side, etc.), 5) <ATT> tag ONLY for attributes/target groups (round object, green object, etc.), 6) Tags MUST contain actual meaningful content, 7) Format: [Question with tags] <choice>...</choice> And provide... (choice tag BEFORE 'And provide' phrase), 8) DO NOT use generic phrases like 'in the image' for <POS> tag, 9) Choices MUST be in concise adjective+noun or noun+noun format (e.g., 'black shirt person', 'glasses person'), NOT full sentences.",
+    'exo': "You are a professional translator specializing in VQA (Visual Question Answering) questions. CRITICAL RULES: 1) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 2) <POS> tag ONLY for position/location (in the center, on the left side, etc.), 3) <ATT> tag ONLY for attributes/target groups (red object, among the items, etc.), 4) Tags MUST contain actual meaningful content, 5) Format: [Question with tags] <choice>...</choice> And provide... (choice tag BEFORE 'And provide' phrase), 6) DO NOT use generic phrases like 'in the image' for <POS> tag, 7) Choices MUST be in concise adjective+noun or noun+noun format (e.g., 'black shirt person', 'glasses person'), NOT full sentences."
+}
+
+@app.route('/api/translate/question_and_choices', methods=['POST'])
+def translate_question_and_choices(data=None):
+    """Translate Korean question and choices to English together using GPT-5, with image analysis context."""
+    if data is None:
+        data = request.json
+    question_ko = data.get('question_ko', '').strip()
+    choice_a = data.get('choice_a', '').strip()
+    choice_b = data.get('choice_b', '').strip()
+    choice_c = data.get('choice_c', '').strip()
+    choice_d = data.get('choice_d', '').strip()
+    image_id = data.get('image_id', None)  # 이미지 ID 추가
+    view_type = data.get('view_type', 'exo')  # 'exo' or 'ego'
+    
+    if not question_ko:
+        return jsonify({'success': False, 'error': 'Question (Korean) is required'}), 400
+    
+    if not all([choice_a, choice_b, choice_c, choice_d]):
+        return jsonify({'success': False, 'error': 'All choices are required'}), 400
+    if _inputs_too_large((question_ko,), (choice_a, choice_b, choice_c, choice_d)):
+        return jsonify({'success': False, 'error': INPUT_TOO_LARGE_ERROR}), 413
+    
+    try:
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
         
-        # view_type에 따라 다른 시스템 메시지 사용
-        if view_type == 'ego':
-            system_message = "You are a professional translator specializing in VQA (Visual Question Answering) EGO-CENTRIC questions. CRITICAL RULES: 1) Use 'From the perspective of ~' for '~관점에서', 2) Use 'When I'm ~' for '내가', 3) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 4) <POS> tag ONLY for position/location from person's perspective (on the left side, on the right side, etc.), 5) <ATT> tag ONLY for attributes/target groups (round object, green object, etc.), 6) Tags MUST contain actual meaningful content, 7) Format: [Question with tags] <choice>...</choice> And provide... (choice tag BEFORE 'And provide' phrase), 8) DO NOT use generic phrases like 'in the image' for <POS> tag, 9) Choices MUST be in concise adjective+noun or noun+noun format (e.g., 'black shirt person', 'glasses person'), NOT full sentences."
-        else:
-            system_message = "You are a professional translator specializing in VQA (Visual Question Answering) questions. CRITICAL RULES: 1) <REL> tag ONLY for relationship terms (farthest, closest, etc.), 2) <POS> tag ONLY for position/location (in the center, on the left side, etc.), 3) <ATT> tag ONLY for attributes/target groups (red object, among the items, etc.), 4) Tags MUST contain actual meaningful content, 5) Format: [Question with tags] <choice>...</choice> And provide... (choice tag BEFORE 'And provide' phrase), 6) DO NOT use generic phrases like 'in the image' for <POS> tag, 7) Choices MUST be in concise adjective+noun or noun+noun format (e.g., 'black shirt person', 'glasses person'), NOT full sentences."
+        client = get_openai_client()
         
-        response = client.chat.completions.create(
+        # 이미지 분석 결과 가져오기 (캐시에서만 확인)
+        # 프론트엔드에서 이미 분석을 수행하므로 여기서는 캐시만 확인
+        # latest_image_analysis에는 모델과 무관하게 가장 최근 분석 결과가 저장됨
+        image_analysis = latest_image_analysis.get(image_id, "") if image_id else ""
+        
+        # Question과 Choices를 함께 번역하는 프롬프트 (이미지 분석 결과 포함)
+        image_context = ""
+        if image_analysis:
+            image_context = "".join((IMAGE_CONTEXT_HEAD, image_analysis, TRANSLATE_QC_IMAGE_CONTEXT_TAIL))
+        
+        # view_type에 따라 다른 프롬프트/시스템 메시지 사용
+        cfg = get_view_config(view_type)
+        prompt_head, prompt_body, prompt_tail = cfg['qc_prompt']
+        prompt = "".join((
+            prompt_head,
+            image_context,
+            prompt_body,
+            question_ko,
+            f"\n\nKorean choices:\n(a) {choice_a}\n(b) {choice_b}\n(c) {choice_c}\n(d) {choice_d}",
+            prompt_tail
+        ))
+        system_message = cfg['qc_system']
+        
+        # 스트리밍으로 받으면서 복구 불가능한 형식 위반은 생성 도중에 바로 중단 (불필요한 토큰/대기 시간 절약)
+        stream = client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": system_message},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3
+            temperature=0,
+            max_tokens=TRANSLATE_MAX_TOKENS,
+            stream=True
         )
         
-        translated_question = response.choices[0].message.content.strip()
+        buf = []
+        choice_seen = False
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buf.append(delta)
+                # 태그 또는 문장이 끝나는 청크에서만 누적 텍스트 검사
+                if not choice_seen and ('>' in delta or '.' in delta):
+                    partial = ''.join(buf)
+                    if '<choice>' in partial:
+                        choice_seen = True
+                    elif REQUIRED_PHRASE in partial:
+                        # 종료 문구가 <choice> 태그보다 먼저 나오면 형식 위반 (모델은 종료 문구 뒤에서 응답을 끝냄)
+                        print("[WARN] 번역 스트림 조기 중단: <choice> 태그 전에 종료 문구 생성됨")
+                        return jsonify({'success': False, 'error': 'The phrase "And provide the bounding box coordinate..." must come AFTER the <choice> tag'}), 400
+        finally:
+            stream.close()
+        
+        translated_question = ''.join(buf).strip()
         
         # 태그 검증 - 빈 태그 확인 (내용이 있는 태그만 유효)
-        has_valid_att = bool(re.search(r'<ATT>[^<]+</ATT>', translated_question, re.IGNORECASE))
-        has_valid_pos = bool(re.search(r'<POS>[^<]+</POS>', translated_question, re.IGNORECASE))
-        has_valid_rel = bool(re.search(r'<REL>[^<]+</REL>', translated_question, re.IGNORECASE))
+        translated_lower = translated_question.lower()
+        has_valid_att = _has_nonempty_tag(translated_lower, 'att')
+        has_valid_pos = _has_nonempty_tag(translated_lower, 'pos')
+        has_valid_rel = _has_nonempty_tag(translated_lower, 'rel')
         
         if not (has_valid_att or has_valid_pos or has_valid_rel):
             return jsonify({'success': False, 'error': 'Translation must include at least one of <ATT>, <POS>, or <REL> tags with actual content inside them'}), 400
         
         # ATT 태그 누락 검증 강화: 한국어 질문에 속성 단어가 있는데 ATT 태그가 없는 경우
-        attribute_keywords_ko = ['흰색', '빨간색', '파란색', '초록색', '검은색', '노란색', '원형', '정사각형', '직사각형', '사람', '객체', '물체', '색', '모양', '재질']
-        question_has_attribute = any(keyword in question_ko for keyword in attribute_keywords_ko)
+        question_has_attribute = _RE_ATTRIBUTE_KO.search(question_ko) is not None
         if question_has_attribute and not has_valid_att:
             return jsonify({
                 'success': False, 
@@ -1893,26 +2885,18 @@ Translate the Korean question and choices to English following the EXACT format
         if '<choice>' not in translated_question:
             return jsonify({'success': False, 'error': 'Translation must include <choice> tag'}), 400
         
-        # "And provide..." 문구가 <choice> 태그 뒤에 있는지 확인
-        choice_match = re.search(r'<choice>.*?</choice>', translated_question, re.IGNORECASE | re.DOTALL)
-        if choice_match:
-            choice_end_pos = choice_match.end()
-            if 'And provide the bounding box coordinate of the region related to your answer.' not in translated_question[choice_end_pos:]:
+        # "And provide..." 문구가 <choice> 태그 뒤에 있는지 확인 (정규식 대신 partition 한 번으로 분리)
+        _, choice_close, after_choice = translated_question.partition('</choice>')
+        if choice_close:
+            if REQUIRED_PHRASE not in after_choice:
                 return jsonify({'success': False, 'error': 'The phrase "And provide the bounding box coordinate..." must come AFTER the <choice> tag'}), 400
         else:
-            if 'And provide the bounding box coordinate of the region related to your answer.' not in translated_question:
+            if REQUIRED_PHRASE not in translated_question:
                 return jsonify({'success': False, 'error': 'Translation must include the required ending phrase'}), 400
         
         # <choice> 태그에서 각 선택지 텍스트 추출
-        choice_match = re.search(r'<choice>(.*?)</choice>', translated_question, re.IGNORECASE)
-        choice_texts = {}
-        if choice_match:
-            choice_content = choice_match.group(1)
-            for letter in ['a', 'b', 'c', 'd']:
-                pattern = rf'\({letter}\)\s*([^,)]+)'
-                match = re.search(pattern, choice_content, re.IGNORECASE)
-                if match:
-                    choice_texts[letter] = match.group(1).strip()
+        choice_match = _RE_CHOICE.search(translated_question)
+        choice_texts = _parse_choices(choice_match.group(1)) if choice_match else {}
         
         # 번역 결과에서 앞뒤 대괄호 제거
         cleaned_question = translated_question.strip()
@@ -1920,14 +2904,9 @@ Translate the Korean question and choices to English following the EXACT format
         if cleaned_question.startswith('[') and cleaned_question.endswith(']'):
             # 전체가 대괄호로 감싸져 있는 경우만 제거
             cleaned_question = cleaned_question[1:-1].strip()
-        elif cleaned_question.startswith('['):
-            # 앞에만 대괄호가 있는 경우 제거
-            cleaned_question = re.sub(r'^\[+\s*', '', cleaned_question).strip()
         
-        # "?" 뒤의 "]" 제거
-        cleaned_question = re.sub(r'\?\s*\]+\s*', '? ', cleaned_question)
-        # 문장 끝의 "]" 제거 (choice 태그 앞)
-        cleaned_question = re.sub(r'\]+\s*(?=<choice>)', ' ', cleaned_question, flags=re.IGNORECASE)
+        # 앞에만 있는 "[", "?" 뒤의 "]", 문장 끝(choice 태그 앞)의 "]"를 한 번의 치환으로 제거
+        cleaned_question = _RE_QUESTION_BRACKETS.sub(_replace_question_bracket, cleaned_question)
         
         return jsonify({
             'success': True,
@@ -1937,71 +2916,158 @@ Translate the Korean question and choices to English following the EXACT format
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# translate_rationale 프롬프트 (정적 텍스트는 모듈 상수로 두고 요청마다 가변 부분만 이어 붙임)
+TRANSLATE_RATIONALE_PROMPT_EGO_HEAD = """Translate the following Korean rationale to English. Follow these CRITICAL requirements for EGO-CENTRIC rationales:"""
+
+TRANSLATE_RATIONALE_PROMPT_EGO_BODY = """
+
+REQUIREMENTS FOR EGO-CENTRIC RATIONALES:
+1. The rationale MUST start with "The question is ego-centric:"
+2. Use elimination method format: explain why incorrect choices are excluded, then explain why the correct answer is right
+3. The translation must be at least 2 sentences long
+4. Make it natural, grammatically correct, and detailed
+5. Use the image analysis context to create accurate descriptions of spatial relationships and object positions FROM THE PERSON'S PERSPECTIVE
+6. DO NOT include any bounding box coordinates (x1, y1, x2, y2) or coordinate information in the rationale
+7. When the Korean rationale mentions choice letters (a, b, c, d), translate them to the corresponding English choice text from the question
+8. CRITICAL: End the rationale with a simple "Therefore" statement. DO NOT add additional explanatory clauses after "Therefore" such as "as it is...", "because it is...", "since it is...", or any descriptive phrases that repeat information already stated
+9. IMPORTANT: When describing spatial relationships, always clarify the perspective (e.g., "From the person's perspective, the right side corresponds to the left side of the image")
+
+Reference examples from ego_data_sample.json:
+
+Example 1: "The question is ego-centric: The little girl in front of the man has her right side corresponding to the left side of the image. The cake and the camera are positioned in front of her, and the party plate is on her left side. Therefore, the flower is the farthest among the party items."
+
+Example 2: "The question is ego-centric: From the person's perspective, sitting on the right side of the large sofa corresponds to sitting on the left side of the large sofa in the image, and the person's right side aligns with the left side of the image. The large bottle and shoe are located on the person's left side, while the fan is on the right but is not a square-shaped object. Therefore, the TV is the correct answer."
+
+Example 3: "The question is ego-centric: From the woman's perspective, her right side corresponds to the left side of the image. The fork and knife are located on her left side, so they can be excluded. The wine glass, while positioned on the correct side, is made of glass and not a silver object. Therefore, the correct answer is the spoon."
+
+Korean rationale: """
+
+TRANSLATE_RATIONALE_PROMPT_EGO_TAIL = """
+
+Translate to English following the format and style of ego_data_sample.json examples."""
+
+TRANSLATE_RATIONALE_PROMPT_EXO_HEAD = """Translate the following Korean rationale to English. Follow these CRITICAL requirements:"""
+
+TRANSLATE_RATIONALE_PROMPT_EXO_BODY = """
+
+REQUIREMENTS:
+1. The rationale MUST start with "The question is exo-centric:"
+2. Use elimination method format: explain why incorrect choices are excluded, then explain why the correct answer is right
+3. The translation must be at least 2 sentences long
+4. Make it natural, grammatically correct, and detailed
+5. Use the image analysis context to create accurate descriptions of spatial relationships and object positions
+6. DO NOT include any bounding box coordinates (x1, y1, x2, y2) or coordinate information in the rationale
+7. When the Korean rationale mentions choice letters (a, b, c, d), translate them to the corresponding English choice text from the question
+8. CRITICAL: End the rationale with a simple "Therefore" statement. DO NOT add additional explanatory clauses after "Therefore" such as "as it is...", "because it is...", "since it is...", or any descriptive phrases that repeat information already stated
+
+Reference examples from exo_data_sample.json:
+
+Example 1: "The question is exo-centric: The sink is placed immediately adjacent to the refrigerator, making it the closest. The vase sits slightly forward on the counter, farther than the sink but clearly closer than the orange bag at the far right edge and the red chair in the front seating area. Therefore the vase is second-closest."
+
+Example 2: "The question is exo-centric: The laptop and the cell phone are located on the sofa near the brown-haired man, while the handbag is placed on the floor near his feet. The coke bottle is also on the floor, but it is cylindrical, not square-shaped. Therefore the handbag is the only square-shaped object on the floor."
+
+Korean rationale: """
+
+TRANSLATE_RATIONALE_PROMPT_EXO_TAIL = """
+
+Translate to English following the format and style of exo_data_sample.json examples."""
+
+# question_type별 시스템 메시지
+TRANSLATE_RATIONALE_SYSTEM_MESSAGES = {
+    question_type: f"You are a professional translator specializing in VQA (Visual Question Answering) rationales. Always start with 'The question is {question_type}:' and use elimination method format with at least 2 sentences. Never include bounding box coordinates. When Korean rationale mentions choice letters (a, b, c, d) or Korean choice text, translate them to the corresponding English choice text. CRITICAL: End with a simple 'Therefore' statement - do NOT add additional explanatory clauses like 'as it is...', 'because it is...', or 'since it is...' after the 'Therefore' sentence."
+    for question_type in ("exo-centric", "ego-centric")
+}
+
+TRANSLATE_RATIONALE_IMAGE_CONTEXT_TAIL = """
+
+Use this image analysis to better understand the visual context and spatial relationships when translating the rationale."""
+
+# view_type별로 요청마다 바뀌지 않는 설정 (프롬프트 조각, 시스템 메시지, question_type)
+# 알 수 없는 view_type은 기존 기본값과 동일하게 exo 설정 사용
+VIEW_CONFIG = {
+    'ego': {
+        'question_type': "ego-centric",
+        'question_prompt': (TRANSLATE_QUESTION_PROMPT_EGO_HEAD, TRANSLATE_QUESTION_PROMPT_EGO_TAIL),
+        'question_system': TRANSLATE_QUESTION_SYSTEM_MESSAGES['ego'],
+        'qc_prompt': (TRANSLATE_QC_PROMPT_EGO_HEAD, TRANSLATE_QC_PROMPT_EGO_BODY, TRANSLATE_QC_PROMPT_EGO_TAIL),
+        'qc_system': TRANSLATE_QC_SYSTEM_MESSAGES['ego'],
+        'rationale_prompt': (TRANSLATE_RATIONALE_PROMPT_EGO_HEAD, TRANSLATE_RATIONALE_PROMPT_EGO_BODY, TRANSLATE_RATIONALE_PROMPT_EGO_TAIL),
+        'rationale_system': TRANSLATE_RATIONALE_SYSTEM_MESSAGES["ego-centric"],
+    },
+    'exo': {
+        'question_type': "exo-centric",
+        'question_prompt': (TRANSLATE_QUESTION_PROMPT_EXO_HEAD, TRANSLATE_QUESTION_PROMPT_EXO_TAIL),
+        'question_system': TRANSLATE_QUESTION_SYSTEM_MESSAGES['exo'],
+        'qc_prompt': (TRANSLATE_QC_PROMPT_EXO_HEAD, TRANSLATE_QC_PROMPT_EXO_BODY, TRANSLATE_QC_PROMPT_EXO_TAIL),
+        'qc_system': TRANSLATE_QC_SYSTEM_MESSAGES['exo'],
+        'rationale_prompt': (TRANSLATE_RATIONALE_PROMPT_EXO_HEAD, TRANSLATE_RATIONALE_PROMPT_EXO_BODY, TRANSLATE_RATIONALE_PROMPT_EXO_TAIL),
+        'rationale_system': TRANSLATE_RATIONALE_SYSTEM_MESSAGES["exo-centric"],
+    },
+}
+
+
+def get_view_config(view_type):
+    """view_type에 해당하는 설정 반환 (알 수 없는 값은 exo)."""
+    return VIEW_CONFIG.get(view_type, VIEW_CONFIG['exo'])
+
 @app.route('/api/translate/rationale', methods=['POST'])
-def translate_rationale():
-    """Translate Korean rationale to English with image analysis context."""
-    data = request.json
+def translate_rationale(data=None):
+    """Translate Korean rationale to English with image analysis context.
+    
+    Optional `choice_texts` ({'a': ..., 'b': ..., 'c': ..., 'd': ...}, as returned by
+    /api/translate/question_and_choices) skips re-parsing choices from `question`.
+    """
+    if data is None:
+        data = request.json
     rationale_ko = data.get('rationale_ko', '').strip()
     image_id = data.get('image_id', None)
     view_type = data.get('view_type', 'exo')  # 'exo' or 'ego'
     
     if not rationale_ko:
         return jsonify({'success': False, 'error': 'Rationale (Korean) is required'}), 400
+    # 클라이언트가 보낸 choice_texts도 프롬프트에 그대로 들어가므로 선택지 길이 제한 적용
+    choice_pairs = _choice_pairs_from_texts(data.get('choice_texts'))
+    if _inputs_too_large((rationale_ko, data.get('question') or '', data.get('response') or ''),
+                         [text for _, text in choice_pairs or ()]):
+        return jsonify({'success': False, 'error': INPUT_TOO_LARGE_ERROR}), 413
     
     try:
-        if not OPENAI_AVAILABLE:
-            return jsonify({'success': False, 'error': 'OpenAI library not installed. Install with: pip install openai'}), 500
-        
-        if not OPENAI_API_KEY or OPENAI_API_KEY == "your-api-key-here":
-            return jsonify({'success': False, 'error': 'OPENAI_API_KEY is not set. Please set it in coco_web_annotator.py'}), 500
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
         
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = get_openai_client()
         
         # 이미지 분석 결과 가져오기 (캐시에서)
-        # 캐시 키는 "image_id_model" 형식이므로 모든 모델의 캐시를 확인
-        image_analysis = ""
-        if image_id:
-            # 기본 모델부터 확인
-            for model_name in [DEFAULT_MODEL, 'openai']:
-                cache_key = f"{image_id}_{model_name}"
-                if cache_key in image_analysis_cache:
-                    image_analysis = image_analysis_cache[cache_key]
-                    break
+        # latest_image_analysis에는 모델과 무관하게 가장 최근 분석 결과가 저장됨
+        image_analysis = latest_image_analysis.get(image_id, "") if image_id else ""
         
         # Question과 Response 정보 가져오기 (소거법 형식을 위해)
         question = data.get('question', '').strip()
         response = data.get('response', '').strip()  # 예: "(b) vase"
         
-        # view 타입에 따라 시작 문구 결정
-        question_type = "exo-centric" if view_type == 'exo' else "ego-centric"
+        # 선택지: 클라이언트가 질문 번역 응답의 choice_texts를 함께 보내면 그대로 사용하고,
+        # 없거나 형식이 맞지 않을 때만 question의 <choice> 태그를 파싱
+        if choice_pairs is None and question:
+            choice_pairs = _extract_choices_from_question(question)
+        
+        # view 타입에 따라 시작 문구/프롬프트 결정
+        cfg = get_view_config(view_type)
+        question_type = cfg['question_type']
         
         # 이미지 분석 컨텍스트
         image_context = ""
         if image_analysis:
-            image_context = f"""
-
-IMAGE ANALYSIS CONTEXT:
-{image_analysis}
-
-Use this image analysis to better understand the visual context and spatial relationships when translating the rationale."""
+            image_context = "".join((IMAGE_CONTEXT_HEAD, image_analysis, TRANSLATE_RATIONALE_IMAGE_CONTEXT_TAIL))
         
         # 소거법 형식 가이드
         elimination_guide = ""
         if question and response:
             # Response에서 정답 추출 (예: "(b) vase" -> "b")
-            response_match = re.search(r'\(([a-d])\)', response, re.IGNORECASE)
+            response_match = _RE_RESPONSE.search(response)
             if response_match:
                 correct_answer = response_match.group(1).lower()
-                # Choice 태그에서 모든 선택지 추출
-                choice_match = re.search(r'<choice>(.*?)</choice>', question, re.IGNORECASE)
-                if choice_match:
-                    choice_content = choice_match.group(1)
-                    choices = {}
-                    for letter in ['a', 'b', 'c', 'd']:
-                        pattern = rf'\({letter}\)\s*([^,)]+)'
-                        match = re.search(pattern, choice_content, re.IGNORECASE)
-                        if match:
-                            choices[letter] = match.group(1).strip()
+                if choice_pairs is not None:
+                    choices = dict(choice_pairs)
                     
                     elimination_guide = f"""
 
@@ -2029,149 +3095,54 @@ Current question: {question}
 Correct answer: {response}
 """
         
-        # view_type에 따라 다른 프롬프트 사용
-        if view_type == 'ego':
-            # ego_data_sample.json 형식 참고
-            prompt = f"""Translate the following Korean rationale to English. Follow these CRITICAL requirements for EGO-CENTRIC rationales:{image_context}{elimination_guide}
-
-REQUIREMENTS FOR EGO-CENTRIC RATIONALES:
-1. The rationale MUST start with "The question is ego-centric:"
-2. Use elimination method format: explain why incorrect choices are excluded, then explain why the correct answer is right
-3. The translation must be at least 2 sentences long
-4. Make it natural, grammatically correct, and detailed
-5. Use the image analysis context to create accurate descriptions of spatial relationships and object positions FROM THE PERSON'S PERSPECTIVE
-6. DO NOT include any bounding box coordinates (x1, y1, x2, y2) or coordinate information in the rationale
-7. When the Korean rationale mentions choice letters (a, b, c, d), translate them to the corresponding English choice text from the question
-8. CRITICAL: End the rationale with a simple "Therefore" statement. DO NOT add additional explanatory clauses after "Therefore" such as "as it is...", "because it is...", "since it is...", or any descriptive phrases that repeat information already stated
-9. IMPORTANT: When describing spatial relationships, always clarify the perspective (e.g., "From the person's perspective, the right side corresponds to the left side of the image")
-
-Reference examples from ego_data_sample.json:
-
-Example 1: "The question is ego-centric: The little girl in front of the man has her right side corresponding to the left side of the image. The cake and the camera are positioned in front of her, and the party plate is on her left side. Therefore, the flower is the farthest among the party items."
-
-Example 2: "The question is ego-centric: From the person's perspective, sitting on the right side of the large sofa corresponds to sitting on the left side of the large sofa in the image, and the person's right side aligns with the left side of the image. The large bottle and shoe are located on the person's left side, while the fan is on the right but is not a square-shaped object. Therefore, the TV is the correct answer."
-
-Example 3: "The question is ego-centric: From the woman's perspective, her right side corresponds to the left side of the image. The fork and knife are located on her left side, so they can be excluded. The wine glass, while positioned on the correct side, is made of glass and not a silver object. Therefore, the correct answer is the spoon."
-
-Korean rationale: {rationale_ko}
-
-Translate to English following the format and style of ego_data_sample.json examples."""
-        else:
-            # exo_data_sample.json 형식 참고
-            prompt = f"""Translate the following Korean rationale to English. Follow these CRITICAL requirements:{image_context}{elimination_guide}
-
-REQUIREMENTS:
-1. The rationale MUST start with "The question is exo-centric:"
-2. Use elimination method format: explain why incorrect choices are excluded, then explain why the correct answer is right
-3. The translation must be at least 2 sentences long
-4. Make it natural, grammatically correct, and detailed
-5. Use the image analysis context to create accurate descriptions of spatial relationships and object positions
-6. DO NOT include any bounding box coordinates (x1, y1, x2, y2) or coordinate information in the rationale
-7. When the Korean rationale mentions choice letters (a, b, c, d), translate them to the corresponding English choice text from the question
-8. CRITICAL: End the rationale with a simple "Therefore" statement. DO NOT add additional explanatory clauses after "Therefore" such as "as it is...", "because it is...", "since it is...", or any descriptive phrases that repeat information already stated
-
-Reference examples from exo_data_sample.json:
-
-Example 1: "The question is exo-centric: The sink is placed immediately adjacent to the refrigerator, making it the closest. The vase sits slightly forward on the counter, farther than the sink but clearly closer than the orange bag at the far right edge and the red chair in the front seating area. Therefore the vase is second-closest."
-
-Example 2: "The question is exo-centric: The laptop and the cell phone are located on the sofa near the brown-haired man, while the handbag is placed on the floor near his feet. The coke bottle is also on the floor, but it is cylindrical, not square-shaped. Therefore the handbag is the only square-shaped object on the floor."
-
-Korean rationale: {rationale_ko}
-
-Translate to English following the format and style of exo_data_sample.json examples."""
-        
-        # Choice 정보를 rationale 번역에 활용하기 위한 매핑 생성
-        choice_mapping = ""
-        if question and response:
-            choice_match = re.search(r'<choice>(.*?)</choice>', question, re.IGNORECASE)
-            if choice_match:
-                choice_content = choice_match.group(1)
-                choices = {}
-                for letter in ['a', 'b', 'c', 'd']:
-                    pattern = rf'\({letter}\)\s*([^,)]+)'
-                    match = re.search(pattern, choice_content, re.IGNORECASE)
-                    if match:
-                        choices[letter] = match.group(1).strip()
-                
-                if choices:
-                    choice_mapping = f"""
-
-CHOICE MAPPING (for translating choice letters in Korean rationale):
-When the Korean rationale mentions choice letters (a, b, c, d) or Korean choice text, translate them to the corresponding English choice:
-{', '.join([f'({k}) {v}' for k, v in choices.items()])}
-
-For example, if the Korean rationale says "(d) 포크" or just "d" or "포크", translate it to "fork" (which is choice (d) fork).
-"""
-        
-        # 프롬프트에 choice 매핑 추가
-        enhanced_prompt = prompt + choice_mapping
-        
-        translated_rationale = ""
-        try:
-            response = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": f"You are a professional translator specializing in VQA (Visual Question Answering) rationales. Always start with 'The question is {question_type}:' and use elimination method format with at least 2 sentences. Never include bounding box coordinates. When Korean rationale mentions choice letters (a, b, c, d) or Korean choice text, translate them to the corresponding English choice text. CRITICAL: End with a simple 'Therefore' statement - do NOT add additional explanatory clauses like 'as it is...', 'because it is...', or 'since it is...' after the 'Therefore' sentence."},
-                    {"role": "user", "content": enhanced_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=400
-            )
-            
-            translated_rationale = response.choices[0].message.content.strip()
-        except Exception as api_error:
-            print(f"[ERROR] API error in rationale translation: {type(api_error).__name__}: {str(api_error)}")
-            import traceback
-            traceback.print_exc()
-            return jsonify({'success': False, 'error': f'Translation API error: {str(api_error)}'}), 500
-        
-        if not translated_rationale:
-            return jsonify({'success': False, 'error': 'Translation returned empty result'}), 500
-        
-        # 시작 문구 검증
-        if not translated_rationale.startswith(f"The question is {question_type}:"):
-            # 자동으로 시작 문구 추가
-            translated_rationale = f"The question is {question_type}: {translated_rationale}"
-        
-        # bounding box 좌표 제거 (x1, y1, x2, y2 또는 [x, y, w, h] 형식)
-        translated_rationale = re.sub(r'\[?\s*\d+\.?\d*\s*,\s*\d+\.?\d*\s*,\s*\d+\.?\d*\s*,\s*\d+\.?\d*\s*\]?', '', translated_rationale)
-        translated_rationale = re.sub(r'bounding box[^.]*\.?', '', translated_rationale, flags=re.IGNORECASE)
-        translated_rationale = re.sub(r'bbox[^.]*\.?', '', translated_rationale, flags=re.IGNORECASE)
-        translated_rationale = re.sub(r'coordinate[^.]*\.?', '', translated_rationale, flags=re.IGNORECASE)
-        translated_rationale = re.sub(r'\(x\d+.*?y\d+.*?\)', '', translated_rationale, flags=re.IGNORECASE)
-        
-        # "Therefore" 문장 뒤의 추가 설명 제거 (as it is, because it is, since it is 등)
-        # "Therefore" 문장 뒤에 ", as it is", ", because it is", ", since it is" 같은 패턴이 있으면 제거
-        translated_rationale = re.sub(r'(Therefore[^,.]*?)(,\s*(as|because|since)\s+it\s+is[^.]*?\.)', r'\1.', translated_rationale, flags=re.IGNORECASE)
-        # "Therefore" 문장 뒤에 추가 문장이 있고, 그것이 "as it is", "because it is", "since it is"로 시작하면 제거
-        translated_rationale = re.sub(r'(Therefore[^.]*\.)\s+((As|Because|Since)\s+it\s+is[^.]*?\.)', r'\1', translated_rationale, flags=re.IGNORECASE)
-        # "Therefore" 문장 뒤에 ", as" 또는 ", because" 또는 ", since"로 시작하는 추가 설명이 있으면 제거
-        translated_rationale = re.sub(r'(Therefore[^,.]*?)(,\s+(as|because|since)\s+[^.]*?\.)', r'\1.', translated_rationale, flags=re.IGNORECASE)
-        # "Therefore" 문장을 찾아서 그 문장의 마침표까지만 남기고, 그 뒤의 모든 추가 설명 제거 (더 안전한 방법)
-        # "Therefore" 문장 뒤에 나오는 ", as it is..." 같은 모든 추가 설명 제거
-        therefore_match = re.search(r'(Therefore[^.]*?\.)', translated_rationale, re.IGNORECASE)
-        if therefore_match:
-            therefore_end = therefore_match.end()
-            # "Therefore" 문장 뒤에 ", as", ", because", ", since" 같은 패턴이 있으면 제거
-            remaining = translated_rationale[therefore_end:].strip()
-            if remaining:
-                # ", as it is", ", because it is", ", since it is" 같은 패턴 제거
-                remaining = re.sub(r'^,\s*(as|because|since)\s+it\s+is[^.]*?\.', '', remaining, flags=re.IGNORECASE)
-                # "As it is", "Because it is", "Since it is" 같은 패턴으로 시작하는 문장 제거
-                remaining = re.sub(r'^(As|Because|Since)\s+it\s+is[^.]*?\.', '', remaining, flags=re.IGNORECASE)
-                # ", as", ", because", ", since" 같은 패턴 제거
-                remaining = re.sub(r'^,\s+(as|because|since)\s+[^.]*?\.', '', remaining, flags=re.IGNORECASE)
-                translated_rationale = translated_rationale[:therefore_end] + (' ' + remaining if remaining else '')
-        
-        translated_rationale = re.sub(r'\s+', ' ', translated_rationale).strip()
-        
-        # 문장 수 확인 (최소 2문장)
-        sentences = [s.strip() for s in translated_rationale.split('.') if s.strip()]
-        sentence_count = len(sentences)
-        
-        if sentence_count < 2:
-            # 2문장 이상으로 확장
-            additional_prompt = f"""The following rationale is too short. Expand it to at least 2 sentences while maintaining the elimination method format. Do NOT include any bounding box coordinates or coordinate information:
+        # view_type에 따라 다른 프롬프트 사용 (ego/exo_data_sample.json 형식 참고)
+        prompt_head, prompt_body, prompt_tail = cfg['rationale_prompt']
+        prompt = "".join((
+            prompt_head,
+            image_context,
+            elimination_guide,
+            prompt_body,
+            rationale_ko,
+            prompt_tail
+        ))
+        
+        # Choice 정보를 rationale 번역에 활용하기 위한 매핑 생성
+        choice_mapping = ""
+        if question and response:
+            choice_mapping = _build_choice_mapping(choice_pairs)
+        
+        # 프롬프트에 choice 매핑 추가
+        enhanced_prompt = prompt + choice_mapping
+        
+        translated_rationale = ""
+        try:
+            response = client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": cfg['rationale_system']},
+                    {"role": "user", "content": enhanced_prompt}
+                ],
+                temperature=0.3,
+                max_tokens=400
+            )
+            
+            translated_rationale = response.choices[0].message.content.strip()
+        except Exception as api_error:
+            app.logger.exception("API error in rationale translation: %s", type(api_error).__name__)
+            return jsonify({'success': False, 'error': f'Translation API error: {str(api_error)}'}), 500
+        
+        if not translated_rationale:
+            return jsonify({'success': False, 'error': 'Translation returned empty result'}), 500
+        
+        # 시작 문구 보정 + bounding box 좌표 제거, "Therefore" 문장 뒤 추가 설명 제거, 공백 정리
+        translated_rationale = _postprocess_rationale(translated_rationale, question_type)
+        
+        # 문장 수 확인 (최소 2문장): 공백/끝이 뒤따르는 문장 부호만 문장 끝으로 셈 ("3.5" 같은 소수점은 제외)
+        sentence_count = sum(1 for _ in _RE_SENTENCE_END.finditer(translated_rationale))
+        
+        if sentence_count < 2:
+            # 2문장 이상으로 확장
+            additional_prompt = f"""The following rationale is too short. Expand it to at least 2 sentences while maintaining the elimination method format. Do NOT include any bounding box coordinates or coordinate information:
 
 Current rationale: {translated_rationale}
 
@@ -2187,27 +3158,8 @@ Expand it to at least 2 sentences, keeping the same format and style."""
                 max_tokens=200
             )
             translated_rationale = additional_response.choices[0].message.content.strip()
-            # 다시 bounding box 좌표 제거
-            translated_rationale = re.sub(r'\[?\s*\d+\.?\d*\s*,\s*\d+\.?\d*\s*,\s*\d+\.?\d*\s*,\s*\d+\.?\d*\s*\]?', '', translated_rationale)
-            translated_rationale = re.sub(r'bounding box[^.]*\.?', '', translated_rationale, flags=re.IGNORECASE)
-            translated_rationale = re.sub(r'bbox[^.]*\.?', '', translated_rationale, flags=re.IGNORECASE)
-            translated_rationale = re.sub(r'coordinate[^.]*\.?', '', translated_rationale, flags=re.IGNORECASE)
-            translated_rationale = re.sub(r'\(x\d+.*?y\d+.*?\)', '', translated_rationale, flags=re.IGNORECASE)
-            # "Therefore" 문장 뒤의 추가 설명 제거
-            translated_rationale = re.sub(r'(Therefore[^,.]*?)(,\s*(as|because|since)\s+it\s+is[^.]*?\.)', r'\1.', translated_rationale, flags=re.IGNORECASE)
-            translated_rationale = re.sub(r'(Therefore[^.]*\.)\s+((As|Because|Since)\s+it\s+is[^.]*?\.)', r'\1', translated_rationale, flags=re.IGNORECASE)
-            translated_rationale = re.sub(r'(Therefore[^,.]*?)(,\s+(as|because|since)\s+[^.]*?\.)', r'\1.', translated_rationale, flags=re.IGNORECASE)
-            # "Therefore" 문장을 찾아서 그 문장의 마침표까지만 남기고, 그 뒤의 모든 추가 설명 제거
-            therefore_match = re.search(r'(Therefore[^.]*?\.)', translated_rationale, re.IGNORECASE)
-            if therefore_match:
-                therefore_end = therefore_match.end()
-                remaining = translated_rationale[therefore_end:].strip()
-                if remaining:
-                    remaining = re.sub(r'^,\s*(as|because|since)\s+it\s+is[^.]*?\.', '', remaining, flags=re.IGNORECASE)
-                    remaining = re.sub(r'^(As|Because|Since)\s+it\s+is[^.]*?\.', '', remaining, flags=re.IGNORECASE)
-                    remaining = re.sub(r'^,\s+(as|because|since)\s+[^.]*?\.', '', remaining, flags=re.IGNORECASE)
-                    translated_rationale = translated_rationale[:therefore_end] + (' ' + remaining if remaining else '')
-            translated_rationale = re.sub(r'\s+', ' ', translated_rationale).strip()
+            # 다시 bounding box 좌표 제거 및 "Therefore" 문장 뒤 추가 설명 제거
+            translated_rationale = _postprocess_rationale(translated_rationale)
         
         return jsonify({
             'success': True,
@@ -2216,6 +3168,175 @@ Expand it to at least 2 sentences, keeping the same format and style."""
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# ==================== rationale 일괄 번역 ====================
+# 여러 rationale을 한 번의 호출로 번역 (RPM 한도 절약, 왕복 횟수 감소). 항목이 많으면 지연이 급격히 늘어나므로 8개로 제한
+RATIONALE_BATCH_MAX_ITEMS = 8
+
+RATIONALE_BATCH_SYSTEM_MESSAGE = """You are a professional translator specializing in VQA (Visual Question Answering) rationales.
+You receive a JSON array of items {"id", "question_type", "korean_rationale", "choices"?, "correct_answer"?}.
+Translate every item independently and return {"translations": [{"id", "translation"}]} with one entry per input id.
+Rules for each translation:
+- Always start with 'The question is {question_type}:' using the item's question_type.
+- Use elimination method format with at least 2 sentences: explain why each incorrect choice is excluded, then end with a simple 'Therefore' statement.
+- Do NOT add explanatory clauses like 'as it is...', 'because it is...', or 'since it is...' after the 'Therefore' sentence.
+- Never include bounding box coordinates.
+- When the Korean rationale mentions choice letters (a, b, c, d) or Korean choice text and "choices" is given, translate them to the corresponding English choice text."""
+
+RATIONALE_BATCH_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "rationale_translations",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "translations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "id": {"type": "string"},
+                            "translation": {"type": "string"}
+                        },
+                        "required": ["id", "translation"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["translations"],
+            "additionalProperties": False
+        }
+    }
+}
+
+@app.route('/api/translate/rationales_batch', methods=['POST'])
+def translate_rationales_batch():
+    """Translate up to RATIONALE_BATCH_MAX_ITEMS Korean rationales in a single OpenAI call.
+    
+    Body: {"items": [{"id", "rationale_ko", "view_type", "question"?, "response"?, "choice_texts"?}, ...]}
+    Image analysis context is not included (one shared prompt for all items).
+    """
+    data = request.json or {}
+    items = data.get('items')
+    if not isinstance(items, list) or not items:
+        return jsonify({'success': False, 'error': 'items (non-empty list) is required'}), 400
+    if len(items) > RATIONALE_BATCH_MAX_ITEMS:
+        return jsonify({'success': False, 'error': f'At most {RATIONALE_BATCH_MAX_ITEMS} items per batch'}), 400
+    
+    payload = []
+    question_types = {}
+    for idx, item in enumerate(items):
+        if not isinstance(item, dict):
+            return jsonify({'success': False, 'error': f'items[{idx}] must be an object'}), 400
+        item_id = str(item.get('id', idx))
+        rationale_ko = (item.get('rationale_ko') or '').strip()
+        if not rationale_ko:
+            return jsonify({'success': False, 'error': f'items[{idx}]: Rationale (Korean) is required'}), 400
+        question = (item.get('question') or '').strip()
+        response = (item.get('response') or '').strip()
+        choice_pairs = _choice_pairs_from_texts(item.get('choice_texts'))
+        if _inputs_too_large((rationale_ko, question, response), [text for _, text in choice_pairs or ()]):
+            return jsonify({'success': False, 'error': f'items[{idx}]: {INPUT_TOO_LARGE_ERROR}'}), 413
+        if item_id in question_types:
+            return jsonify({'success': False, 'error': f'items[{idx}]: duplicate id {item_id}'}), 400
+        
+        question_type = get_view_config(item.get('view_type', 'exo'))['question_type']
+        question_types[item_id] = question_type
+        entry = {'id': item_id, 'question_type': question_type, 'korean_rationale': rationale_ko}
+        
+        # 선택지 매핑 (단건 번역과 동일하게 choice_texts 우선, 없으면 question의 <choice> 태그 파싱)
+        if choice_pairs is None and question:
+            choice_pairs = _extract_choices_from_question(question)
+        if choice_pairs:
+            entry['choices'] = dict(choice_pairs)
+        response_match = _RE_RESPONSE.search(response) if response else None
+        if response_match:
+            entry['correct_answer'] = response_match.group(1).lower()
+        payload.append(entry)
+    
+    try:
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
+        
+        client = get_openai_client()
+        response = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": RATIONALE_BATCH_SYSTEM_MESSAGE},
+                {"role": "user", "content": json.dumps(payload, ensure_ascii=False)}
+            ],
+            response_format=RATIONALE_BATCH_RESPONSE_FORMAT,
+            temperature=0.3,
+            max_tokens=400 * len(payload)
+        )
+        translations = json.loads(response.choices[0].message.content).get('translations', [])
+    except Exception as e:
+        app.logger.exception("OpenAI rationale batch translation failed")
+        return jsonify({'success': False, 'error': f'Translation API error: {str(e)}'}), 500
+    
+    # id로 결과를 다시 나눈 뒤 단건 번역과 같은 후처리 적용
+    translated_by_id = {str(t.get('id')): (t.get('translation') or '').strip() for t in translations}
+    results = []
+    for item_id, question_type in question_types.items():
+        translated = translated_by_id.get(item_id)
+        if not translated:
+            results.append({'id': item_id, 'success': False, 'error': 'Missing translation in batch response'})
+            continue
+        results.append({
+            'id': item_id,
+            'success': True,
+            'translated_rationale': _postprocess_rationale(translated, question_type)
+        })
+    
+    return jsonify({'success': True, 'results': results})
+
+# 질문/근거 동시 번역용 스레드 풀 (OpenAI 호출은 네트워크 I/O 동안 GIL을 놓으므로 스레드로 충분)
+translation_executor = ThreadPoolExecutor(max_workers=8)
+
+def _run_translation_view(view, data):
+    """번역 뷰 함수를 별도 스레드에서 실행하고 (JSON payload, status code) 반환"""
+    with app.app_context():
+        result = view(data)
+    response, status = result if isinstance(result, tuple) else (result, 200)
+    return response.get_json(), status
+
+@app.route('/api/translate/both', methods=['POST'])
+def translate_both():
+    """
+    Translate question/choices and rationale concurrently.
+    
+    Body는 /api/translate/question_and_choices와 /api/translate/rationale의 필드를 합친 형태.
+    rationale의 소거법 가이드에는 이미 번역된 영어 question/response가 필요하므로 있으면 함께 전달.
+    """
+    data = request.json or {}
+    question_future = translation_executor.submit(_run_translation_view, translate_question_and_choices, data)
+    rationale_future = translation_executor.submit(_run_translation_view, translate_rationale, data)
+    
+    question_result, question_status = question_future.result()
+    rationale_result, rationale_status = rationale_future.result()
+    
+    return jsonify({
+        'success': bool(question_result.get('success')) and bool(rationale_result.get('success')),
+        'question': question_result,
+        'rationale': rationale_result
+    }), max(question_status, rationale_status)
+
+# 검수 응답에서 섹션 헤더 없이 쓰인 Issues 라벨 ("Issues:", "Problems:" 등)
+_RE_ISSUES_LABEL = re.compile(r'^(?:Issues Found|Issues to fix|Issues|Problems)\s*:?\s*', re.IGNORECASE)
+
+def _split_review_sections(text):
+    """검수 응답을 "=== 헤더 ===" 단위로 분리해 (첫 헤더 앞 텍스트, {소문자 헤더: 본문}) 반환"""
+    preamble, sep, rest = text.partition('===')
+    sections = {}
+    while sep:
+        header, sep, rest = rest.partition('===')
+        if not sep:
+            # 닫는 "==="가 없으면 헤더가 아님
+            break
+        body, sep, rest = rest.partition('===')
+        sections.setdefault(header.strip().lower(), body.strip())
+    return preamble.strip(), sections
+
 @app.route('/api/review_translation', methods=['POST'])
 def review_translation():
     """Review translated question, response, and rationale using GPT-5 for grammar and unnecessary phrases."""
@@ -2228,13 +3349,10 @@ def review_translation():
         return jsonify({'success': False, 'error': 'Question or Rationale is required'}), 400
     
     try:
-        if not OPENAI_AVAILABLE:
-            return jsonify({'success': False, 'error': 'OpenAI library not installed. Install with: pip install openai'}), 500
-        
-        if not OPENAI_API_KEY or OPENAI_API_KEY == "your-api-key-here":
-            return jsonify({'success': False, 'error': 'OPENAI_API_KEY is not set. Please set it in coco_web_annotator.py'}), 500
+        if not OPENAI_READY:
+            return jsonify({'success': False, 'error': OPENAI_NOT_READY_ERROR}), 500
         
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        client = get_openai_client()
         
         # 검수 프롬프트 구성
         review_prompt = f"""Review the following English translations for a VQA (Visual Question Answering) task. Check for:
@@ -2291,9 +3409,7 @@ IMPORTANT:
                 max_tokens=1000
             )
         except Exception as api_error:
-            print(f"[ERROR] GPT-4o-mini API error: {type(api_error).__name__}: {str(api_error)}")
-            import traceback
-            traceback.print_exc()
+            app.logger.exception("GPT-4o-mini review API error: %s", type(api_error).__name__)
             return jsonify({
                 'success': False,
                 'error': f'Review API error: {str(api_error)}'
@@ -2366,10 +3482,6 @@ IMPORTANT:
             })
         else:
             # 수정이 필요한 경우
-            revised_question = None
-            revised_rationale = None
-            issues_found = None
-            
             # review_notes는 항상 채워야 함 (이미 위에서 검증했으므로 여기서는 체크만)
             if not review_result or len(review_result.strip()) == 0:
                 print(f"[ERROR] review_result is empty in else block (should not happen)")
@@ -2378,60 +3490,33 @@ IMPORTANT:
                     'error': 'Review result is empty'
                 }), 500
             
-            # === Issues Found === 부분 추출 (더 유연한 패턴)
-            # 패턴 1: 정확한 형식
-            issues_match = re.search(r'=== Issues Found ===\s*([\s\S]*?)(?=\n\n=== Question|=== Rationale|=== Response|$)', review_result, re.IGNORECASE)
-            if issues_match:
-                issues_found = issues_match.group(1).strip()
-            else:
-                # 패턴 2: "Issues Found" 또는 "Issues:" 같은 변형
-                issues_match2 = re.search(r'(?:Issues Found|Issues:|Problems:|Issues to fix):?\s*([\s\S]*?)(?=\n\n=== Question|=== Rationale|=== Response|$)', review_result, re.IGNORECASE)
-                if issues_match2:
-                    issues_found = issues_match2.group(1).strip()
-                else:
-                    # 패턴 3: Issues Found가 없으면 응답의 처음 부분을 Issues로 사용 (Question/Rationale 섹션 전까지)
-                    before_question = re.search(r'^([\s\S]*?)(?=\n\n=== Question|=== Rationale|=== Response)', review_result, re.IGNORECASE)
-                    if before_question and not review_result.startswith("==="):
-                        # OK가 아니고 섹션 헤더가 없는 경우, 전체를 Issues로 간주
-                        issues_found = before_question.group(1).strip()
-            
-            # Issues Found가 여전히 없으면 전체 응답의 일부를 사용
-            if not issues_found or len(issues_found) < 10:
-                # Question/Rationale 섹션을 제외한 나머지를 Issues로 사용
-                temp_result = review_result
-                temp_result = re.sub(r'=== Question.*?===.*?(?=\n\n=== Rationale|$)', '', temp_result, flags=re.IGNORECASE | re.DOTALL)
-                temp_result = re.sub(r'=== Rationale.*?===.*?$', '', temp_result, flags=re.IGNORECASE | re.DOTALL)
-                temp_result = temp_result.strip()
-                if temp_result and len(temp_result) > 10:
-                    issues_found = temp_result
+            # "=== 헤더 ===" 기준으로 섹션 분리 (정규식 대신 str.partition 한 번의 스캔)
+            preamble, sections = _split_review_sections(review_result)
             
-            # === Question (수정) === 부분 추출
-            question_match = re.search(r'=== Question \(수정\) ===\s*([\s\S]*?)(?=\n\n=== Rationale|=== Response|$)', review_result, re.IGNORECASE)
-            if question_match:
-                revised_question = question_match.group(1).strip()
-                # "(No changes needed)" 체크
-                if revised_question.upper().strip() == "(NO CHANGES NEEDED)":
-                    revised_question = None
+            # === Issues Found === 부분 추출
+            issues_found = sections.get('issues found')
+            if not issues_found and preamble:
+                # 섹션 헤더 앞의 텍스트를 Issues로 사용 ("Issues:", "Problems:" 같은 라벨은 제거)
+                issues_found = _RE_ISSUES_LABEL.sub('', preamble, count=1).strip()
             
-            # === Rationale (수정) === 부분 추출
-            rationale_match = re.search(r'=== Rationale \(수정\) ===\s*([\s\S]*?)$', review_result, re.IGNORECASE)
-            if rationale_match:
-                revised_rationale = rationale_match.group(1).strip()
-                # "(No changes needed)" 체크
-                if revised_rationale.upper().strip() == "(NO CHANGES NEEDED)":
-                    revised_rationale = None
+            # === Question (수정) === / === Rationale (수정) === 부분 추출
+            revised_question = sections.get('question (수정)')
+            # "(No changes needed)" 체크
+            if revised_question and revised_question.upper() == "(NO CHANGES NEEDED)":
+                revised_question = None
+            revised_rationale = sections.get('rationale (수정)')
+            if revised_rationale and revised_rationale.upper() == "(NO CHANGES NEEDED)":
+                revised_rationale = None
             
-            # 최종 검증: Issues Found가 없으면 전체 응답을 Issues로 사용
+            # Issues Found가 없으면 Question/Rationale 섹션을 제외한 나머지를 Issues로 사용
             if not issues_found or len(issues_found) < 10:
-                # Question과 Rationale을 제외한 나머지
-                full_text = review_result
-                if revised_question:
-                    full_text = re.sub(r'=== Question.*?===\s*' + re.escape(revised_question), '', full_text, flags=re.IGNORECASE | re.DOTALL)
-                if revised_rationale:
-                    full_text = re.sub(r'=== Rationale.*?===\s*' + re.escape(revised_rationale), '', full_text, flags=re.IGNORECASE | re.DOTALL)
-                full_text = re.sub(r'=== .*? ===', '', full_text).strip()
-                if full_text and len(full_text) > 10:
-                    issues_found = full_text
+                other_text = "\n\n".join(
+                    part for part in [preamble] + [body for header, body in sections.items()
+                                                   if not header.startswith(('question', 'rationale'))]
+                    if part
+                )
+                if len(other_text) > 10:
+                    issues_found = other_text
             
             # 최종 검증: Issues Found가 여전히 없고, Question/Rationale도 없으면
             # 전체 응답을 Issues Found로 사용
@@ -2481,13 +3566,11 @@ def save_annotation():
     rationale = data.get('rationale', '').strip()
     if rationale:
         # (a), (b), (c), (d) 패턴 제거
-        rationale = re.sub(r'\([abcd]\)', '', rationale, flags=re.IGNORECASE)
+        rationale = _RE_CHOICE_LETTER.sub('', rationale)
         # (ATT), (POS), (REL) 패턴 제거
-        rationale = re.sub(r'\(ATT\)', '', rationale, flags=re.IGNORECASE)
-        rationale = re.sub(r'\(POS\)', '', rationale, flags=re.IGNORECASE)
-        rationale = re.sub(r'\(REL\)', '', rationale, flags=re.IGNORECASE)
+        rationale = _RE_TAG_LABEL.sub('', rationale)
         # 연속된 공백 정리
-        rationale = re.sub(r'\s+', ' ', rationale).strip()
+        rationale = _RE_WHITESPACE.sub(' ', rationale).strip()
         # annotation에 정리된 rationale 저장
         data['rationale'] = rationale
     
@@ -2495,32 +3578,26 @@ def save_annotation():
     question = data.get('question', '').strip()
     if question and rationale:
         # question에서 <choice> 태그 파싱
-        choice_match = re.search(r'<choice>(.*?)</choice>', question, re.IGNORECASE)
+        choice_match = _RE_CHOICE.search(question)
         if choice_match:
             choice_content = choice_match.group(1)
             # 각 선지 텍스트 추출
-            choices = {}
-            for letter in ['a', 'b', 'c', 'd']:
-                pattern = rf'\({letter}\)\s*([^,)]+)'
-                match = re.search(pattern, choice_content, re.IGNORECASE)
-                if match:
-                    choices[letter] = match.group(1).strip()
+            choices = _parse_choices(choice_content)
             
             # 선지가 있으면 rationale에 선지 단어가 포함되어 있는지 확인
             if choices:
-                all_choice_words = []
-                for choice_text in choices.values():
-                    # 선지 텍스트를 단어로 분리 (2글자 이상인 단어만)
-                    words = [w.lower() for w in choice_text.split() if len(w) > 2]
-                    all_choice_words.extend(words)
+                # 선지 텍스트를 단어로 분리 (3글자 이상인 단어만, 중복 제거)
+                choice_words = {w for choice_text in choices.values() for w in choice_text.lower().split() if len(w) > 2}
                 
-                # rationale을 소문자로 변환하여 검색
+                # rationale을 소문자로 변환해 한 번만 토큰화
                 rationale_lower = rationale.lower()
+                rationale_tokens = set(_RE_WORD_TOKEN.findall(rationale_lower))
                 
                 # 선지 단어 중 하나라도 rationale에 포함되어 있는지 확인
-                found_words = [word for word in all_choice_words if word in rationale_lower]
+                # 대부분은 단어 집합 교집합으로 바로 통과, 없을 때만 기존 부분 문자열 검사 (복수형/구두점 포함 단어)
+                has_choice_word = not choice_words.isdisjoint(rationale_tokens) or any(word in rationale_lower for word in choice_words)
                 
-                if not found_words:
+                if not has_choice_word:
                     return jsonify({
                         'error': 'Rationale must contain words from the choices',
                         'message': f'Rationale에 객관식 선지의 단어가 포함되어야 합니다. 선지: {", ".join(choices.values())}'
@@ -2531,9 +3608,8 @@ def save_annotation():
     image_info = annotator.coco.imgs[image_id]
     view_type = data['view']
     
-    # image_path 생성: "/파일명" 형식
-    image_filename = image_info['file_name']
-    relative_image_path = f"/{image_filename}"
+    # image_path: "/파일명" 형식 (로드 시 미리 계산)
+    relative_image_path = image_info['rel_path']
     
     # bbox 처리: bbox가 있으면 처리, 없으면 None (선택사항)
     # bbox 좌표를 소수점 둘째자리로 통일
@@ -2560,7 +3636,7 @@ def save_annotation():
     annotation = {
         'image_id': data['image_id'],
         'image_path': relative_image_path,  # 상대 경로로 변경
-        'image_resolution': f"{image_info['width']}x{image_info['height']}",  # 원본 이미지 크기 (web_annotations_exo.json, web_annotations_ego.json에만 저장)
+        'image_resolution': image_info['resolution'],  # 원본 이미지 크기 (web_annotations_exo.json, web_annotations_ego.json에만 저장)
         'question': data['question'],
         'response': data['response'],
         'rationale': data.get('rationale', ''),  # 이미 정리된 rationale 사용
@@ -2575,128 +3651,67 @@ def save_annotation():
     other_output_path = annotator.output_json_path_ego if view_type == 'exo' else annotator.output_json_path_exo
     
     # 파일 잠금을 사용하여 동시 접근 방지 (중복 데이터 방지)
-    lock = file_locks[view_type]
-    
-    with lock:  # 잠금 획득 (다른 작업자가 저장 중이면 대기)
+    # 두 view 파일을 모두 다루므로 잠금을 항상 같은 순서(exo -> ego)로 한 번에 획득 (교차 저장 시 교착 상태 방지)
+    with file_locks['exo'], file_locks['ego']:  # 잠금 획득 (다른 작업자가 저장 중이면 대기)
         # 해당 view 타입의 annotations 로드 (잠금 내에서 다시 읽어 최신 데이터 보장)
         view_annotations = []
         if os.path.exists(output_path):
             try:
-                with open(output_path, 'r', encoding='utf-8') as f:
-                    view_annotations = json.load(f)
+                view_annotations = _load_json_file(output_path)
             except (FileNotFoundError, json.JSONDecodeError):
                 view_annotations = []
         
-        # 중복 체크: 같은 image_id가 이미 있는지 확인
+        # 중복 체크: 같은 image_id가 이미 있으면 덮어쓰고, 없으면 새로 추가 (한 번의 스캔)
         found = False
         for i, ann in enumerate(view_annotations):
-            if ann.get('image_id') == data['image_id']:
+            if ann.get('image_id') == image_id:
                 view_annotations[i] = annotation  # 덮어쓰기
                 found = True
                 break
+        else:
+            view_annotations.append(annotation)  # 새로 추가
         
-        if not found:
-            # 중복 확인: 혹시 모를 중복 방지
-            if not any(ann.get('image_id') == data['image_id'] for ann in view_annotations):
-                view_annotations.append(annotation)  # 새로 추가
-            else:
-                # 이미 존재하는 경우 업데이트
-                for i, ann in enumerate(view_annotations):
-                    if ann.get('image_id') == data['image_id']:
-                        view_annotations[i] = annotation
-                        found = True
-                        break
+        # 다른 view 타입 파일 처리
+        other_view_annotations = []
+        if os.path.exists(other_output_path):
+            try:
+                other_view_annotations = _load_json_file(other_output_path)
+            except (FileNotFoundError, json.JSONDecodeError):
+                other_view_annotations = []
         
-        # 다른 view 타입 파일 처리 (다른 view 타입 파일도 잠금 필요)
-        other_lock = file_locks['ego' if view_type == 'exo' else 'exo']
-        with other_lock:
-            other_view_annotations = []
-            if os.path.exists(other_output_path):
-                try:
-                    with open(other_output_path, 'r', encoding='utf-8') as f:
-                        other_view_annotations = json.load(f)
-                except (FileNotFoundError, json.JSONDecodeError):
-                    other_view_annotations = []
-            
-            # 다른 view 타입 파일에서 같은 image_id 제거
-            other_view_annotations = [ann for ann in other_view_annotations if ann.get('image_id') != data['image_id']]
+        # 다른 view 타입 파일에서 같은 image_id 제거 (실제로 제거된 경우에만 다시 저장)
+        other_prev_len = len(other_view_annotations)
+        other_view_annotations = [ann for ann in other_view_annotations if ann.get('image_id') != image_id]
+        other_changed = len(other_view_annotations) != other_prev_len
         
-        # Save to file (원자적 쓰기: 임시 파일에 쓰고 rename)
+        # Save to file (원자적 쓰기: 임시 파일에 쓰고 os.replace)
         try:
-            # 출력 디렉토리 생성
-            output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir, exist_ok=True)
+            # 현재 view 타입 파일 저장
+            # bbox 배열은 한 줄로 출력: "bbox": [숫자, ...]
+            _atomic_write_text(output_path, _dumps_annotations(view_annotations))
             
-            # 현재 view 타입 파일 저장 (원자적 쓰기)
-            json_str = json.dumps(view_annotations, indent=2, ensure_ascii=False)
-            # bbox 배열을 한 줄로 변경: "bbox": [\n      숫자,\n      ...\n    ] -> "bbox": [숫자, ...]
-            json_str = re.sub(
-                r'"bbox":\s*\[\s*\n\s*([^\]]+?)\s*\n\s*\]',
-                lambda m: f'"bbox": [{re.sub(r"\\s+", " ", m.group(1).strip())}]',
-                json_str,
-                flags=re.MULTILINE
-            )
-            
-            # 임시 파일에 쓰고 원자적으로 rename (중복 방지)
-            temp_fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.json.tmp', text=True)
-            try:
-                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                    f.write(json_str)
-                # 원자적 쓰기: 임시 파일을 최종 파일로 rename
-                shutil.move(temp_path, output_path)
-            except Exception:
-                # 실패 시 임시 파일 정리
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-                raise
-            
-            # 다른 view 타입 파일도 저장 (같은 image_id 제거된 버전)
-            if other_view_annotations != [] or os.path.exists(other_output_path):
-                other_output_dir = os.path.dirname(other_output_path)
-                if other_output_dir and not os.path.exists(other_output_dir):
-                    os.makedirs(other_output_dir, exist_ok=True)
-                
-                other_json_str = json.dumps(other_view_annotations, indent=2, ensure_ascii=False)
-                # bbox 배열을 한 줄로 변경
-                other_json_str = re.sub(
-                    r'"bbox":\s*\[\s*\n\s*([^\]]+?)\s*\n\s*\]',
-                    lambda m: f'"bbox": [{re.sub(r"\\s+", " ", m.group(1).strip())}]',
-                    other_json_str,
-                    flags=re.MULTILINE
-                )
-                
-                # 다른 view 타입 파일도 원자적 쓰기 (다시 잠금 필요)
-                with other_lock:
-                    other_temp_fd, other_temp_path = tempfile.mkstemp(dir=other_output_dir, suffix='.json.tmp', text=True)
-                    try:
-                        with os.fdopen(other_temp_fd, 'w', encoding='utf-8') as f:
-                            f.write(other_json_str)
-                        shutil.move(other_temp_path, other_output_path)
-                    except Exception:
-                        try:
-                            os.unlink(other_temp_path)
-                        except:
-                            pass
-                        raise
+            # 다른 view 타입 파일도 저장 (같은 image_id가 있어서 제거된 경우만)
+            if other_changed:
+                _atomic_write_text(other_output_path, _dumps_annotations(other_view_annotations))
         
         except (IOError, OSError) as e:
             return jsonify({'error': f'Failed to save: {e}'}), 500
         
-        # 전체 annotations도 업데이트 (다음 로드 시 반영)
-        annotator._reload_annotations()
-        
-        # Google Sheets에 저장 (실패해도 로컬 저장은 성공한 것으로 처리)
-        # worker_id는 요청에서 가져오거나 config에서 자동으로 사용
-        worker_id = data.get('worker_id') or WORKER_ID
-        sheets_success = False
-        sheets_error = None
-        revision_updated = False
+        # 전체 annotations도 업데이트 (방금 저장한 항목만 캐시에 반영, 파일 재로드 없음)
+        annotator.update_cache(annotation)
         
-        if google_sheets_client and worker_id:
-            try:
+    # Google Sheets에 저장 (실패해도 로컬 저장은 성공한 것으로 처리)
+    # 네트워크 호출이 길어 파일 잠금을 해제한 뒤 수행
+    # worker_id는 요청에서 가져오거나 config에서 자동으로 사용
+    worker_id = data.get('worker_id') or WORKER_ID
+    sheets_success = False
+    sheets_error = None
+    revision_updated = False
+    
+    if google_sheets_client and worker_id:
+        try:
+            # 같은 작업자의 시트 쓰기는 한 번에 하나씩 (행 검색 후 추가 사이에 다른 저장이 끼어들어 중복 행/429가 생기지 않도록)
+            with get_sheet_write_lock(worker_id):
                 sheets_success = save_to_google_sheets(
                     worker_id=worker_id,
                     annotation=annotation,
@@ -2704,16 +3719,16 @@ def save_annotation():
                 )
                 if not sheets_success:
                     sheets_error = "Google Sheets 저장 실패 (알 수 없는 오류)"
-                
+            
                 # 불통 상태이고 수정여부가 아직 업데이트되지 않았다면 업데이트
                 # 검수 상태 확인을 위해 시트에서 읽어오기
                 sheet_data = read_from_google_sheets(worker_id)
                 print(f"[DEBUG] 시트 데이터에서 Image ID {image_id} 검색 중... (총 {len(sheet_data)}개 행)")
                 for row in sheet_data:
-                    row_image_id = row.get('Image ID', '') or row.get('image_id', '')
+                    row_image_id = get_sheet_field(row, 'image_id')
                     if str(row_image_id) == str(image_id):
-                        review_status = row.get('검수', '') or row.get('검수 상태', '')
-                        revision_status = row.get('수정여부', '') or row.get('수정 여부', '')
+                        review_status = get_sheet_field(row, 'review')
+                        revision_status = get_sheet_field(row, 'revision')
                         print(f"[DEBUG] Image ID {image_id} 발견 - 검수: {review_status}, 수정여부: {revision_status}")
                         if review_status == '불통' and revision_status != '수정완료' and revision_status != '수정 완료':
                             # 수정여부 열 업데이트
@@ -2728,28 +3743,137 @@ def save_annotation():
                         break
                 else:
                     print(f"[WARN] Image ID {image_id}를 시트 데이터에서 찾을 수 없습니다.")
-                        
-            except Exception as e:
-                sheets_error = str(e)
-                print(f"[WARN] Google Sheets 저장 실패: {e}")
-                import traceback
-                print(f"[WARN] 상세 에러:\n{traceback.format_exc()}")
-        elif not google_sheets_client:
-            sheets_error = "Google Sheets 클라이언트가 초기화되지 않았습니다"
-            print("[WARN] Google Sheets 클라이언트가 초기화되지 않았습니다.")
-        elif not worker_id:
-            sheets_error = "작업자 ID가 없습니다"
-            print("[WARN] 작업자 ID가 없어 Google Sheets에 저장하지 않습니다. config.py에 WORKER_ID를 설정하거나 요청에 worker_id를 포함하세요.")
-        
-        response_data = {
-            'success': True, 
-            'updated': found,
-            'sheets_saved': sheets_success,
-            'sheets_error': sheets_error if not sheets_success else None,
-            'revision_updated': revision_updated
+                    
+        except Exception as e:
+            sheets_error = str(e)
+            print(f"[WARN] Google Sheets 저장 실패: {e}")
+            import traceback
+            print(f"[WARN] 상세 에러:\n{traceback.format_exc()}")
+    elif not google_sheets_client:
+        sheets_error = "Google Sheets 클라이언트가 초기화되지 않았습니다"
+        print("[WARN] Google Sheets 클라이언트가 초기화되지 않았습니다.")
+    elif not worker_id:
+        sheets_error = "작업자 ID가 없습니다"
+        print("[WARN] 작업자 ID가 없어 Google Sheets에 저장하지 않습니다. config.py에 WORKER_ID를 설정하거나 요청에 worker_id를 포함하세요.")
+    
+    response_data = {
+        'success': True, 
+        'updated': found,
+        'sheets_saved': sheets_success,
+        'sheets_error': sheets_error if not sheets_success else None,
+        'revision_updated': revision_updated
+    }
+    
+    return jsonify(response_data)
+
+
+# 작업자 시트 생성 시 기록하는 헤더 (A~J열)
+SHEET_HEADERS = [
+    '저장시간', 'Image ID', 'Image Path', 'Image Resolution', 
+    'Question', 'Response', 'Rationale', 'View', 'Bbox', 'SKIP'
+]
+
+# 응답을 기다릴 필요 없는 시트 작업용 (헤더 스타일 등)
+sheets_background_executor = ThreadPoolExecutor(max_workers=1)
+
+def format_sheet_header_async(worksheet):
+    """새 시트의 헤더 행을 굵게 표시 (선택사항, 백그라운드에서 실행하여 저장 응답을 지연시키지 않음)"""
+    def _format():
+        try:
+            worksheet.format('A1:J1', {'textFormat': {'bold': True}})
+        except Exception:
+            pass
+    sheets_background_executor.submit(_format)
+
+
+def _sheet_range(sheet_name):
+    """시트 이름 전체를 가리키는 A1 범위 (작은따옴표로 감싸고 내부 따옴표는 이스케이프)"""
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+# 작업자별 시트 쓰기 잠금: 같은 작업자 시트에 대한 행 검색+쓰기가 동시에 실행되지 않도록
+# (다른 작업자의 쓰기는 막지 않음, 셀 쓰기 버퍼 전송은 잠금 밖에서 처리)
+_sheet_write_locks = {}
+
+def get_sheet_write_lock(worker_id):
+    """worker_id 시트 쓰기용 잠금 반환 (없으면 생성, dict.setdefault는 원자적)"""
+    lock = _sheet_write_locks.get(worker_id)
+    if lock is None:
+        lock = _sheet_write_locks.setdefault(worker_id, threading.Lock())
+    return lock
+
+# 셀 단위 쓰기 묶음 처리 (SKIP 표시 등): 짧은 시간 안에 들어온 쓰기를 values_batch_update 한 번으로 전송
+SHEET_WRITE_BATCH_WINDOW = 0.2  # 초
+SHEET_WRITE_BATCH_MAX = 20
+
+class SheetCellWriteBuffer:
+    """
+    여러 요청의 셀 쓰기를 모아 한 번의 API 호출로 보내는 버퍼 (group commit)
+    
+    write_async()는 버퍼에 넣고 바로 반환하며, 묶음의 첫 쓰기가 sheets_background_executor에서
+    SHEET_WRITE_BATCH_WINDOW 동안 기다렸다가 그 사이 쌓인 쓰기를 모두 전송함.
+    전송 전 읽기는 호출부가 patch_sheets_data_cache로 미리 반영해 둔 캐시 값을 보게 됨.
+    재시도는 call_sheets가 맡고, 그래도 실패한 쓰기는 failures에 남기고 해당 작업자 데이터 캐시를 비움.
+    """
+    
+    def __init__(self, window=SHEET_WRITE_BATCH_WINDOW, max_items=SHEET_WRITE_BATCH_MAX):
+        self.window = window
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._pending = []
+        self._full = threading.Event()
+        self.failures = deque(maxlen=100)  # 최근 비동기 쓰기 실패 기록
+    
+    def _enqueue(self, sheet_name, cell, value):
+        """쓰기 항목을 버퍼에 추가. 이번 묶음의 첫 쓰기인지 반환"""
+        item = {
+            'sheet_name': sheet_name,
+            'data': {'range': f"{_sheet_range(sheet_name)}!{cell}", 'values': [[value]]}
         }
-        
-        return jsonify(response_data)
+        with self._lock:
+            self._pending.append(item)
+            is_leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_items:
+                self._full.set()
+        return is_leader
+    
+    def _flush_after_window(self, spreadsheet):
+        """대기 시간 동안 쓰기를 모은 뒤 한 번에 전송"""
+        self._full.wait(timeout=self.window)
+        with self._lock:
+            batch, self._pending = self._pending, []
+            self._full.clear()
+        try:
+            call_sheets(spreadsheet.values_batch_update, {
+                'valueInputOption': 'RAW',
+                'data': [entry['data'] for entry in batch]
+            })
+            if len(batch) > 1:
+                print(f"[DEBUG] 시트 셀 쓰기 {len(batch)}건을 한 번에 전송")
+        except Exception as e:
+            for entry in batch:
+                # 응답은 이미 나갔으므로 기록만 남기고, 미리 반영해 둔 캐시는 비워서 시트 값을 다시 읽게 함
+                print(f"[ERROR] 시트 셀 쓰기 실패 ({entry['data']['range']}): {e}")
+                self.failures.append({
+                    'worker_id': entry['sheet_name'],
+                    'range': entry['data']['range'],
+                    'value': entry['data']['values'][0][0],
+                    'error': str(e),
+                    'time': time.time()
+                })
+                clear_sheets_data_cache(entry['sheet_name'])
+    
+    def write_async(self, spreadsheet, sheet_name, cell, value):
+        """sheet_name 시트의 cell(A1 표기)에 value 기록을 예약하고 바로 반환"""
+        is_leader = self._enqueue(sheet_name, cell, value)
+        if is_leader:
+            sheets_background_executor.submit(self._flush_after_window, spreadsheet)
+    
+    def pending_count(self):
+        """아직 전송되지 않은 쓰기 개수"""
+        with self._lock:
+            return len(self._pending)
+
+sheet_cell_writer = SheetCellWriteBuffer()
 
 
 def save_to_google_sheets(worker_id, annotation, image_info):
@@ -2775,22 +3899,13 @@ def save_to_google_sheets(worker_id, annotation, image_info):
         
         # 작업자별 시트 가져오기 또는 생성
         sheet_name = worker_id
+        created_sheet = False
         try:
-            worksheet = spreadsheet.worksheet(sheet_name)
+            worksheet = call_sheets(spreadsheet.worksheet, sheet_name)
         except gspread.exceptions.WorksheetNotFound:
-            # 시트가 없으면 생성
-            worksheet = spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
-            # 헤더 추가
-            headers = [
-                '저장시간', 'Image ID', 'Image Path', 'Image Resolution', 
-                'Question', 'Response', 'Rationale', 'View', 'Bbox', 'SKIP'
-            ]
-            worksheet.append_row(headers)
-            # 헤더 스타일 설정 (선택사항)
-            try:
-                worksheet.format('A1:J1', {'textFormat': {'bold': True}})
-            except:
-                pass
+            # 시트가 없으면 생성 (헤더는 아래에서 첫 행 데이터와 함께 한 번에 기록)
+            worksheet = call_sheets(spreadsheet.add_worksheet, title=sheet_name, rows=1000, cols=20, retry_statuses=(429,))
+            created_sheet = True
         
         # Bbox를 문자열로 변환
         bbox_str = ''
@@ -2808,7 +3923,7 @@ def save_to_google_sheets(worker_id, annotation, image_info):
         # 행 데이터 준비
         skip_value = annotation.get('skip', '') or ''
         row_data = [
-            datetime.now().strftime('%Y-%m-%d %H:%M:%S'),  # 저장시간
+            datetime.now().isoformat(sep=' ', timespec='seconds'),  # 저장시간
             annotation.get('image_id', ''),
             annotation.get('image_path', ''),
             annotation.get('image_resolution', ''),
@@ -2820,23 +3935,41 @@ def save_to_google_sheets(worker_id, annotation, image_info):
             skip_value
         ]
         
+        if created_sheet:
+            # 새 시트: 헤더 + 첫 행을 한 번의 API 호출로 기록 (기존 행이 없으므로 검색 생략)
+            call_sheets(worksheet.update, 'A1:J2', [SHEET_HEADERS, row_data])
+            clear_sheet_header_cache(sheet_name)
+            format_sheet_header_async(worksheet)
+            patch_sheets_data_cache(worker_id, annotation.get('image_id', ''), dict(zip(SHEET_HEADERS, row_data)))
+            return True
+        
         # 같은 image_id가 이미 있는지 확인 (업데이트)
-        existing_rows = worksheet.get_all_values()
+        # 전체 시트를 읽지 않고 Image ID 컬럼(B열)에서만 찾음 (skip_image와 같은 방식)
         row_to_update = None
-        for idx, row in enumerate(existing_rows[1:], start=2):  # 헤더 제외
-            if len(row) > 1 and str(row[1]) == str(annotation.get('image_id', '')):
-                row_to_update = idx
-                break
+        try:
+            cell = call_sheets(worksheet.find, str(annotation.get('image_id', '')), in_column=2)  # B열 = Image ID
+            if cell and cell.row > 1:  # 헤더 제외
+                row_to_update = cell.row
+        except gspread.exceptions.CellNotFound:
+            row_to_update = None
         
         if row_to_update:
             # 기존 행 업데이트
-            worksheet.update(f'A{row_to_update}:J{row_to_update}', [row_data])
+            call_sheets(worksheet.update, f'A{row_to_update}:J{row_to_update}', [row_data])
         else:
             # 새 행 추가
-            worksheet.append_row(row_data)
+            call_sheets(worksheet.append_row, row_data, retry_statuses=(429,))
         
-        # 데이터 캐시 무효화 (해당 작업자만)
-        clear_sheets_data_cache(worker_id)
+        # 데이터 캐시에서 해당 행만 갱신 (A~J열에 쓴 값을 실제 헤더명으로 매핑, 다음 읽기에서 전체 시트를 다시 받지 않음)
+        try:
+            headers = get_sheet_headers(sheet_name, worksheet)
+            patch_sheets_data_cache(worker_id, annotation.get('image_id', ''), {
+                header: value for header, value in zip(headers, row_data) if header
+            })
+        except Exception as e:
+            # 저장은 이미 성공했으므로 캐시만 무효화
+            print(f"[WARN] 시트 헤더 조회 실패, 데이터 캐시 무효화: {e}")
+            clear_sheets_data_cache(worker_id)
         return True
         
     except Exception as e:
@@ -2848,7 +3981,7 @@ def save_to_google_sheets(worker_id, annotation, image_info):
         raise
 
 
-def read_from_google_sheets(worker_id, use_cache=True, force_refresh=False):
+def read_from_google_sheets(worker_id, use_cache=True, force_refresh=False, max_age=None):
     """
     Google Sheets에서 작업자의 어노테이션 데이터 읽기 (캐싱 지원)
     
@@ -2856,6 +3989,8 @@ def read_from_google_sheets(worker_id, use_cache=True, force_refresh=False):
         worker_id: 작업자 ID (예: "test")
         use_cache: 캐시 사용 여부 (기본값: True)
         force_refresh: 강제 새로고침 (캐시 무시, 기본값: False)
+        max_age: 허용할 캐시 나이(초). None이면 CACHE_TTL
+            (쓰기 시 clear_sheets_data_cache로 해당 작업자 캐시는 바로 무효화됨)
         
     Returns:
         리스트: 각 행의 데이터 딕셔너리 리스트
@@ -2864,19 +3999,58 @@ def read_from_google_sheets(worker_id, use_cache=True, force_refresh=False):
     if not google_sheets_client:
         return []
     
-    global sheets_data_cache
+    cache_entry = _get_sheets_cache_entry(worker_id)
     
     # 캐시 확인 (force_refresh가 False이고 use_cache가 True일 때만)
     if use_cache and not force_refresh:
-        if worker_id in sheets_data_cache:
-            cache_entry = sheets_data_cache[worker_id]
+        with cache_entry['lock']:
+            cache_age = time.time() - cache_entry.get('timestamp', 0)
+            ttl = CACHE_TTL if max_age is None else max_age
+            if cache_age < ttl and cache_entry.get('data') is not None:
+                # 캐시 히트 - 캐시된 데이터 반환
+                print(f"[DEBUG] 캐시 히트: {worker_id} (캐시 나이: {cache_age:.1f}초)")
+                return cache_entry['data']
+    
+    # 캐시 미스 동시 요청 처리: 이미 같은 작업자 데이터를 읽는 중이면 API를 다시 호출하지 않고 그 결과를 기다림
+    # (force_refresh는 진행 중인 호출이 저장 이전 데이터일 수 있으므로 기다리지 않고 직접 호출)
+    inflight = None
+    if not force_refresh:
+        with cache_entry['lock']:
+            if cache_entry['inflight'] is not None:
+                waiting_on = cache_entry['inflight']
+            else:
+                waiting_on = None
+                inflight = cache_entry['inflight'] = threading.Event()
+        if waiting_on is not None:
+            print(f"[DEBUG] 캐시 미스: {worker_id} - 진행 중인 API 호출 결과 대기")
+            waiting_on.wait(timeout=SHEETS_INFLIGHT_TIMEOUT)
             with cache_entry['lock']:
-                cache_age = time.time() - cache_entry.get('timestamp', 0)
-                if cache_age < CACHE_TTL and cache_entry.get('data') is not None:
-                    # 캐시 히트 - 캐시된 데이터 반환
-                    print(f"[DEBUG] 캐시 히트: {worker_id} (캐시 나이: {cache_age:.1f}초)")
-                    return cache_entry['data']
+                return cache_entry['data'] if cache_entry.get('data') is not None else []
     
+    try:
+        return _fetch_from_google_sheets(worker_id, cache_entry)
+    finally:
+        if inflight is not None:
+            with cache_entry['lock']:
+                cache_entry['inflight'] = None
+            inflight.set()
+
+
+def _get_sheets_cache_entry(worker_id):
+    """작업자별 데이터 캐시 항목 반환 (없으면 생성)"""
+    with sheets_data_cache_lock:
+        if worker_id not in sheets_data_cache:
+            sheets_data_cache[worker_id] = {
+                'data': None,
+                'timestamp': 0,
+                'lock': threading.RLock(),
+                'inflight': None  # API 호출 진행 중이면 threading.Event
+            }
+        return sheets_data_cache[worker_id]
+
+
+def _fetch_from_google_sheets(worker_id, cache_entry):
+    """read_from_google_sheets의 캐시 미스 처리: 실제 API 호출 후 캐시 갱신"""
     # 캐시 미스 또는 만료 - 실제 API 호출
     print(f"[DEBUG] 캐시 미스: {worker_id} - API 호출")
     
@@ -2885,61 +4059,52 @@ def read_from_google_sheets(worker_id, use_cache=True, force_refresh=False):
         spreadsheet = get_spreadsheet()
         if not spreadsheet:
             # 429 에러 등으로 스프레드시트를 열 수 없을 때 캐시된 데이터 반환 시도
-            if worker_id in sheets_data_cache:
-                cache_entry = sheets_data_cache[worker_id]
-                with cache_entry['lock']:
-                    if cache_entry.get('data') is not None:
-                        print(f"[DEBUG] 스프레드시트 열기 실패, 캐시된 데이터 반환: {worker_id}")
-                        return cache_entry['data']
+            with cache_entry['lock']:
+                if cache_entry.get('data') is not None:
+                    print(f"[DEBUG] 스프레드시트 열기 실패, 캐시된 데이터 반환: {worker_id}")
+                    return cache_entry['data']
             return []  # 할당량 초과 등으로 스프레드시트를 열 수 없음
         
-        # 작업자별 시트 가져오기
+        # 작업자별 시트의 모든 데이터 가져오기
+        # spreadsheet.worksheet()는 시트 메타데이터를 따로 요청하므로, 시트 이름 범위로 값만 한 번에 요청
         sheet_name = worker_id
         try:
-            worksheet = spreadsheet.worksheet(sheet_name)
-        except gspread.exceptions.WorksheetNotFound:
-            print(f"[WARN] 시트 '{sheet_name}'를 찾을 수 없습니다.")
-            return []
-        
-        # 모든 데이터 가져오기
-        all_values = worksheet.get_all_values()
+            response = call_sheets(
+                spreadsheet.values_get,
+                _sheet_range(sheet_name),
+                params={'majorDimension': 'ROWS', 'valueRenderOption': 'FORMATTED_VALUE'},
+            )
+        except gspread.exceptions.APIError as e:
+            # 없는 시트 이름은 범위 해석 실패(400)로 돌아옴
+            if getattr(e.response, 'status_code', None) == 400:
+                print(f"[WARN] 시트 '{sheet_name}'를 찾을 수 없습니다.")
+                return []
+            raise
+        all_values = response.get('values', [])
         if len(all_values) < 2:  # 헤더만 있거나 비어있음
             return []
         
         # 헤더 추출
         headers = all_values[0]
         
-        # 헤더 인덱스 찾기
-        header_indices = {}
-        for idx, header in enumerate(headers):
-            header_indices[header] = idx
+        # 헤더 인덱스 찾기 (같은 헤더가 여러 번 있으면 마지막 열 사용)
+        header_items = tuple({header: idx for idx, header in enumerate(headers)}.items())
+        width = len(headers)
         
-        # 데이터 행 처리
+        # 데이터 행 처리 (짧은 행은 한 번에 빈 값으로 채운 뒤 인덱스로 바로 읽음)
         result = []
         for row in all_values[1:]:  # 헤더 제외
             if len(row) == 0 or not row[1]:  # Image ID가 없으면 스킵
                 continue
             
-            row_data = {}
-            for header, idx in header_indices.items():
-                if idx < len(row):
-                    row_data[header] = row[idx]
-                else:
-                    row_data[header] = ''
-            
-            result.append(row_data)
+            if len(row) < width:
+                row = row + [''] * (width - len(row))
+            result.append({header: row[idx] for header, idx in header_items})
         
         # 캐시에 저장 (성공한 경우만)
-        if worker_id not in sheets_data_cache:
-            sheets_data_cache[worker_id] = {
-                'data': [],
-                'timestamp': 0,
-                'lock': threading.Lock()
-            }
-        
-        with sheets_data_cache[worker_id]['lock']:
-            sheets_data_cache[worker_id]['data'] = result
-            sheets_data_cache[worker_id]['timestamp'] = time.time()
+        with cache_entry['lock']:
+            cache_entry['data'] = result
+            cache_entry['timestamp'] = time.time()
             print(f"[DEBUG] 캐시 저장: {worker_id} ({len(result)}개 행)")
         
         return result
@@ -2952,12 +4117,10 @@ def read_from_google_sheets(worker_id, use_cache=True, force_refresh=False):
             clear_spreadsheet_cache()
             # 데이터 캐시는 유지 (오래된 데이터라도 보여주는 것이 나음)
             # 캐시가 있으면 캐시된 데이터 반환 시도
-            if worker_id in sheets_data_cache:
-                cache_entry = sheets_data_cache[worker_id]
-                with cache_entry['lock']:
-                    if cache_entry.get('data') is not None:
-                        print(f"[DEBUG] 429 에러 발생, 캐시된 데이터 반환: {worker_id}")
-                        return cache_entry['data']
+            with cache_entry['lock']:
+                if cache_entry.get('data') is not None:
+                    print(f"[DEBUG] 429 에러 발생, 캐시된 데이터 반환: {worker_id}")
+                    return cache_entry['data']
             # 캐시가 없으면 빈 리스트 반환
             return []
         else:
@@ -2990,49 +4153,39 @@ def update_revision_status(worker_id, image_id, status='수정완료'):
         spreadsheet = get_spreadsheet()
         if not spreadsheet:
             return False  # 할당량 초과 등으로 스프레드시트를 열 수 없음
-        worksheet = spreadsheet.worksheet(worker_id)
+        worksheet = call_sheets(spreadsheet.worksheet, worker_id)
         
-        # 모든 데이터 가져오기
-        all_values = worksheet.get_all_values()
-        if len(all_values) < 2:
-            return False
-        
-        # 헤더에서 열 인덱스 찾기
-        headers = all_values[0]
-        print(f"[DEBUG] 헤더 목록: {headers}")
-        image_id_col = None
-        revision_status_col = None
-        
-        for idx, header in enumerate(headers):
-            header_clean = header.strip()
-            if header_clean == 'Image ID' or header_clean == 'image_id':
-                image_id_col = idx
-                print(f"[DEBUG] Image ID 열 발견: 인덱스 {idx}")
-            if header_clean == '수정여부' or header_clean == '수정 여부':
-                revision_status_col = idx
-                print(f"[DEBUG] 수정여부 열 발견: 인덱스 {idx}")
+        # 헤더에서 열 인덱스 찾기 (캐싱된 정규화 헤더 사용, 전체 시트는 읽지 않음)
+        headers = get_sheet_header_index(worker_id, worksheet)
+        image_id_col = headers.get('IMAGEID')
+        revision_status_col = headers.get('수정여부')
         
         if image_id_col is None:
             print("[WARN] Image ID 열을 찾을 수 없습니다.")
-            print(f"[WARN] 사용 가능한 헤더: {headers}")
+            print(f"[WARN] 사용 가능한 헤더: {list(headers)}")
             return False
         
         if revision_status_col is None:
             print("[WARN] 수정여부 열을 찾을 수 없습니다.")
-            print(f"[WARN] 사용 가능한 헤더: {headers}")
+            print(f"[WARN] 사용 가능한 헤더: {list(headers)}")
             return False
         
-        # 해당 image_id 찾아서 업데이트
-        for row_idx, row in enumerate(all_values[1:], start=2):  # 헤더 제외, 1-based index
-            if len(row) > image_id_col and str(row[image_id_col]) == str(image_id):
-                # 수정여부 열 업데이트 (update_cell 사용: row, col은 1-based)
-                # revision_status_col은 0-based이므로 +1 해서 1-based로 변환
-                worksheet.update_cell(row_idx, revision_status_col + 1, status)
-                print(f"[INFO] Image ID {image_id}의 수정여부를 '{status}'로 업데이트했습니다. (셀: 행{row_idx}, 열{revision_status_col + 1})")
-                return True
+        # 해당 image_id 찾기 (Image ID 열에서만 검색, skip_image와 같은 방식)
+        try:
+            cell = call_sheets(worksheet.find, str(image_id), in_column=image_id_col + 1)
+        except gspread.exceptions.CellNotFound:
+            cell = None
+        if not cell or cell.row == 1:
+            print(f"[WARN] Image ID {image_id}를 찾을 수 없습니다.")
+            return False
         
-        print(f"[WARN] Image ID {image_id}를 찾을 수 없습니다.")
-        return False
+        # 수정여부 열 업데이트 (update_cell 사용: row, col은 1-based)
+        # revision_status_col은 0-based이므로 +1 해서 1-based로 변환
+        call_sheets(worksheet.update_cell, cell.row, revision_status_col + 1, status)
+        revision_header = next(header for header, idx in headers.items() if idx == revision_status_col)
+        patch_sheets_data_cache(worker_id, image_id, {revision_header: status})
+        print(f"[INFO] Image ID {image_id}의 수정여부를 '{status}'로 업데이트했습니다. (셀: 행{cell.row}, 열{revision_status_col + 1})")
+        return True
         
     except Exception as e:
         print(f"[ERROR] 수정여부 업데이트 중 오류: {e}")
@@ -3050,25 +4203,18 @@ def remove_duplicate_annotations(json_path):
         json_path: JSON 파일 경로
         
     Returns:
-        제거된 중복 개수
+        (제거된 중복 개수, 정리 후 어노테이션 리스트) - 읽기/저장에 실패하면 리스트는 None
     """
     if not os.path.exists(json_path):
-        return 0
+        return 0, []
     
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            annotations = json.load(f)
+        annotations = _load_json_file(json_path)
         
-        # image_id를 키로 하는 딕셔너리로 변환 (중복 시 마지막 것만 유지)
-        seen = {}
-        duplicates_removed = 0
-        
-        for ann in annotations:
-            image_id = ann.get('image_id')
-            if image_id is not None:
-                if image_id in seen:
-                    duplicates_removed += 1
-                seen[image_id] = ann
+        # image_id를 키로 하는 딕셔너리로 변환 (중복 시 마지막 것만 유지, 위치는 처음 나온 자리)
+        with_id = [ann for ann in annotations if ann.get('image_id') is not None]
+        seen = {ann['image_id']: ann for ann in with_id}
+        duplicates_removed = len(with_id) - len(seen)
         
         # 중복이 있으면 파일 저장
         if duplicates_removed > 0:
@@ -3076,34 +4222,15 @@ def remove_duplicate_annotations(json_path):
             unique_annotations = list(seen.values())
             
             # 원자적 쓰기로 저장
-            output_dir = os.path.dirname(json_path)
-            json_str = json.dumps(unique_annotations, indent=2, ensure_ascii=False)
-            # bbox 배열을 한 줄로 변경
-            json_str = re.sub(
-                r'"bbox":\s*\[\s*\n\s*([^\]]+?)\s*\n\s*\]',
-                lambda m: f'"bbox": [{re.sub(r"\\s+", " ", m.group(1).strip())}]',
-                json_str,
-                flags=re.MULTILINE
-            )
-            
-            temp_fd, temp_path = tempfile.mkstemp(dir=output_dir, suffix='.json.tmp', text=True)
-            try:
-                with os.fdopen(temp_fd, 'w', encoding='utf-8') as f:
-                    f.write(json_str)
-                shutil.move(temp_path, json_path)
-            except Exception:
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
-                raise
+            _atomic_write_text(json_path, _dumps_annotations(unique_annotations))
             
             print(f"[INFO] {json_path}: {duplicates_removed}개 중복 어노테이션 제거됨")
+            return duplicates_removed, unique_annotations
         
-        return duplicates_removed
+        return 0, annotations
     except Exception as e:
         print(f"[ERROR] {json_path} 중복 제거 실패: {e}")
-        return 0
+        return 0, None
 
 
 @app.route('/api/sync_from_sheets', methods=['GET'])
@@ -3119,17 +4246,18 @@ def sync_from_sheets():
         # 구글 시트에서 데이터 읽기
         sheet_data = read_from_google_sheets(worker_id)
         
-        # 검수 상태별로 분류
+        # 검수 상태별로 분류 ((정렬 키, image_info) 쌍으로 모은 뒤 정렬)
         passed_images = []  # 통과
         failed_images = []  # 불통
         completed_images = []  # 납품 완료
+        buckets = {'통과': passed_images, '불통': failed_images, '납품 완료': completed_images}
         
         for row in sheet_data:
-            image_id = row.get('Image ID', '') or row.get('image_id', '')
-            review_status = row.get('검수', '') or row.get('검수 상태', '')
-            note = row.get('비고', '') or row.get('검수 의견', '')
-            revision_status = row.get('수정여부', '') or row.get('수정 여부', '')
-            view = row.get('View', '') or row.get('view', '')
+            image_id = get_sheet_field(row, 'image_id')
+            review_status = get_sheet_field(row, 'review')
+            note = get_sheet_field(row, 'note')
+            revision_status = get_sheet_field(row, 'revision')
+            view = get_sheet_field(row, 'view')
             
             if not image_id:
                 continue
@@ -3138,25 +4266,24 @@ def sync_from_sheets():
             if view and view.lower() != 'ego':
                 continue
             
-            image_info = {
-                'image_id': int(image_id) if image_id.isdigit() else image_id,
+            bucket = buckets.get(review_status)
+            if bucket is None:
+                continue
+            
+            # 숫자가 아닌 image_id는 정렬 키 0 (맨 앞)
+            sort_key = int(image_id) if image_id.isdigit() else 0
+            bucket.append((sort_key, {
+                'image_id': sort_key if image_id.isdigit() else image_id,
                 'review_status': review_status,
                 'note': note,
                 'revision_status': revision_status,
                 'row_data': row
-            }
-            
-            if review_status == '통과':
-                passed_images.append(image_info)
-            elif review_status == '불통':
-                failed_images.append(image_info)
-            elif review_status == '납품 완료':
-                completed_images.append(image_info)
-        
-        # image_id로 정렬하여 일관성 보장
-        passed_images.sort(key=lambda x: x['image_id'] if isinstance(x['image_id'], int) else 0)
-        failed_images.sort(key=lambda x: x['image_id'] if isinstance(x['image_id'], int) else 0)
-        completed_images.sort(key=lambda x: x['image_id'] if isinstance(x['image_id'], int) else 0)
+            }))
+        
+        # image_id로 정렬하여 일관성 보장 (정렬 키는 위에서 한 번만 계산)
+        for bucket in buckets.values():
+            bucket.sort(key=itemgetter(0))
+            bucket[:] = [image_info for _, image_info in bucket]
         
         return jsonify({
             'success': True,
@@ -3174,6 +4301,32 @@ def sync_from_sheets():
         return jsonify({'error': f'동기화 실패: {str(e)}'}), 500
 
 
+def _image_id_key(image_id):
+    """image_id를 조회 키 문자열로 통일 (12, "12", " 12 "가 같은 키가 되도록, 정수가 아니면 strip한 문자열)"""
+    try:
+        return str(int(image_id))
+    except (TypeError, ValueError):
+        return str(image_id).strip()
+
+
+def _review_status_lookup(sheet_data):
+    """시트 행 리스트 -> {image_id 문자열: {'review_status', 'note', 'revision_status'}} (한 번만 빌드해 여러 ID 조회)"""
+    lookup = {}
+    for row in sheet_data:
+        row_image_id = get_sheet_field(row, 'image_id')
+        if not row_image_id:
+            continue
+        key = _image_id_key(row_image_id)
+        if key in lookup:  # 같은 image_id가 여러 행이면 첫 행 사용 (기존 선형 검색과 동일)
+            continue
+        lookup[key] = {
+            'review_status': get_sheet_field(row, 'review'),
+            'note': get_sheet_field(row, 'note'),
+            'revision_status': get_sheet_field(row, 'revision')
+        }
+    return lookup
+
+
 @app.route('/api/get_review_status/<int:image_id>', methods=['GET'])
 def get_review_status(image_id):
     """
@@ -3188,20 +4341,13 @@ def get_review_status(image_id):
         sheet_data = read_from_google_sheets(worker_id)
         
         # 해당 image_id 찾기
-        for row in sheet_data:
-            row_image_id = row.get('Image ID', '') or row.get('image_id', '')
-            if str(row_image_id) == str(image_id):
-                review_status = row.get('검수', '') or row.get('검수 상태', '')
-                note = row.get('비고', '') or row.get('검수 의견', '')
-                revision_status = row.get('수정여부', '') or row.get('수정 여부', '')
-                
-                return jsonify({
-                    'success': True,
-                    'image_id': image_id,
-                    'review_status': review_status,
-                    'note': note,
-                    'revision_status': revision_status
-                })
+        status_info = _review_status_lookup(sheet_data).get(_image_id_key(image_id))
+        if status_info:
+            return jsonify({
+                'success': True,
+                'image_id': image_id,
+                **status_info
+            })
         
         # 찾지 못한 경우
         return jsonify({
@@ -3229,6 +4375,88 @@ def get_review_status(image_id):
         return jsonify({'error': f'검수 상태 조회 실패: {str(e)}'}), 500
 
 
+@app.route('/api/get_review_status_batch', methods=['POST'])
+def get_review_status_batch():
+    """
+    여러 이미지의 검수 상태를 한 번에 가져오기
+    
+    Body: {'image_ids': [...], 'worker_id': ...}
+    Returns: {'success': True, 'statuses': {image_id: {'review_status', 'note', 'revision_status'} 또는 {}}}
+    """
+    try:
+        data = request.json or {}
+        worker_id = data.get('worker_id') or WORKER_ID
+        image_ids = data.get('image_ids') or []
+        if not worker_id:
+            return jsonify({'error': '작업자 ID가 필요합니다.'}), 400
+        if not isinstance(image_ids, list):
+            return jsonify({'error': 'image_ids는 리스트여야 합니다.'}), 400
+        
+        # 시트 데이터 읽기/조회 테이블 빌드는 요청당 한 번만
+        lookup = _review_status_lookup(read_from_google_sheets(worker_id))
+        return jsonify({
+            'success': True,
+            'statuses': {str(image_id): lookup.get(_image_id_key(image_id), {}) for image_id in image_ids}
+        })
+        
+    except Exception as e:
+        print(f"[ERROR] 검수 상태 일괄 조회 중 오류: {e}")
+        return jsonify({'error': f'검수 상태 조회 실패: {str(e)}'}), 500
+
+
+# 검수 상태 -> 이미지 상태 (/api/images_by_status, /api/work_statistics 공통, '납품완료'는 공백 없는 표기도 인정)
+_REVIEW_STATUS_TO_IMAGE_STATUS = {'통과': 'passed', '불통': 'failed', '납품 완료': 'delivered', '납품완료': 'delivered'}
+_SKIP_VALUES = {'SKIP', 'Y', 'YES'}
+_REVISION_DONE_STATUSES = frozenset(('수정완료', '수정 완료'))
+_EMPTY_SHEET_INFO = {}
+
+def _classify_sheet_status(sheet_info):
+    """
+    sheet_data_map 항목으로 이미지 상태 판단
+    
+    Returns:
+        'skipped', 'passed', 'failed', 'delivered', 'working', 'completed', 'unfinished' 중 하나
+    """
+    if sheet_info.get('skip', '').strip().upper() in _SKIP_VALUES:
+        return 'skipped'
+    review_status = sheet_info.get('review_status', '')
+    image_status = _REVIEW_STATUS_TO_IMAGE_STATUS.get(review_status)
+    if image_status:
+        return image_status
+    if sheet_info.get('저장시간', ''):
+        # 작업: 저장시간이 있지만 검수 상태가 없는 것 (SKIP은 이미 제외됨)
+        # 저장은 했지만 그 외 검수 상태인 경우 (기타)
+        return 'working' if not review_status else 'completed'
+    return 'unfinished'
+
+
+def _iter_images_by_status(image_ids, sheet_data_map, status):
+    """image_ids 중 status에 해당하는 이미지 레코드를 순서대로 생성 (이미지마다 상태를 한 번만 분류)"""
+    for image_id in image_ids:
+        sheet_info = sheet_data_map.get(image_id, _EMPTY_SHEET_INFO)
+        image_status = _classify_sheet_status(sheet_info)
+        
+        if status == 'pending':
+            # 검수 대기: 불통 상태이면서 수정완료인 것
+            if image_status != 'failed' or sheet_info.get('수정여부', '').strip() not in _REVISION_DONE_STATUSES:
+                continue
+            image_status = 'pending'
+        elif status != 'all' and status != image_status:
+            # 미작업(unfinished)에는 Google Sheets에 없는 이미지도 포함됨 (sheet_info가 비어 있으면 unfinished)
+            continue
+        
+        yield {
+            'image_id': image_id,
+            'status': image_status,
+            'review_status': sheet_info.get('review_status', ''),
+            '저장시간': sheet_info.get('저장시간', ''),
+            '수정여부': sheet_info.get('수정여부', ''),
+            '비고': sheet_info.get('비고', '')
+        }
+
+
+IMAGES_STREAM_CHUNK = 500  # /api/images_by_status 스트리밍 시 한 번에 직렬화할 레코드 수
+
 @app.route('/api/images_by_status', methods=['GET'])
 def get_images_by_status():
     """
@@ -3252,169 +4480,47 @@ def get_images_by_status():
             print(f"[WARN] 상태별 이미지 조회 중 Google Sheets 읽기 실패: {e}")
             sheet_data = []
         
-        # 모든 이미지 ID 가져오기 (ego_images 기준)
-        all_ego_image_ids = []
-        for image_id in annotator.image_ids:
-            image_info = annotator.coco.imgs[image_id]
-            file_name = image_info.get('file_name', '')
-            ego_path = os.path.join(annotator.ego_images_folder, file_name)
-            if os.path.exists(ego_path):
-                all_ego_image_ids.append(image_id)
-        
-        # Google Sheets 데이터를 image_id로 매핑
+        # Google Sheets 데이터를 image_id로 매핑 (시트에 있는 헤더만 조회, 숫자가 아닌 ID는 예외 없이 건너뜀)
+        aliases = resolve_sheet_aliases(sheet_data)
         sheet_data_map = {}
         for row in sheet_data:
-            image_id_str = row.get('Image ID', '') or row.get('image_id', '')
-            if image_id_str:
-                try:
-                    image_id = int(image_id_str)
-                    sheet_data_map[image_id] = {
-                        'review_status': row.get('검수', '') or row.get('검수 상태', ''),
-                        '저장시간': row.get('저장시간', ''),
-                        '수정여부': row.get('수정여부', '') or row.get('수정 여부', ''),
-                        '비고': row.get('비고', '') or row.get('검수 의견', ''),
-                        'view': row.get('View', '') or row.get('view', ''),
-                        'skip': row.get('SKIP', '') or row.get('skip', '') or row.get('스킵', '')
-                    }
-                except ValueError:
-                    continue
-        
-        # 상태별로 필터링
-        filtered_images = []
-        
-        for image_id in all_ego_image_ids:
-            sheet_info = sheet_data_map.get(image_id, {})
-            review_status = sheet_info.get('review_status', '')
-            저장시간 = sheet_info.get('저장시간', '')
-            
-            # 상태 판단
-            skip_status = sheet_info.get('skip', '').strip().upper()
-            image_status = 'unfinished'  # 기본값
-            if skip_status == 'SKIP' or skip_status == 'Y' or skip_status == 'YES':
-                image_status = 'skipped'
-            elif review_status == '통과':
-                image_status = 'passed'
-            elif review_status == '불통':
-                image_status = 'failed'
-            elif review_status == '납품 완료':
-                image_status = 'delivered'
-            elif 저장시간 and not review_status:
-                # 작업: 저장시간이 있지만 검수 상태가 없는 것 (SKIP은 이미 제외됨)
-                image_status = 'working'
-            elif 저장시간:  # 저장은 했지만 검수 상태가 없는 경우 (기타)
-                image_status = 'completed'
-            
-            # 필터링
-            if status == 'all':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'unfinished':
-                # 미작업: Google Sheets에 있지만 다른 상태가 아닌 것
-                # (작업, 납품완료, 통과, 불통, 검수대기, SKIP이 아닌 것)
-                if image_status == 'unfinished':
-                    filtered_images.append({
-                        'image_id': image_id,
-                        'status': image_status,
-                        'review_status': review_status,
-                        '저장시간': 저장시간,
-                        '수정여부': sheet_info.get('수정여부', ''),
-                        '비고': sheet_info.get('비고', '')
-                    })
-            elif status == 'passed' and image_status == 'passed':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'failed' and image_status == 'failed':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'skipped' and image_status == 'skipped':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'working' and image_status == 'working':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'delivered' and image_status == 'delivered':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'completed' and image_status == 'completed':
-                filtered_images.append({
-                    'image_id': image_id,
-                    'status': image_status,
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    '수정여부': sheet_info.get('수정여부', ''),
-                    '비고': sheet_info.get('비고', '')
-                })
-            elif status == 'pending':
-                # 검수 대기: 불통 상태이면서 수정완료인 것
-                if image_status == 'failed' and sheet_info.get('수정여부', '').strip() in ['수정완료', '수정 완료']:
-                    filtered_images.append({
-                        'image_id': image_id,
-                        'status': 'pending',
-                        'review_status': review_status,
-                        '저장시간': 저장시간,
-                        '수정여부': sheet_info.get('수정여부', ''),
-                        '비고': sheet_info.get('비고', '')
-                    })
-        
-        # 미작업 필터링: Google Sheets에 없는 이미지도 포함
-        if status == 'unfinished':
-            for image_id in all_ego_image_ids:
-                if image_id not in sheet_data_map:
-                    # Google Sheets에 없는 이미지는 미작업
-                    filtered_images.append({
-                        'image_id': image_id,
-                        'status': 'unfinished',
-                        'review_status': '',
-                        '저장시간': '',
-                        '수정여부': '',
-                        '비고': ''
-                    })
-        
-        # image_id로 정렬
-        filtered_images.sort(key=lambda x: x['image_id'])
+            image_id_str = get_sheet_field(row, 'image_id', aliases=aliases).strip()
+            if not image_id_str.isdigit():
+                continue
+            sheet_data_map[int(image_id_str)] = {
+                'review_status': get_sheet_field(row, 'review', aliases=aliases),
+                '저장시간': get_sheet_field(row, 'saved_at', aliases=aliases),
+                '수정여부': get_sheet_field(row, 'revision', aliases=aliases),
+                '비고': get_sheet_field(row, 'note', aliases=aliases),
+                'view': get_sheet_field(row, 'view', aliases=aliases),
+                'skip': get_sheet_field(row, 'skip', aliases=aliases)
+            }
         
-        return jsonify({
-            'success': True,
-            'status': status,
-            'images': filtered_images,
-            'count': len(filtered_images)
-        })
+        # 후보 이미지 ID (ego_images 기준, 캐싱)
+        # 미작업/전체는 시트에 없는 이미지도 포함해야 하므로 전체 ego 이미지를, 그 외 상태는 시트에 있는 이미지만 확인
+        if status in ('all', 'unfinished'):
+            candidate_ids = sorted(annotator.get_ego_image_ids())
+        else:
+            ego_image_id_set = annotator.get_ego_image_id_set()
+            candidate_ids = sorted(image_id for image_id in sheet_data_map if image_id in ego_image_id_set)
+        
+        # image_id 순으로 필터링: 분류/조회는 첫 yield 전에 모두 끝내서 오류는 아래 except의 500 응답으로 처리
+        images = list(_iter_images_by_status(candidate_ids, sheet_data_map, status))
+        dumps = app.json.dumps
+        
+        def generate():
+            # 전체 응답 문자열을 한 번에 만들지 않고 IMAGES_STREAM_CHUNK개씩 직렬화해 전송
+            yield '{"success": true, "status": ' + dumps(status) + ', "images": ['
+            for start in range(0, len(images), IMAGES_STREAM_CHUNK):
+                yield (',' if start else '') + ','.join(map(dumps, images[start:start + IMAGES_STREAM_CHUNK]))
+            yield f'], "count": {len(images)}}}'
+        
+        if accepts_gzip():
+            response = Response(stream_with_context(gzip_stream(generate())), mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+            response.vary.add('Accept-Encoding')
+            return response
+        return Response(stream_with_context(generate()), mimetype='application/json')
         
     except Exception as e:
         print(f"[ERROR] 상태별 이미지 조회 중 오류: {e}")
@@ -3446,150 +4552,112 @@ def skip_image():
             return False  # 할당량 초과 등으로 스프레드시트를 열 수 없음
         sheet_name = worker_id
         
+        sheet_created = False
         try:
-            worksheet = spreadsheet.worksheet(sheet_name)
+            worksheet = call_sheets(spreadsheet.worksheet, sheet_name)
         except gspread.exceptions.WorksheetNotFound:
             # 시트가 없으면 생성
-            worksheet = spreadsheet.add_worksheet(title=sheet_name, rows=1000, cols=20)
+            worksheet = call_sheets(spreadsheet.add_worksheet, title=sheet_name, rows=1000, cols=20, retry_statuses=(429,))
             # 헤더 추가
-            headers = [
-                '저장시간', 'Image ID', 'Image Path', 'Image Resolution', 
-                'Question', 'Response', 'Rationale', 'View', 'Bbox', 'SKIP'
-            ]
-            worksheet.append_row(headers)
-            # 헤더 스타일 설정 (선택사항)
-            try:
-                worksheet.format('A1:J1', {'textFormat': {'bold': True}})
-            except:
-                pass
-        
-        # 기존 행 찾기 (API 호출 최소화: find 메서드 사용)
-        row_to_update = None
-        try:
-            # Image ID 컬럼(B열)에서 특정 image_id 찾기
-            cell = worksheet.find(str(image_id), in_column=2)  # B열 = Image ID
-            if cell:
-                row_to_update = cell.row
-                print(f"[DEBUG] Image ID {image_id}를 행 {row_to_update}에서 찾음")
-        except gspread.exceptions.CellNotFound:
-            print(f"[DEBUG] Image ID {image_id}를 찾을 수 없음 (새 행 추가)")
+            call_sheets(worksheet.append_row, SHEET_HEADERS, retry_statuses=(429,))
+            clear_sheet_header_cache(sheet_name)
+            format_sheet_header_async(worksheet)
+            sheet_created = True
+        
+        # SKIP 컬럼 위치 확인 (캐싱된 헤더, 정규화된 헤더명으로 조회)
+        # 행 검색 전에 확인해서 SKIP 컬럼이 없으면 find 호출 없이 바로 에러 반환
+        header_entry = _get_sheet_header_entry(sheet_name, worksheet)
+        header_index = header_entry['header_index']
+        skip_col = header_index.get('SKIP', header_index.get('스킵'))
+        if skip_col is None:
+            # 시트 구조가 바뀌었을 수 있으므로 헤더 캐시를 비우고 한 번 더 읽음
+            clear_sheet_header_cache(sheet_name)
+            header_entry = _get_sheet_header_entry(sheet_name, worksheet)
+            header_index = header_entry['header_index']
+            skip_col = header_index.get('SKIP', header_index.get('스킵'))
+        
+        if skip_col is None:
+            # 헤더에 SKIP 컬럼이 없으면 에러
+            app.logger.error("SKIP 헤더를 찾을 수 없음. 헤더 목록: %s", header_entry['headers'])
+            return jsonify({'error': 'SKIP 컬럼을 찾을 수 없습니다. Google Sheets에 SKIP 헤더가 있는지 확인해주세요.'}), 500
+        skip_col_index = skip_col + 1  # 1-based
+        
+        # 같은 작업자의 시트 쓰기는 한 번에 하나씩 (행 검색 후 추가 사이에 다른 요청이 같은 행을 추가하지 않도록)
+        with get_sheet_write_lock(worker_id):
+            # 기존 행 찾기 (API 호출 최소화: find 메서드 사용, 방금 만든 시트는 헤더뿐이므로 검색 생략)
             row_to_update = None
-        except Exception as e:
-            print(f"[WARN] find 메서드 실패, 전체 검색으로 대체: {e}")
-            # find 실패 시 전체 검색 (최후의 수단)
-            try:
-                existing_rows = worksheet.get_all_values()
-                for idx, row in enumerate(existing_rows[1:], start=2):  # 헤더 제외
-                    if len(row) > 1 and str(row[1]) == str(image_id):
-                        row_to_update = idx
-                        break
-            except Exception as e2:
-                print(f"[ERROR] 전체 검색도 실패: {e2}")
-                raise
+            if sheet_created:
+                app.logger.debug("새로 만든 시트이므로 Image ID %s 검색 생략 (새 행 추가)", image_id)
+            else:
+                try:
+                    # Image ID 컬럼(B열)에서 특정 image_id 찾기
+                    cell = call_sheets(worksheet.find, str(image_id), in_column=2)  # B열 = Image ID
+                    if cell:
+                        row_to_update = cell.row
+                        app.logger.debug("Image ID %s를 행 %d에서 찾음", image_id, row_to_update)
+                except gspread.exceptions.CellNotFound:
+                    app.logger.debug("Image ID %s를 찾을 수 없음 (새 행 추가)", image_id)
+                    row_to_update = None
+                except Exception as e:
+                    app.logger.warning("find 메서드 실패, Image ID 열 검색으로 대체: %s", e)
+                    # find 실패 시 Image ID 컬럼(B열)만 읽어서 검색 (최후의 수단, 전체 시트는 받지 않음)
+                    try:
+                        image_id_column = call_sheets(worksheet.col_values, 2)
+                        for idx, value in enumerate(image_id_column[1:], start=2):  # 헤더 제외
+                            if str(value) == str(image_id):
+                                row_to_update = idx
+                                break
+                    except Exception as e2:
+                        app.logger.error("Image ID 열 검색도 실패: %s", e2)
+                        raise
         
-        if row_to_update:
-            # 먼저 헤더 확인하여 SKIP 컬럼 위치 확인
-            headers = worksheet.row_values(1)
-            print(f"[DEBUG] 헤더 목록: {headers}")
-            skip_col_index = None
-            for idx, header in enumerate(headers, start=1):
-                header_upper = header.strip().upper() if header else ''
-                if header_upper in ['SKIP', '스킵']:
-                    skip_col_index = idx
-                    print(f"[DEBUG] SKIP 헤더를 인덱스 {idx}에서 찾음: '{header}'")
-                    break
-            
-            if not skip_col_index:
-                # 헤더에 SKIP 컬럼이 없으면 에러
-                print(f"[ERROR] SKIP 헤더를 찾을 수 없음. 헤더 개수: {len(headers)}")
-                print(f"[ERROR] 헤더 목록: {headers}")
-                return jsonify({'error': 'SKIP 컬럼을 찾을 수 없습니다. Google Sheets에 SKIP 헤더가 있는지 확인해주세요.'}), 500
+            if row_to_update:
+                # 헤더에서 찾은 컬럼 사용 (A=1, B=2, ..., Z=26, AA=27, ...)
+                col_letter = COL_LETTERS[skip_col_index - 1]
             
-            # 헤더에서 찾은 컬럼 사용 (A=1, B=2, ..., Z=26, AA=27, ...)
-            if skip_col_index <= 26:
-                col_letter = chr(64 + skip_col_index)  # A=65, B=66, ..., Z=90
+                # SKIP 값 업데이트 예약
+                app.logger.debug("SKIP 값 업데이트 예약: %s%d (행: %d, 열: %d)", col_letter, row_to_update, row_to_update, skip_col_index)
+                # SKIP 열에만 'skip' 표시 (소문자), 다른 열의 값은 건드리지 않음
+                # 동시에 들어온 다른 SKIP 쓰기와 묶어서 백그라운드에서 전송하고 응답은 바로 반환
+                # (전송 실패는 /api/skip/status에 기록되고 해당 작업자 캐시가 비워짐)
+                sheet_cell_writer.write_async(spreadsheet, sheet_name, f'{col_letter}{row_to_update}', 'skip')
+                # 데이터 캐시에는 바로 반영 (통계/필터가 전송 완료를 기다리지 않고 SKIP을 보도록)
+                patch_sheets_data_cache(worker_id, image_id, {header_entry['headers'][skip_col]: 'skip'})
+                return jsonify({
+                    'success': True,
+                    'queued': True,
+                    'message': 'SKIP 상태로 저장되었습니다.',
+                    'image_id': image_id
+                }), 202
             else:
-                # 26개 이상인 경우 (AA, AB, ...)
-                first_letter = chr(64 + ((skip_col_index - 1) // 26))
-                second_letter = chr(64 + ((skip_col_index - 1) % 26) + 1)
-                col_letter = first_letter + second_letter
-            
-            print(f"[DEBUG] SKIP 컬럼 위치: {col_letter}{row_to_update} (인덱스: {skip_col_index}, 헤더: '{headers[skip_col_index-1] if skip_col_index <= len(headers) else 'N/A'}')")
-            
-            # SKIP 값 업데이트 (확실하게 저장)
-            print(f"[DEBUG] SKIP 값 업데이트: {col_letter}{row_to_update} (행: {row_to_update}, 열: {skip_col_index})")
-            try:
-                # SKIP 열에만 'skip' 표시 (소문자)
-                # 다른 열의 값은 건드리지 않음
-                worksheet.update(f'{col_letter}{row_to_update}', [['skip']])
-                print(f"[DEBUG] SKIP 저장 성공: Image ID {image_id}, 위치: {col_letter}{row_to_update}")
-                # 데이터 캐시 무효화 (해당 작업자만)
-                clear_sheets_data_cache(worker_id)
-            except Exception as e:
-                print(f"[ERROR] SKIP 값 업데이트 실패: {e}")
-                import traceback
-                traceback.print_exc()
-                raise
-        else:
-            # 새 행 추가 (최소한의 데이터)
-            headers = worksheet.row_values(1)
-            print(f"[DEBUG] 새 행 추가 - 헤더 목록: {headers}")
-            
-            # SKIP 컬럼 위치 찾기
-            skip_col_index = None
-            for idx, header in enumerate(headers, start=1):
-                header_upper = header.strip().upper() if header else ''
-                if header_upper in ['SKIP', '스킵']:
-                    skip_col_index = idx
-                    print(f"[DEBUG] 새 행 추가 - SKIP 헤더를 인덱스 {idx}에서 찾음: '{header}'")
-                    break
-            
-            if not skip_col_index:
-                print(f"[ERROR] 새 행 추가 - SKIP 헤더를 찾을 수 없음. 헤더 개수: {len(headers)}")
-                return jsonify({'error': 'SKIP 컬럼을 찾을 수 없습니다. Google Sheets에 SKIP 헤더가 있는지 확인해주세요.'}), 500
-            
-            image_info = annotator.coco.imgs.get(image_id, {})
-            file_name = image_info.get('file_name', '')
-            # Image Path를 "/000000060515.jpg" 형식으로 변경
-            image_path = f"/{file_name}" if file_name else f"/{image_id:012d}.jpg"
-            
-            # 헤더 개수만큼 빈 리스트 생성
-            row_data = [''] * len(headers)
-            
-            # 기본 필수 데이터만 채우기
-            # 저장시간 찾기
-            for idx, header in enumerate(headers):
-                if header and '저장시간' in header:
-                    row_data[idx] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    break
-            
-            # Image ID 찾기
-            for idx, header in enumerate(headers):
-                if header and ('Image ID' in header or 'image_id' in header.lower()):
-                    row_data[idx] = image_id
-                    break
+                # 새 행 추가 (최소한의 데이터)
+                image_info = annotator.coco.imgs.get(image_id, {})
+                file_name = image_info.get('file_name', '')
+                # Image Path를 "/000000060515.jpg" 형식으로 변경
+                image_path = f"/{file_name}" if file_name else f"/{image_id:012d}.jpg"
             
-            # Image Path 찾기
-            for idx, header in enumerate(headers):
-                if header and ('Image Path' in header or 'image_path' in header.lower()):
-                    row_data[idx] = image_path
-                    break
+                # 헤더 개수만큼 빈 리스트 생성 (위에서 읽은 캐시 항목 재사용)
+                row_data = [''] * len(header_entry['headers'])
             
-            # View 찾기
-            for idx, header in enumerate(headers):
-                if header and header.strip().upper() == 'VIEW':
-                    row_data[idx] = 'ego'
-                    break
+                # 기본 필수 데이터만 채우기 (저장시간, Image ID, Image Path, View, 없는 헤더는 건너뜀)
+                for header_norm, value in (
+                    ('저장시간', datetime.now().isoformat(sep=' ', timespec='seconds')),
+                    ('IMAGEID', image_id),
+                    ('IMAGEPATH', image_path),
+                    ('VIEW', 'ego'),
+                ):
+                    idx = header_index.get(header_norm)
+                    if idx is not None:
+                        row_data[idx] = value
             
-            # SKIP 열에만 'skip' 저장 (정확한 위치)
-            row_data[skip_col_index - 1] = 'skip'  # 인덱스는 0부터 시작하므로 -1
+                # SKIP 열에 'skip' 저장 (위에서 확인한 위치)
+                row_data[skip_col] = 'skip'
             
-            print(f"[DEBUG] 새 행 추가 - row_data: {row_data}")
-            print(f"[DEBUG] 새 행 추가 - SKIP 값은 {skip_col_index}번째 열({chr(64 + skip_col_index) if skip_col_index <= 26 else 'N/A'})에 저장됨")
-            worksheet.append_row(row_data)
-            print(f"[DEBUG] SKIP 새 행 추가 성공: Image ID {image_id}")
-            # 데이터 캐시 무효화 (해당 작업자만)
-            clear_sheets_data_cache(worker_id)
+                app.logger.debug("새 행 추가 - row_data: %s", row_data)
+                call_sheets(worksheet.append_row, row_data, retry_statuses=(429,))
+                app.logger.debug("SKIP 새 행 추가 성공: Image ID %s", image_id)
+                # 데이터 캐시 무효화 (해당 작업자만)
+                clear_sheets_data_cache(worker_id)
         
         return jsonify({
             'success': True,
@@ -3609,17 +4677,45 @@ def skip_image():
                 'retry_after': 60  # 60초 후 재시도 권장
             }), 429
         else:
-            print(f"[ERROR] Google Sheets API 오류 ({error_code}): {e}")
-            import traceback
-            traceback.print_exc()
+            app.logger.exception("Google Sheets API 오류 (%s)", error_code)
             return jsonify({'error': f'Google Sheets API 오류: {str(e)}'}), 500
     except Exception as e:
-        print(f"[ERROR] SKIP 저장 중 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("SKIP 저장 중 오류")
         return jsonify({'error': f'SKIP 저장 실패: {str(e)}'}), 500
 
 
+# 작업 통계에 그대로 집계되는 이미지 상태 ('completed'/'unfinished'는 집계 제외)
+_STATISTICS_STATES = frozenset(('skipped', 'passed', 'failed', 'delivered', 'working'))
+
+def _classify_statistics_state(sheet_info):
+    """
+    작업 통계용 이미지 상태 (분류는 /api/images_by_status와 같은 _classify_sheet_status 사용)
+    
+    Returns:
+        'skipped', 'passed', 'failed', 'pending'(불통 + 수정완료), 'delivered', 'working', 또는 None(집계 제외)
+    """
+    state = _classify_sheet_status(sheet_info)
+    if state == 'failed' and sheet_info['수정여부'] in _REVISION_DONE_STATUSES:
+        # 검수 대기(수정완료)는 불통과 별도로 계산
+        return 'pending'
+    return state if state in _STATISTICS_STATES else None
+
+
+@app.route('/api/skip/status', methods=['GET'])
+def get_skip_write_status():
+    """백그라운드 SKIP 쓰기 상태 (전송 대기 개수, 최근 실패 목록)"""
+    worker_id = request.args.get('worker_id')
+    failures = [
+        failure for failure in list(sheet_cell_writer.failures)
+        if not worker_id or failure['worker_id'] == worker_id
+    ]
+    return jsonify({
+        'success': True,
+        'pending': sheet_cell_writer.pending_count(),
+        'failures': failures
+    })
+
+
 @app.route('/api/work_statistics', methods=['GET'])
 def get_work_statistics():
     """작업 통계 및 진행률 계산"""
@@ -3628,17 +4724,15 @@ def get_work_statistics():
         if not worker_id:
             return jsonify({'error': '작업자 ID가 필요합니다.'}), 400
         
-        sheet_data = read_from_google_sheets(worker_id)
-        print(f"[DEBUG] Google Sheets에서 읽은 데이터 개수: {len(sheet_data)}")
+        # 클라이언트가 ?max_age=초 로 허용 캐시 나이를 지정할 수 있음 (폴링 시 API 호출 줄이기)
+        max_age = request.args.get('max_age', type=float)
+        if max_age is not None:
+            max_age = max(max_age, 0.0)
+        sheet_data = read_from_google_sheets(worker_id, max_age=max_age)
+        app.logger.debug("Google Sheets에서 읽은 데이터 개수: %d", len(sheet_data))
         
-        # 모든 ego 이미지 개수
-        all_ego_count = 0
-        for image_id in annotator.image_ids:
-            image_info = annotator.coco.imgs[image_id]
-            file_name = image_info.get('file_name', '')
-            ego_path = os.path.join(annotator.ego_images_folder, file_name)
-            if os.path.exists(ego_path):
-                all_ego_count += 1
+        # 모든 ego 이미지 개수 (캐싱)
+        all_ego_count = len(annotator.get_ego_image_ids())
         
         # 상태별 카운트
         stats = {
@@ -3652,120 +4746,61 @@ def get_work_statistics():
             'skipped': 0
         }
         
-        # Google Sheets 데이터를 image_id로 매핑
+        # Google Sheets 데이터를 image_id로 매핑 (시트에 있는 헤더만 조회)
+        aliases = resolve_sheet_aliases(sheet_data)
         sheet_data_map = {}
         for row in sheet_data:
             # Image ID 찾기 (여러 가능한 컬럼명 시도)
-            image_id_str = row.get('Image ID', '') or row.get('image_id', '') or row.get('Image ID', '')
+            image_id_str = get_sheet_field(row, 'image_id', aliases=aliases).strip()
             if not image_id_str:
                 continue
-            
-            try:
-                image_id = int(image_id_str)
-                # View 컬럼 확인 (ego인지 확인)
-                view = row.get('View', '') or row.get('view', '') or ''
-                # View가 'ego'가 아니면 스킵 (ego 이미지만 통계에 포함)
-                if view and view.lower() != 'ego':
-                    continue
-                
-                # SKIP 컬럼 값 읽기 (대소문자 구분 없이)
-                skip_value = row.get('SKIP', '') or row.get('skip', '') or row.get('스킵', '')
-                # 검수 상태 읽기 (여러 가능한 컬럼명 시도)
-                review_status = row.get('검수', '') or row.get('검수 상태', '') or row.get('검수', '')
-                저장시간 = row.get('저장시간', '') or row.get('저장 시간', '')
-                수정여부 = row.get('수정여부', '') or row.get('수정 여부', '')
-                
-                sheet_data_map[image_id] = {
-                    'review_status': review_status,
-                    '저장시간': 저장시간,
-                    'skip': skip_value,  # 원본 값 저장 (나중에 .strip().upper() 처리)
-                    '수정여부': 수정여부,
-                    'view': view
-                }
-                
-                # 디버깅: 모든 데이터 출력
-                print(f"[DEBUG] Image ID {image_id}: View='{view}', 검수='{review_status}', SKIP='{skip_value}', 수정여부='{수정여부}'")
-            except (ValueError, TypeError) as e:
-                print(f"[WARN] Image ID 변환 실패: '{image_id_str}' - {e}")
+            # 숫자가 아닌 ID는 예외 처리 없이 분기로 건너뜀
+            if not image_id_str.isdigit():
+                app.logger.warning("Image ID 변환 실패: '%s'", image_id_str)
                 continue
-        
-        # Google Sheets에 있는 모든 image_id에 대해 상태 확인
-        # annotator.image_ids에 없는 image_id도 Google Sheets에 있으면 포함
-        processed_image_ids = set()  # 이미 처리한 image_id 추적
-        
-        # 1단계: Google Sheets에 있는 모든 image_id 처리
-        print(f"[DEBUG] sheet_data_map에 있는 image_id 개수: {len(sheet_data_map)}")
-        print(f"[DEBUG] sheet_data_map의 키: {list(sheet_data_map.keys())}")
-        
-        for image_id in sheet_data_map.keys():
-            print(f"[DEBUG] 처리 중인 Image ID: {image_id}")
-            sheet_info = sheet_data_map[image_id]
-            review_status = sheet_info.get('review_status', '')
-            저장시간 = sheet_info.get('저장시간', '')
-            skip_status_raw = sheet_info.get('skip', '')
-            skip_status = skip_status_raw.strip().upper() if skip_status_raw else ''
-            revision_status = sheet_info.get('수정여부', '')
-            view = sheet_info.get('view', '')
-            
-            print(f"[DEBUG] Image ID {image_id} 상태 확인: view='{view}', review_status='{review_status}', skip_status='{skip_status}', revision_status='{revision_status}'")
+            image_id = int(image_id_str)
             
-            # View가 'ego'가 아니면 스킵 (이미 sheet_data_map에 넣을 때 필터링했지만 다시 확인)
+            # View 컬럼 확인 (ego인지 확인)
+            view = get_sheet_field(row, 'view', aliases=aliases)
+            # View가 'ego'가 아니면 스킵 (ego 이미지만 통계에 포함)
             if view and view.lower() != 'ego':
-                print(f"[WARN] Image ID {image_id}의 View가 'ego'가 아닙니다: '{view}'")
                 continue
             
-            processed_image_ids.add(image_id)
-            
-            # SKIP 상태 우선 확인 (가장 먼저 확인)
-            if skip_status and (skip_status == 'SKIP' or skip_status == 'Y' or skip_status == 'YES'):
-                stats['skipped'] += 1
-                print(f"[DEBUG] SKIP 카운트: Image ID {image_id}, skip_status='{skip_status}' (원본: '{skip_status_raw}')")
-                continue  # SKIP이면 다른 상태 확인하지 않음
+            # SKIP 컬럼 값 읽기 (대소문자 구분 없이)
+            skip_value = get_sheet_field(row, 'skip', aliases=aliases)
+            # 검수 상태 읽기 (여러 가능한 컬럼명 시도)
+            review_status = get_sheet_field(row, 'review', aliases=aliases)
+            저장시간 = get_sheet_field(row, 'saved_at', aliases=aliases)
+            수정여부 = get_sheet_field(row, 'revision', aliases=aliases)
             
-            # 검수 상태 확인
-            if review_status == '통과':
-                stats['passed'] += 1
-                print(f"[DEBUG] 통과 카운트: Image ID {image_id}, review_status='{review_status}'")
-            elif review_status == '불통':
-                # 불통: 수정완료가 아닌 불통 상태만 카운트
-                # 검수 대기(수정완료)는 별도로 계산
-                if revision_status != '수정완료' and revision_status != '수정 완료':
-                    stats['failed'] += 1
-                    print(f"[DEBUG] 불통 카운트: Image ID {image_id}, review_status='{review_status}', 수정여부='{revision_status}'")
-            elif review_status == '납품 완료' or review_status == '납품완료':
-                stats['delivered'] += 1
-                print(f"[DEBUG] 납품완료 카운트: Image ID {image_id}, review_status='{review_status}'")
-            elif 저장시간 and not review_status:
-                # 작업: 저장시간이 있지만 검수 상태가 없는 것 (SKIP은 이미 제외됨)
-                stats['working'] += 1
-                print(f"[DEBUG] 작업 카운트: Image ID {image_id}, 저장시간='{저장시간}', review_status='{review_status}'")
-        
-        # 2단계: annotator.image_ids에 있지만 Google Sheets에 없는 image_id는 미작업으로 카운트하지 않음
-        # (이미 전체 개수에서 계산됨)
-        
-        # 미작업 계산: 전체 - 통과 - 불통 - 검수 대기 - SKIP
-        # 검수 대기는 불통 중 수정완료된 것들
-        pending_review_count = 0
-        for image_id in sheet_data_map.keys():
-            sheet_info = sheet_data_map[image_id]
-            view = sheet_info.get('view', '')
-            
-            # View가 'ego'가 아니면 스킵
-            if view and view.lower() != 'ego':
-                continue
-            
-            review_status = sheet_info.get('review_status', '')
-            revision_status = sheet_info.get('수정여부', '')
+            sheet_data_map[image_id] = {
+                'review_status': review_status,
+                '저장시간': 저장시간,
+                'skip': skip_value.strip().upper(),  # 비교용으로 미리 정규화
+                '수정여부': 수정여부,
+                'view': view
+            }
             
-            if review_status == '불통' and (revision_status == '수정완료' or revision_status == '수정 완료'):
-                pending_review_count += 1
-                print(f"[DEBUG] 검수대기 카운트: Image ID {image_id}, review_status='{review_status}', 수정여부='{revision_status}'")
+            # 디버깅: 모든 데이터 출력 (DEBUG 레벨에서만 포맷됨)
+            app.logger.debug("Image ID %s: View='%s', 검수='%s', SKIP='%s', 수정여부='%s'", image_id, view, review_status, skip_value, 수정여부)
+        
+        # Google Sheets에 있는 모든 image_id의 상태를 한 번에 분류
+        # (annotator.image_ids에 없는 image_id도 Google Sheets에 있으면 포함)
+        # annotator.image_ids에 있지만 Google Sheets에 없는 image_id는 미작업 (전체 개수에서 계산됨)
+        state_counts = Counter(_classify_statistics_state(sheet_info) for sheet_info in sheet_data_map.values())
+        for state in ('skipped', 'passed', 'failed', 'delivered', 'working'):
+            stats[state] += state_counts[state]
+        # 검수 대기: 불통 중 수정완료된 것들
+        pending_review_count = state_counts['pending']
         
         # 미작업 = 전체 이미지 - 작업 - 납품완료 - 통과 - 불통 - 검수대기 - SKIP
         # 디버깅: 각 카운트 출력
-        print(f"[DEBUG] 통계 계산: 전체={stats['total']}, 작업={stats['working']}, 납품완료={stats['delivered']}, 통과={stats['passed']}, 불통={stats['failed']}, 검수대기={pending_review_count}, SKIP={stats['skipped']}")
         stats['unfinished'] = stats['total'] - stats['working'] - stats['delivered'] - stats['passed'] - stats['failed'] - pending_review_count - stats['skipped']
-        print(f"[DEBUG] 미작업 계산 결과: {stats['unfinished']} = {stats['total']} - {stats['working']} - {stats['delivered']} - {stats['passed']} - {stats['failed']} - {pending_review_count} - {stats['skipped']}")
+        app.logger.debug(
+            "통계 계산: 전체=%d, 작업=%d, 납품완료=%d, 통과=%d, 불통=%d, 검수대기=%d, SKIP=%d -> 미작업=%d",
+            stats['total'], stats['working'], stats['delivered'], stats['passed'], stats['failed'],
+            pending_review_count, stats['skipped'], stats['unfinished']
+        )
         if stats['unfinished'] < 0:
             stats['unfinished'] = 0  # 음수 방지
         
@@ -3779,9 +4814,7 @@ def get_work_statistics():
         })
         
     except Exception as e:
-        print(f"[ERROR] 통계 조회 중 오류: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("통계 조회 중 오류")
         return jsonify({'error': f'통계 조회 실패: {str(e)}'}), 500
 
 
@@ -3789,11 +4822,16 @@ def get_work_statistics():
 def remove_duplicates():
     """중복 어노테이션 제거 API"""
     try:
-        exo_count = remove_duplicate_annotations(annotator.output_json_path_exo)
-        ego_count = remove_duplicate_annotations(annotator.output_json_path_ego)
-        
-        # 전체 annotations도 업데이트
-        annotator._reload_annotations()
+        # 저장과 겹치지 않도록 파일 잠금 (save_annotation과 같은 순서로 획득)
+        with file_locks['exo'], file_locks['ego']:
+            exo_count, exo_anns = remove_duplicate_annotations(annotator.output_json_path_exo)
+            ego_count, ego_anns = remove_duplicate_annotations(annotator.output_json_path_ego)
+            
+            # 전체 annotations도 업데이트 (방금 정리한 리스트를 그대로 사용, 파일 다시 읽지 않음)
+            if exo_anns is not None and ego_anns is not None:
+                annotator.annotations = exo_anns + ego_anns
+            else:
+                annotator._reload_annotations()
         
         return jsonify({
             'success': True,
@@ -3805,463 +4843,6 @@ def remove_duplicates():
         return jsonify({'error': f'Failed to remove duplicates: {e}'}), 500
 
 
-def create_template():
-    """Create HTML template for the annotation interface."""
-    template_dir = 'templates'
-    if not os.path.exists(template_dir):
-        os.makedirs(template_dir)
-
-    # index.html 덮어쓰기 방지 추가
-    target = os.path.join(template_dir, 'index.html')
-    if os.path.exists(target):
-        return
-    
-    html_content = '''<!DOCTYPE html>
-<html>
-<head>
-    <title>COCO Annotation Tool</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .container { display: flex; gap: 20px; }
-        .image-panel { flex: 2; }
-        .control-panel { flex: 1; min-width: 350px; }
-        .image-container { 
-            border: 2px solid #ccc; 
-            position: relative; 
-            display: inline-block;
-        }
-        #image { max-width: 100%; display: block; }
-        .bbox { 
-            position: absolute; 
-            border: 2px solid rgba(255, 0, 0, 0.7); 
-            background-color: rgba(255, 0, 0, 0.1);
-            cursor: pointer;
-            transition: all 0.2s ease;
-            z-index: 10;
-        }
-        .bbox:hover { 
-            border-color: rgba(255, 255, 0, 0.9);
-            background-color: rgba(255, 255, 0, 0.2);
-            transform: scale(1.05);
-            box-shadow: 0 0 10px rgba(255, 255, 0, 0.5);
-            z-index: 20;
-        }
-        .bbox.selected { 
-            border-color: rgba(0, 0, 255, 0.9);
-            background-color: rgba(0, 0, 255, 0.2);
-            border-width: 3px;
-        }
-        .bbox.selected:hover { 
-            border-color: rgba(0, 255, 255, 0.9);
-            background-color: rgba(0, 255, 255, 0.3);
-        }
-        .bbox-label {
-            position: absolute;
-            top: -20px;
-            left: 0;
-            background: rgba(0, 0, 0, 0.7);
-            color: white;
-            padding: 2px 5px;
-            font-size: 11px;
-            white-space: nowrap;
-            display: none;
-            pointer-events: none;
-        }
-        .bbox:hover .bbox-label {
-            display: block;
-        }
-        .form-group { margin-bottom: 15px; }
-        label { display: block; font-weight: bold; margin-bottom: 5px; }
-        textarea, input { width: 100%; padding: 8px; border: 1px solid #ccc; }
-        button { 
-            padding: 10px 15px; 
-            margin: 5px; 
-            border: none; 
-            cursor: pointer;
-        }
-        .btn-save { background-color: lightgreen; }
-        .btn-nav { background-color: lightblue; }
-        .status { 
-            position: fixed; 
-            bottom: 0; 
-            left: 0; 
-            right: 0; 
-            background: #f0f0f0; 
-            padding: 10px; 
-            border-top: 1px solid #ccc;
-        }
-    </style>
-</head>
-<body>
-    <h1>MS-COCO Annotation Tool (Web Version)</h1>
-    
-    <div class="container">
-        <div class="image-panel">
-            <div class="image-container" id="imageContainer">
-                <img id="image" src="" alt="COCO Image">
-            </div>
-        </div>
-        
-        <div class="control-panel">
-            <div class="form-group">
-                <label>Image Info:</label>
-                <div id="imageInfo">Loading...</div>
-            </div>
-            
-            <div class="form-group">
-                <label for="question">Question: 
-                    <span style="color: red;">*</span></label>
-                <textarea id="question" rows="4"></textarea>
-            </div>
-            
-            <div class="form-group">
-                <label for="response">Response: 
-                    <span style="color: red;">*</span></label>
-                <textarea id="response" rows="4"></textarea>
-            </div>
-            
-            <div class="form-group">
-                <label for="rationale">Rationale:</label>
-                <textarea id="rationale" rows="3"></textarea>
-            </div>
-            
-            <div class="form-group">
-                <label>View: <span style="color: red;">*</span></label>
-                <div>
-                    <input type="radio" id="viewExo" name="view" value="exo">
-                    <label for="viewExo">Exo</label>
-                </div>
-                <div>
-                    <input type="radio" id="viewEgo" name="view" value="ego">
-                    <label for="viewEgo">Ego</label>
-                </div>
-            </div>
-            
-            <div class="form-group">
-                <label for="selectedBboxes">Selected Bounding Boxes: 
-                    <span style="color: red;">*</span></label>
-                <textarea id="selectedBboxes" rows="3" readonly></textarea>
-                <button onclick="clearBboxes()">Clear Bboxes</button>
-            </div>
-            
-            <div class="form-group">
-                <button class="btn-nav" onclick="previousImage()">Previous</button>
-                <button class="btn-nav" onclick="nextImage()">Next</button>
-                <button class="btn-save" onclick="saveAnnotation()">Save</button>
-            </div>
-        </div>
-    </div>
-    
-    <div class="status" id="status">Ready</div>
-
-    <script>
-        let currentIndex = 0;
-        let currentImageData = null;
-        let selectedBboxes = [];
-        let bboxElements = [];
-
-        function loadImage(index) {
-            fetch(`/api/image/${index}`)
-                .then(response => response.json())
-                .then(data => {
-                    if (data.error) {
-                        alert(data.error);
-                        return;
-                    }
-                    
-                    currentImageData = data;
-                    currentIndex = index;
-                    
-                    // Update image
-                    const img = document.getElementById('image');
-                    img.src = data.image_data;
-                    
-                    // Wait for image to load before drawing bboxes
-                    img.onload = () => {
-                        drawBboxes();
-                    };
-                    
-                    // Update info
-                    document.getElementById('imageInfo').innerHTML = 
-                        `Image ${index + 1}/${data.total_images}<br>` +
-                        `ID: ${data.image_id}<br>` +
-                        `Original Size: ${data.width}x` +
-                        `${data.height}<br>` +
-                        `Display Size: ${data.display_width}x` +
-                        `${data.display_height}<br>` +
-                        `File: ${data.file_name}`;
-                    
-                    // Load existing annotation
-                    if (data.existing_annotation) {
-                        document.getElementById('question').value = 
-                            data.existing_annotation.question || '';
-                        document.getElementById('response').value = 
-                            data.existing_annotation.response || '';
-                        document.getElementById('rationale').value = 
-                            data.existing_annotation.rationale || '';
-                        selectedBboxes = data.existing_annotation.bbox || [];
-                        
-                        // Set view radio button
-                        const view = data.existing_annotation.view || '';
-                        if (view === 'exo') {
-                            document.getElementById('viewExo').checked = true;
-                        } else if (view === 'ego') {
-                            document.getElementById('viewEgo').checked = true;
-                        }
-                    } else {
-                        document.getElementById('question').value = '';
-                        document.getElementById('response').value = '';
-                        document.getElementById('rationale').value = '';
-                        selectedBboxes = [];
-                        // Clear view radio buttons
-                        document.getElementById('viewExo').checked = false;
-                        document.getElementById('viewEgo').checked = false;
-                    }
-                    
-                    updateBboxDisplay();
-                    updateStatus();
-                })
-                .catch(error => {
-                    console.error('Error:', error);
-                    alert('Failed to load image');
-                });
-        }
-
-        function drawBboxes() {
-            // Clear existing bboxes
-            bboxElements.forEach(el => el.remove());
-            bboxElements = [];
-            
-            if (!currentImageData) return;
-            
-            const container = document.getElementById('imageContainer');
-            const img = document.getElementById('image');
-            const scale = currentImageData.scale || 1.0;
-            
-            currentImageData.bboxes.forEach((bbox, index) => {
-                const [x, y, w, h] = bbox;
-                
-                // Scale bbox coordinates to match displayed image size
-                const scaledX = x * scale;
-                const scaledY = y * scale;
-                const scaledW = w * scale;
-                const scaledH = h * scale;
-                
-                const div = document.createElement('div');
-                div.className = 'bbox';
-                div.style.left = `${scaledX}px`;
-                div.style.top = `${scaledY}px`;
-                div.style.width = `${scaledW}px`;
-                div.style.height = `${scaledH}px`;
-                
-                // Add label
-                const label = document.createElement('div');
-                label.className = 'bbox-label';
-                label.textContent = `Box ${index + 1}: [${x},${y},${w},${h}]`;
-                div.appendChild(label);
-                
-                // Check if selected
-                if (selectedBboxes.some(sb => 
-                    JSON.stringify(sb) === JSON.stringify(bbox))) {
-                    div.classList.add('selected');
-                }
-                
-                // Add click event
-                div.addEventListener('click', (e) => {
-                    e.stopPropagation();
-                    selectBbox(bbox, div);
-                });
-                
-                container.appendChild(div);
-                bboxElements.push(div);
-            });
-        }
-
-        function selectBbox(bbox, element) {
-            const bboxStr = JSON.stringify(bbox);
-            const existingIndex = selectedBboxes.findIndex(sb => 
-                JSON.stringify(sb) === bboxStr);
-            
-            if (existingIndex === -1) {
-                selectedBboxes.push(bbox);
-                element.classList.add('selected');
-            } else {
-                selectedBboxes.splice(existingIndex, 1);
-                element.classList.remove('selected');
-            }
-            
-            updateBboxDisplay();
-            updateStatus();
-        }
-
-        function updateBboxDisplay() {
-            const display = selectedBboxes.map(bbox => 
-                `[${bbox.join(',')}]`).join(', ');
-            document.getElementById('selectedBboxes').value = display;
-        }
-
-        function clearBboxes() {
-            selectedBboxes = [];
-            updateBboxDisplay();
-            drawBboxes();
-        }
-
-        function previousImage() {
-            if (currentIndex > 0) {
-                loadImage(currentIndex - 1);
-            }
-        }
-
-        function nextImage() {
-            loadImage(currentIndex + 1);
-        }
-
-        function saveAnnotation() {
-            const question = document.getElementById('question').value.trim();
-            const response = document.getElementById('response').value.trim();
-            const rationale = document.getElementById('rationale').value.trim();
-            
-            // Get selected view
-            const viewRadios = document.getElementsByName('view');
-            let selectedView = '';
-            for (let radio of viewRadios) {
-                if (radio.checked) {
-                    selectedView = radio.value;
-                    break;
-                }
-            }
-            
-            // Client-side validation
-            const missingFields = [];
-            if (!question) missingFields.push('question');
-            if (!response) missingFields.push('response');
-            if (!selectedView) missingFields.push('view');
-            if (selectedBboxes.length === 0) missingFields.push('bbox');
-            
-            if (missingFields.length > 0) {
-                alert(`Please fill in the following required fields: ` +
-                      `${missingFields.join(', ')}`);
-                return;
-            }
-            
-            const data = {
-                image_id: currentImageData.image_id,
-                question: question,
-                response: response,
-                rationale: rationale,
-                view: selectedView,
-                selected_bboxes: selectedBboxes
-            };
-            
-            fetch('/api/save', {
-                method: 'POST',
-                headers: {'Content-Type': 'application/json'},
-                body: JSON.stringify(data)
-            })
-            .then(response => response.json())
-            .then(result => {
-                if (result.success) {
-                    alert('Annotation saved successfully!');
-                    nextImage();
-                } else {
-                    if (result.missing_fields) {
-                        alert(`Server validation failed: ${result.message}`);
-                    } else {
-                        alert('Failed to save: ' + result.error);
-                    }
-                }
-            })
-            .catch(error => {
-                console.error('Error:', error);
-                alert('Failed to save annotation');
-            });
-        }
-
-        function updateStatus() {
-            document.getElementById('status').textContent = 
-                `Current: ${currentIndex + 1} | Selected bboxes: ` +
-                `${selectedBboxes.length}`;
-        }
-
-        // Auto-save function
-        function autoSave() {
-            const question = document.getElementById('question').value.trim();
-            const response = document.getElementById('response').value.trim();
-            const rationale = document.getElementById('rationale').value.trim();
-            
-            // Get selected view
-            const viewRadios = document.getElementsByName('view');
-            let selectedView = '';
-            for (let radio of viewRadios) {
-                if (radio.checked) {
-                    selectedView = radio.value;
-                    break;
-                }
-            }
-            
-            // Only auto-save if all required fields are filled
-            if (currentImageData && question && response && 
-                selectedView && selectedBboxes.length > 0) {
-                const data = {
-                    image_id: currentImageData.image_id,
-                    question: question,
-                    response: response,
-                    rationale: rationale,
-                    view: selectedView,
-                    selected_bboxes: selectedBboxes
-                };
-                
-                fetch('/api/save', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify(data)
-                })
-                .then(response => response.json())
-                .then(result => {
-                    if (result.success) {
-                        console.log('Auto-saved');
-                    }
-                })
-                .catch(error => {
-                    console.error('Auto-save error:', error);
-                });
-            }
-        }
-
-        // Save on unload
-        window.addEventListener('beforeunload', (e) => {
-            autoSave();
-        });
-
-        // Auto-save every 30 seconds
-        setInterval(autoSave, 30000);
-
-        // Handle keyboard shortcuts
-        document.addEventListener('keydown', (e) => {
-            if (e.ctrlKey || e.metaKey) {
-                if (e.key === 's') {
-                    e.preventDefault();
-                    saveAnnotation();
-                } else if (e.key === 'ArrowLeft') {
-                    e.preventDefault();
-                    previousImage();
-                } else if (e.key === 'ArrowRight') {
-                    e.preventDefault();
-                    nextImage();
-                }
-            }
-        });
-
-        // Load first image on start
-        loadImage(0);
-    </script>
-</body>
-</html>'''
-    
-    with open(os.path.join(template_dir, 'index.html'), 'w', encoding='utf-8') as f:
-        f.write(html_content)
-
-
 def main():
     """Main function to start the web server."""
     
@@ -4283,6 +4864,10 @@ def main():
                         help='Path to custom categories JSON (list of {id,name})')
     parser.add_argument('--test_folder', default=None,
                         help='Test folder name (e.g., exo_test_image) to use instead of exo_images')
+    parser.add_argument('--debug', action='store_true',
+                        help='Run the Flask development server in debug mode (debugger, DEBUG logs)')
+    parser.add_argument('--threads', default=16, type=int,
+                        help='Worker threads when serving with waitress (non-debug mode)')
 
     
     args = parser.parse_args()
@@ -4322,15 +4907,15 @@ def main():
                                  args.output_json, args.categories_json, 
                                  test_folder=args.test_folder)
     
-    # Create template
-    create_template()
-    
-    
     print(f"Starting web server at http://{args.host}:{args.port}")
     print("Access the annotation tool in your web browser")
     print(f"Exo annotations will be saved to: {annotator.output_json_path_exo}")
     print(f"Ego annotations will be saved to: {annotator.output_json_path_ego}")
     
+    # 이전 실행에서 제출하지 못한 번역 Batch 작업 복구
+    if OPENAI_READY:
+        restore_batch_queue()
+    
     # 멀티스레드 모드로 실행 (타임아웃 방지)
     # Google Sheets 연동 상태 확인
     if GOOGLE_SHEETS_AVAILABLE:
@@ -4342,7 +4927,15 @@ def main():
     else:
         print(f"[WARN] Google Sheets 연동: 사용 불가")
     
-    app.run(host=args.host, port=args.port, debug=True, threaded=True, use_reloader=False)
+    if args.debug or not WAITRESS_AVAILABLE:
+        # 디버그 모드이거나 waitress가 없으면 Flask 개발 서버 (멀티스레드)
+        if not args.debug:
+            print("[INFO] waitress가 없어 Flask 개발 서버로 실행합니다 (pip install waitress 권장)")
+        app.run(host=args.host, port=args.port, debug=args.debug, threaded=True, use_reloader=False)
+    else:
+        # 운영 모드: 디버거/요청별 디버그 처리 없이 waitress 스레드 풀로 서비스
+        print(f"[INFO] waitress로 실행 (threads={args.threads})")
+        waitress.serve(app, host=args.host, port=args.port, threads=args.threads)
 
 
 if __name__ == "__main__":
@@ -6,8 +6,16 @@ import os
 import json
 import ast
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# 결과 JSON 저장 가속 (선택 사항, 없으면 표준 json 사용)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 import gspread
 from google.oauth2.service_account import Credentials
 
@@ -28,6 +36,9 @@ SOURCE_IMAGES_DIR = r'C:\Users\USER\Downloads\images\ego\ego_images'
 # 이주원 시트는 상단에서부터 52개만 사용
 LEEJUWON_LIMIT = 52
 
+# 이미지 복사 동시 실행 수 (파일 I/O 대기를 겹쳐서 처리)
+COPY_WORKERS = 16
+
 
 def init_client():
     if not os.path.exists(GOOGLE_SHEETS_CREDENTIALS_PATH):
@@ -38,26 +49,49 @@ def init_client():
     return gspread.authorize(creds)
 
 
-def read_sheet(client, sheet_name):
-    spreadsheet = client.open_by_key(GOOGLE_SHEETS_SPREADSHEET_ID)
-    try:
-        worksheet = spreadsheet.worksheet(sheet_name)
-    except gspread.exceptions.WorksheetNotFound:
-        print(f"[WARN] 시트 '{sheet_name}'을 찾을 수 없습니다.")
-        return []
+def _sheet_range(sheet_name):
+    """시트 이름 전체를 가리키는 A1 범위 (작은따옴표로 감싸고 내부 따옴표는 이스케이프)"""
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+
+# 표기만 다른 헤더를 같은 키로 맞춤 ('검수 상태' -> '검수')
+HEADER_ALIASES = {'검수_상태': '검수'}
+
 
-    all_values = worksheet.get_all_values()
+def _canonical_header(header):
+    """헤더를 소문자 + 밑줄 표기로 통일 ('Image ID'/'image_id' -> 'image_id', 한글은 그대로)"""
+    key = header.strip().lower().replace(' ', '_')
+    return HEADER_ALIASES.get(key, key)
+
+
+def _rows_from_values(sheet_name, all_values, filter_col=None, filter_val=None):
+    """
+    시트 값을 행 딕셔너리 리스트로 변환 (키는 _canonical_header로 통일, 같은 키가 여러 열이면 앞 열 사용)
+
+    filter_col을 주면 그 열 값(strip)이 filter_val인 행만 딕셔너리로 만듦 (열이 없으면 빈 리스트)
+    """
     if len(all_values) < 2:
         print(f"[WARN] 시트 '{sheet_name}'에 데이터가 없습니다.")
         return []
 
     headers = all_values[0]
-    header_indices = {header: idx for idx, header in enumerate(headers)}
+    header_indices = {}
+    for idx, header in enumerate(headers):
+        header_indices.setdefault(_canonical_header(header), idx)
+
+    filter_idx = None
+    if filter_col is not None:
+        filter_idx = header_indices.get(_canonical_header(filter_col))
+        if filter_idx is None:
+            return []
 
     result = []
     for row in all_values[1:]:
         if len(row) == 0:
             continue
+        # 걸러질 행은 딕셔너리를 만들기 전에 원본 리스트에서 바로 건너뜀
+        if filter_idx is not None and (filter_idx >= len(row) or row[filter_idx].strip() != filter_val):
+            continue
         row_data = {}
         for header, idx in header_indices.items():
             row_data[header] = row[idx] if idx < len(row) else ''
@@ -65,10 +99,45 @@ def read_sheet(client, sheet_name):
     return result
 
 
+def read_sheets(client, sheet_names, filter_col=None, filter_val=None):
+    """
+    여러 시트를 values.batchGet 한 번으로 읽어 {시트 이름: 행 딕셔너리 리스트} 반환
+    (시트마다 스프레드시트 열기/시트 조회/전체 읽기를 따로 호출하지 않음, 필터는 _rows_from_values 참고)
+    """
+    spreadsheet = client.open_by_key(GOOGLE_SHEETS_SPREADSHEET_ID)
+    try:
+        response = spreadsheet.values_batch_get([_sheet_range(name) for name in sheet_names])
+    except gspread.exceptions.APIError as e:
+        # 없는 시트가 하나라도 있으면 요청 전체가 400으로 실패하므로, 있는 시트만 다시 요청
+        if getattr(e.response, 'status_code', None) != 400:
+            raise
+        existing = {worksheet.title for worksheet in spreadsheet.worksheets()}
+        for name in sheet_names:
+            if name not in existing:
+                print(f"[WARN] 시트 '{name}'을 찾을 수 없습니다.")
+        sheet_names = [name for name in sheet_names if name in existing]
+        if not sheet_names:
+            return {}
+        response = spreadsheet.values_batch_get([_sheet_range(name) for name in sheet_names])
+
+    # valueRanges는 요청한 범위 순서대로 반환됨
+    return {
+        name: _rows_from_values(name, value_range.get('values', []), filter_col, filter_val)
+        for name, value_range in zip(sheet_names, response.get('valueRanges', []))
+    }
+
+
 def parse_bbox(bbox_str):
     bbox_str = bbox_str.strip()
     if not bbox_str:
         return []
+    # 대부분 "[x, y, w, h]" 형태라 json.loads로 바로 파싱 (실패하면 튜플/작은따옴표 등을 위해 literal_eval)
+    try:
+        parsed = json.loads(bbox_str)
+        if isinstance(parsed, list):
+            return parsed
+    except ValueError:
+        pass
     try:
         parsed = ast.literal_eval(bbox_str)
         if isinstance(parsed, list):
@@ -79,27 +148,41 @@ def parse_bbox(bbox_str):
 
 
 def row_to_json(row):
-    image_id_raw = row.get('Image ID', '') or row.get('image_id', '')
+    """_rows_from_values 행(정규화된 헤더 키)을 내보내기 JSON 항목으로 변환"""
+    image_id_raw = row.get('image_id', '')
     try:
         image_id = int(image_id_raw)
     except ValueError:
         image_id = image_id_raw
     return {
         "image_id": image_id,
-        "image_path": row.get('image_path', '') or row.get('Image Path', ''),
-        "image_resolution": row.get('image_resolution', '') or row.get('Image Resolution', ''),
-        "question": row.get('question', '') or row.get('Question', ''),
-        "response": row.get('response', '') or row.get('Response', ''),
-        "rationale": row.get('rationale', '') or row.get('Rationale', ''),
-        "view": row.get('view', '') or row.get('View', ''),
-        "bbox": parse_bbox(row.get('bbox', '') or row.get('Bbox', ''))
+        "image_path": row.get('image_path', ''),
+        "image_resolution": row.get('image_resolution', ''),
+        "question": row.get('question', ''),
+        "response": row.get('response', ''),
+        "rationale": row.get('rationale', ''),
+        "view": row.get('view', ''),
+        "bbox": parse_bbox(row.get('bbox', ''))
     }
 
 
+def _list_source_images():
+    """SOURCE_IMAGES_DIR의 {파일명: DirEntry} (파일마다 os.path.exists를 호출하지 않도록 한 번만 읽음)"""
+    try:
+        with os.scandir(SOURCE_IMAGES_DIR) as entries:
+            return {entry.name: entry for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        print(f"[WARN] 원본 이미지 폴더를 찾을 수 없습니다: {SOURCE_IMAGES_DIR}")
+        return {}
+
+
 def copy_images(image_items, dest_folder):
     os.makedirs(dest_folder, exist_ok=True)
+    source_images = _list_source_images()
     copied = 0
     missing = []
+    jobs = {}  # {대상 경로: 원본 경로} (같은 이미지가 여러 번 나와도 한 번만 복사)
+    already_copied = 0
     for item in image_items:
         image_path = item.get('image_path', '')
         filename = os.path.basename(image_path)
@@ -107,12 +190,27 @@ def copy_images(image_items, dest_folder):
             continue
         src = os.path.join(SOURCE_IMAGES_DIR, filename)
         dest = os.path.join(dest_folder, filename)
-        if os.path.exists(src):
-            shutil.copy2(src, dest)
+        entry = source_images.get(filename)
+        if entry is not None:
             copied += 1
+            # 다시 실행한 경우: 대상 파일이 이미 있고 크기가 같으면 복사 생략
+            try:
+                if os.stat(dest).st_size == entry.stat().st_size:
+                    already_copied += 1
+                    continue
+            except FileNotFoundError:
+                pass
+            jobs[dest] = entry.path
         else:
             missing.append(filename)
             print(f"[WARN] 이미지 파일을 찾을 수 없습니다: {src}")
+
+    # 픽셀 데이터만 필요하므로 메타데이터(시간/권한) 복사 없이 내용만 복사, 여러 파일을 동시에 복사
+    with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor:
+        # list()로 모든 결과를 받아 복사 중 발생한 예외를 그대로 올림
+        list(executor.map(shutil.copyfile, jobs.values(), jobs.keys()))
+    if already_copied:
+        print(f"[INFO] 이미 복사된 이미지 {already_copied}개는 건너뜀")
     return copied, missing
 
 
@@ -121,19 +219,12 @@ def main():
     all_items = []
     counts = {}
 
+    # '검수'가 '통과'인 행만 읽음
+    sheet_rows = read_sheets(client, TARGET_SHEETS, filter_col='검수', filter_val='통과')
     for sheet in TARGET_SHEETS:
-        rows = read_sheet(client, sheet)
-        passed_rows = []
-        for row in rows:
-            review_status = row.get('검수', '') or row.get('검수 상태', '')
-            review_status = review_status.strip()
-            if review_status != '통과':
-                continue
-
-            passed_rows.append(row)
-
-            if sheet == '이주원' and len(passed_rows) >= LEEJUWON_LIMIT:
-                break
+        passed_rows = sheet_rows.get(sheet, [])
+        if sheet == '이주원':
+            passed_rows = passed_rows[:LEEJUWON_LIMIT]
 
         print(f"[INFO] {sheet}: 통과 {len(passed_rows)}개")
         counts[sheet] = len(passed_rows)
@@ -143,8 +234,16 @@ def main():
     print(f"[INFO] 총 개수: {total_count}개 (세부: {counts})")
 
     output_json = f"{OUTPUT_JSON_NAME}_{total_count}.json"
-    with open(output_json, 'w', encoding='utf-8') as f:
-        json.dump(all_items, f, ensure_ascii=False, indent=2)
+    # 임시 파일에 쓴 뒤 교체 (중간에 중단되어도 기존 결과 파일이 잘린 채로 남지 않음)
+    tmp_path = output_json + '.tmp'
+    if ORJSON_AVAILABLE:
+        # orjson은 bytes(UTF-8)를 바로 반환하므로 바이너리 모드로 기록
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(all_items, option=orjson.OPT_INDENT_2))
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(all_items, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, output_json)
     print(f"[INFO] JSON 저장 완료: {output_json}")
 
     dest_folder = os.path.join(os.getcwd(), f"{OUTPUT_JSON_NAME}_images_{total_count}")